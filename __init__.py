@@ -5,20 +5,41 @@ import aiohttp
 import folder_paths
 import hashlib
 import json
+import email.utils
 import logging
 import io
 import mimetypes
 import shutil
 import asyncio
+import bisect
+import contextlib
 import time
-from collections import Counter
+import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import glob
 import subprocess
 import sys
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from urllib.parse import urlparse
 import random
+import pickle
+import base64
+import re
+import sqlite3
+import threading
+
+try:
+    from PIL import Image, ImageOps, features as pil_features
+except ImportError:
+    Image = None  # Without Pillow the thumb route just serves the full preview
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # The stdlib decoder is used for bulk loads instead
 
 
 # Set up logging
@@ -49,14 +70,139 @@ os.makedirs(LORA_DATA_DIR, exist_ok=True)
 
 # Rate limiting settings
 MAX_REQUESTS_PER_MINUTE = 120 # Increase at your own risk, don't get banned!
-RATE_LIMITER = None
+# Every CivitAI API call draws from the shared 'api' budget, so the total stays at MAX_REQUESTS_PER_MINUTE
+# and either class can use all of it while the other is idle. The class budgets can be lowered to cap one.
+# The image CDN gets its own budget.
+RATE_LIMIT_BUDGETS = {
+    'api': MAX_REQUESTS_PER_MINUTE,
+    'version': MAX_REQUESTS_PER_MINUTE,  # by-hash and by-id version lookups, by-hash calls are batched
+    'model': MAX_REQUESTS_PER_MINUTE,  # model lookups for tags and descriptions
+    'image': 300  # preview downloads from the image CDN
+}
+RATE_LIMIT_PARENTS = {'version': 'api', 'model': 'api'}
+RATE_LIMIT_DEFAULT_BACKOFF = 30 # Seconds to pause when a 429 has no Retry-After
+RATE_LIMIT_MAX_RETRIES = 2 # Retries after a 429
+RATE_LIMITERS = {}
+PROCESS_CONCURRENCY = 4 # LoRAs processed at once, CivitAI calls are still capped by the rate limiters
+
+# CivitAI API settings, the base can be pointed at a local mock server for offline benchmarking
+CIVITAI_API_BASE = os.environ.get("LORA_SIDEBAR_CIVITAI_API", "https://civitai.com/api/v1").rstrip("/")
+VERSION_BATCH_SIZE = 100 # Hashes per batched by-hash lookup
+VERSION_BATCH_WINDOW = 0.5 # Seconds to wait for a batch to fill before sending it
+VERSION_PREFETCH_AHEAD = 2 * VERSION_BATCH_SIZE # Lookups resolved ahead of the workers
+
+# Thumbnail settings
+THUMB_SIZES = (128, 256, 512, 800) # Size buckets in device pixels, a request is served from the next bucket up.
+# 800 covers the largest tile (400 CSS px on the size slider) on a 2x display
+THUMB_QUALITY = 80
+THUMB_WORKERS = 2 # Threads resizing at once, so thumbnails never compete much with the server
+THUMB_FORMAT = 'WEBP' if Image is not None and pil_features.check('webp') else 'JPEG'
+
+# Preview download settings
+PREVIEW_DOWNLOAD_CONCURRENCY = 6 # Previews streamed at once, still capped by the image rate limiter
+PREVIEW_DOWNLOAD_WIDTH = THUMB_SIZES[-1] # Width asked from the image CDN, so the largest thumbnail bucket is never upscaled
+PREVIEW_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+PREVIEW_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=15, sock_read=60) # Large videos can take a while
+
+# Outbound HTTP settings, every request shares one pooled session
+HTTP_CONNECTION_LIMIT = 32
+HTTP_CONNECTION_LIMIT_PER_HOST = 8
+HTTP_DNS_CACHE_TTL = 300 # seconds
+HTTP_KEEPALIVE_TIMEOUT = 30 # seconds
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=120, connect=15, sock_read=60)
+HTTP_RETRIES = 3 # Retries for connection errors and 5xx responses
+HTTP_RETRY_BASE_DELAY = 1.0 # seconds, doubled per attempt with jitter
+CIRCUIT_BREAKER_THRESHOLD = 5 # Consecutive CivitAI failures before we stop calling it
+CIRCUIT_BREAKER_COOLDOWN = 60 # seconds before CivitAI is tried again
+
+# CivitAI response cache settings
+HTTP_CACHE_DIR = os.path.join(LORA_DATA_DIR, ".http_cache")
+HTTP_CACHE_TTL = 7 * 24 * 3600 # Seconds before a cached response is revalidated
+HTTP_CACHE_NEGATIVE_TTL = 24 * 3600 # 404s (custom LoRAs) are rechecked sooner
+HTTP_CACHE_REFRESH_AGE = 3600 # Max age accepted when the user explicitly refreshes a LoRA
+HTTP_CACHE_MEMO_SIZE = 1024 # Responses kept in memory
+
+# Hashing settings
+HASH_WORKERS = max(2, min(8, os.cpu_count() or 2)) # Threads hashing at once, hashlib releases the GIL so these run on separate cores
+HASH_PER_DEVICE = 2 # Parallel hashes per storage device, more than this just makes spinning disks seek
+HASH_CHUNK_SIZE = 1024 * 1024 # 1MB reads
+HASH_INDEX_FILE = os.path.join(LORA_DATA_DIR, "hash_index.json")
+HASH_INDEX_SAVE_INTERVAL = 30 # seconds between index saves while hashing
+WRITE_HASH_SIDECARS = False # Also write <lora>.sha256 next to each model so other tools can reuse our hashes
+
+# processed_loras.json journal settings
+PROCESSED_LORAS_FILE = os.path.join(LORA_DATA_DIR, "processed_loras.json")
+PROCESSED_LORAS_JOURNAL = os.path.join(LORA_DATA_DIR, "processed_loras.journal")
+JOURNAL_COMPACT_EVERY = 250 # Journal entries between compactions during processing
+
+# Catalog settings, all LoRA info lives in one SQLite database instead of loraData/<id>/info.json files
+CATALOG_FILE = os.path.join(LORA_DATA_DIR, "catalog.db")
+EXPORT_INFO_JSON = False # Also write loraData/<id>/info.json on every change, for other tools that read them
+BULK_LOAD_WORKERS = max(2, min(8, os.cpu_count() or 2)) # Threads reading and decoding LoRA info during rebuilds
+BULK_LOAD_CHUNK_SIZE = 256 # LoRAs per decode job
+
+# Background processing job settings
+PROCESS_JOB_FILE = os.path.join(LORA_DATA_DIR, "process_job.json")
+PROCESS_JOB_LOG = os.path.join(LORA_DATA_DIR, "process_job.log")
+PROCESS_JOB_HISTORY = 10 # Finished jobs kept in memory for status lookups
+
+# Startup snapshot of the built cache, so a restart only re-reads LoRAs that changed
+CACHE_SNAPSHOT_FILE = os.path.join(LORA_DATA_DIR, "cache_snapshot.pkl")
+CACHE_SNAPSHOT_VERSION = 1 # Bump when the cached entry or sort key layout changes
+CACHE_SNAPSHOT_DELAY = 5 # Seconds of quiet after a cache change before the snapshot is rewritten
+CACHE_SNAPSHOT_MAX_STALE = 0.25 # Above this fraction of changed LoRAs a full rebuild is faster
+
+# Startup cache warmup, runs in the background on the server loop
+BUILD_PROGRESS_INTERVAL = 0.5 # Seconds between console progress updates
+WARMUP_YIELD_EVERY = 500 # LoRAs handled between yields to the event loop while warming up
+
+# Encoded /lora_sidebar/data pages kept in memory
+PAGE_CACHE_SIZE = 64
+
+# Cursor paging of /lora_sidebar/data is pinned to a copy of the ordered cache
+VIEW_SNAPSHOT_LIMIT = 4 # Copies kept, a client whose copy was dropped has to start over
+
+# Compare the live category counters to a full recount on every read, for debugging
+CHECK_CATEGORY_COUNTS = DEBUG
+
+# Per sidebar connection delivery tracking
+CLIENT_SESSION_TTL = 3600 # Seconds a session survives without requests
+CLIENT_SESSION_LIMIT = 32 # Sessions kept at most, the least recently used go first
+
+# Facet value counts kept per (facet, filter bitmap, limit), dropped whenever the index changes
+FACET_COUNT_CACHE_SIZE = 128
+
+# Server-side search, field weights for ranking. A prefix match scores half of an exact token match
+SEARCH_FIELD_WEIGHTS = {
+    'name': 8,
+    'filename': 6,
+    'trained_words': 4,
+    'tags': 4,
+    'baseModel': 3,
+    'subdir': 2,
+    'type': 2,
+    'versionName': 2,
+    'model_desc': 1,
+    'version_desc': 1
+}
+SEARCH_PREFIX_FACTOR = 0.5
+SEARCH_MAX_LIMIT = 500
+# Fuzzy search mode, trigram similarity over the words of these fields
+SEARCH_FUZZY_FIELDS = ('name', 'filename', 'trained_words')
+SEARCH_FUZZY_THRESHOLD = 0.4 # Minimum trigram similarity (Dice) for a word to count as a match
+SEARCH_FUZZY_CANDIDATES = 100 # Most similar words considered per query term
+CACHE_WARMUP = {
+    'status': 'pending',  # pending, building, ready or failed
+    'completed': 0,
+    'total': 0,
+    'started': None,
+    'finished': None,
+    'error': None
+}
 
 # Test limit constant
 TEST_LIMIT = 0
 
-# Add a global variable to track if processing is in progress
-is_processing = False
-
 PROCESSED_LORAS_VERSION = 2  # used to force reprocessing LoRAs when data files change
 NEW_ITEM_HOURS = 72
 FALLBACK_TIMESTAMP = datetime(2100, 1, 1).timestamp()
@@ -65,7 +211,8 @@ LORA_FILE_INFO = {}
 # Cache data for faster performance with new sorting
 LORA_CACHE = {
     'ordered_loras': None,
-    'sent_loras': set()  # Keep track of which LoRAs we've sent to FE
+    'sort_keys': [],  # Order key of each entry in ordered_loras, for bisect inserts/removes
+    'key_by_id': {}
 }
 
 # Caching store variables
@@ -118,63 +265,657 @@ class LoraDataStore:
         cls._instance.data = None
 
 class RateLimiter:
-    def __init__(self, max_calls, period):
+    """
+    Token bucket limiter (GCRA form, so acquire is O(1) with no timestamp list).
+    Each caller reserves its slot when it arrives, so waiters are woken in FIFO order
+    and nobody sleeps while holding a lock. A 429 pauses the bucket and pushes every
+    pending slot back by the Retry-After delay. A limiter with a parent also takes a slot
+    from the parent, so several endpoint classes can share one overall budget.
+    """
+    def __init__(self, name, max_calls, period, parent=None):
+        self.name = name
+        self.parent = parent
         self.max_calls = max_calls
         self.period = period  # in seconds
-        self.calls = []
-        self.lock = asyncio.Lock()
+        self.interval = period / max_calls
+        self.burst = (max_calls - 1) * self.interval  # a full bucket allows max_calls at once
+        self.tat = time.monotonic()  # theoretical arrival time of the next call
+        self.blocked_until = 0.0
+        self.shift = 0.0  # total time pending slots have been pushed back by 429s
+        self.waiting = 0
+        self.calls = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
 
     async def acquire(self):
-        async with self.lock:
-            current = time.time()
-            # Remove timestamps older than the period
-            while self.calls and self.calls[0] <= current - self.period:
-                self.calls.pop(0)
-            if len(self.calls) >= self.max_calls:
-                wait_time = self.period - (current - self.calls[0])
-                logger.debug(f"Rate limit reached. Sleeping for {wait_time:.2f} seconds.")
-                await asyncio.sleep(wait_time)
-            self.calls.append(time.time())
-
-# Initialize the RateLimiter
-RATE_LIMITER = RateLimiter(MAX_REQUESTS_PER_MINUTE, 60)  # 120 calls per 60 seconds
+        now = time.monotonic()
+        tat = max(self.tat, now)
+        wait = max(tat - self.burst - now, self.blocked_until - now, 0.0)
+        self.tat = tat + self.interval
+        self.calls += 1
+
+        if wait > 0:
+            logger.debug(f"Rate limit reached for {self.name}. Sleeping for {wait:.2f} seconds.")
+            self.waiting += 1
+            shift = self.shift
+            try:
+                while wait > 0:
+                    await asyncio.sleep(wait)
+                    # A 429 while we slept pushes our slot back
+                    wait = max(self.shift - shift, self.blocked_until - time.monotonic(), 0.0)
+                    shift = self.shift
+            finally:
+                self.waiting -= 1
+            waited = time.monotonic() - now
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        if self.parent is not None:
+            await self.parent.acquire()
+
+    def penalize(self, retry_after):
+        """Pause the bucket for retry_after seconds after the API answered 429."""
+        if self.parent is not None:
+            # The API limits us as a whole, so the other classes back off too
+            self.parent.penalize(retry_after)
+        self.throttled += 1
+        now = time.monotonic()
+        resume = now + retry_after
+        if resume <= self.blocked_until:
+            return
+        delay = resume - max(now, self.blocked_until)
+        self.blocked_until = resume
+        self.shift += delay
+        self.tat = max(self.tat, now) + delay
+        logger.warning(f"CivitAI rate limited {self.name} requests, backing off for {retry_after:.0f} seconds")
+
+    def stats(self):
+        now = time.monotonic()
+        used = max(0.0, self.tat - now) / self.interval
+        return {
+            "tokens": round(max(0.0, self.max_calls - used), 2),
+            "capacity": self.max_calls,
+            "period": self.period,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "throttled": self.throttled,
+            "blocked_for": round(max(0.0, self.blocked_until - now), 2),
+            "avg_wait": round(self.total_wait / self.calls, 3) if self.calls else 0.0,
+            "max_wait": round(self.max_wait, 3)
+        }
+
+def get_rate_limiter(endpoint):
+    """Limiter for an endpoint class ('version', 'model' or 'image')."""
+    if endpoint not in RATE_LIMITERS:
+        parent = RATE_LIMIT_PARENTS.get(endpoint)
+        RATE_LIMITERS[endpoint] = RateLimiter(
+            endpoint,
+            RATE_LIMIT_BUDGETS.get(endpoint, MAX_REQUESTS_PER_MINUTE),
+            60,
+            parent=get_rate_limiter(parent) if parent else None
+        )
+    return RATE_LIMITERS[endpoint]
+
+def get_retry_after(response):
+    """Seconds to wait from a Retry-After header, in either delta-seconds or HTTP date form."""
+    value = response.headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(value)
+                return max(0.0, retry_at.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return RATE_LIMIT_DEFAULT_BACKOFF
+
+def hash_file_sync(filepath, chunk_size=HASH_CHUNK_SIZE):
+    """Blocking sha256 of a file using one reusable read buffer. Runs on the hash pool."""
+    sha256_hash = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(filepath, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            sha256_hash.update(view[:size])
+    return sha256_hash.hexdigest()
+
+class HashService:
+    """
+    Hashes files on a thread pool so multi-GB safetensors never block the event loop.
+    Limits parallel hashes per storage device and shares one job between duplicate requests.
+    """
+    def __init__(self, max_workers, per_device):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lora_sidebar_hash")
+        self.per_device = per_device
+        self.device_limits = {}
+        self.pending = {}
+
+    def _device_limit(self, filepath):
+        try:
+            device = os.stat(filepath).st_dev
+        except OSError:
+            device = None
+        if device not in self.device_limits:
+            self.device_limits[device] = asyncio.Semaphore(self.per_device)
+        return self.device_limits[device]
+
+    async def _hash(self, filepath):
+        async with self._device_limit(filepath):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, hash_file_sync, filepath)
+
+    def submit(self, filepath):
+        """Start hashing filepath and return an awaitable future for its sha256."""
+        key = os.path.realpath(filepath)
+        if key in self.pending:
+            return self.pending[key]
+        future = asyncio.ensure_future(self._hash(key))
+        self.pending[key] = future
+        future.add_done_callback(lambda _: self.pending.pop(key, None))
+        return future
+
+    async def hash_many(self, filepaths):
+        """Hash several files at once, returns {filepath: sha256 or None on error}."""
+        futures = [self.submit(filepath) for filepath in filepaths]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        hashes = {}
+        for filepath, result in zip(filepaths, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error hashing {filepath}: {str(result)}")
+                hashes[filepath] = None
+            else:
+                hashes[filepath] = result
+        return hashes
+
+HASH_SERVICE = HashService(HASH_WORKERS, HASH_PER_DEVICE)
+
+class HashIndex:
+    """
+    Persistent sha256 index keyed by real path and validated by size, mtime_ns and inode.
+    Any change to the file invalidates its entry so stale hashes are never returned.
+    """
+    VERSION = 1
+
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self.entries = None
+        self.dirty = False
+        self.last_save = time.time()
+
+    def _load(self):
+        if self.entries is not None:
+            return
+        self.entries = {}
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == self.VERSION:
+                    self.entries = data.get("entries", {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Error reading hash index, starting fresh: {str(e)}")
+
+    @staticmethod
+    def _signature(stats):
+        return {"size": stats.st_size, "mtime_ns": stats.st_mtime_ns, "inode": stats.st_ino}
+
+    def lookup(self, filepath):
+        """Return the indexed hash for filepath, or None if missing or the file changed."""
+        self._load()
+        key = os.path.realpath(filepath)
+        entry = self.entries.get(key)
+        if not entry:
+            return None
+        try:
+            signature = self._signature(os.stat(key))
+        except OSError:
+            self.invalidate(key)
+            return None
+        if any(entry.get(field) != value for field, value in signature.items()):
+            logger.info(f"File changed since it was hashed, invalidating: {key}")
+            self.invalidate(key)
+            return None
+        return entry.get("sha256")
+
+    def store(self, filepath, sha256):
+        self._load()
+        key = os.path.realpath(filepath)
+        try:
+            entry = self._signature(os.stat(key))
+        except OSError as e:
+            logger.warning(f"Could not stat {key} for hash index: {str(e)}")
+            return
+        entry["sha256"] = sha256
+        self.entries[key] = entry
+        self.dirty = True
+
+        if WRITE_HASH_SIDECARS:
+            hash_path = os.path.splitext(filepath)[0] + ".sha256"
+            try:
+                with open(hash_path, "wt") as f:
+                    f.write(sha256)
+            except OSError as e:
+                logger.warning(f"Error writing hash file {hash_path}: {str(e)}")
+
+        if time.time() - self.last_save > HASH_INDEX_SAVE_INTERVAL:
+            self.save()
+
+    def invalidate(self, filepath):
+        self._load()
+        if self.entries.pop(os.path.realpath(filepath), None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """Atomically write the index if anything changed."""
+        if not self.dirty or self.entries is None:
+            return
+        temp_file = f"{self.index_file}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "entries": self.entries}, f, ensure_ascii=False)
+            os.replace(temp_file, self.index_file)
+            self.dirty = False
+            self.last_save = time.time()
+        except OSError as e:
+            logger.error(f"Error saving hash index: {str(e)}")
+
+    async def verify(self):
+        """
+        Re-hash every indexed file. Drops entries for files that no longer exist
+        and replaces hashes that no longer match the file contents.
+        """
+        self._load()
+        missing = [path for path in self.entries if not os.path.isfile(path)]
+        for path in missing:
+            self.invalidate(path)
+
+        expected = {path: entry.get("sha256") for path, entry in self.entries.items()}
+        actual = await HASH_SERVICE.hash_many(list(expected))
+        mismatched = []
+        for path, sha256 in actual.items():
+            if sha256 is None:
+                self.invalidate(path)
+            elif sha256 != expected[path]:
+                mismatched.append(path)
+                self.store(path, sha256)
+            else:
+                # Content is unchanged, refresh the signature in case only metadata moved
+                self.store(path, sha256)
+        self.save()
+
+        return {
+            "checked": len(actual),
+            "mismatched": mismatched,
+            "missing": missing
+        }
+
+HASH_INDEX = HashIndex(HASH_INDEX_FILE)
+
+def json_loads(data):
+    """json.loads, using orjson when it's installed. Both raise a ValueError subclass on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def decode_info_chunk(rows):
+    """Decode (id, JSON) pairs in order, a corrupt entry comes back as None instead of failing the chunk."""
+    decoded = []
+    for lora_id, data in rows:
+        try:
+            info = json_loads(data)
+            if not isinstance(info, dict):
+                raise ValueError("info is not an object")
+        except ValueError as e:
+            logger.error(f"Skipping corrupt info for {lora_id}: {str(e)}")
+            info = None
+        decoded.append((lora_id, info))
+    return decoded
+
+def read_info_chunk(folders):
+    """Read and decode loraData/<folder>/info.json files, as (folder, info, ctime, mtime) in order."""
+    results = []
+    for folder in folders:
+        info_path = os.path.join(LORA_DATA_DIR, folder, "info.json")
+        try:
+            stats = os.stat(info_path)
+            with open(info_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.error(f"Skipping unreadable info.json for {folder}: {str(e)}")
+            continue
+        ((_, info),) = decode_info_chunk([(folder, data)])
+        if info is not None:
+            results.append((folder, info, stats.st_ctime, stats.st_mtime))
+    return results
+
+class BulkInfoLoader:
+    """
+    Loads every LoRA's info for cache rebuilds and the catalog migration, off the event loop.
+    info.json files are read in chunks on a thread pool, which overlaps the file I/O. JSON
+    decoding (json or orjson) holds the GIL, so catalog rows are decoded on a single worker:
+    more threads only add contention, and a process pool spends more pickling the dicts back
+    than the decode costs. Results keep their input order and corrupt entries are skipped.
+    """
+    def __init__(self, max_workers, chunk_size):
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lora_sidebar_load")
+        self.chunk_size = chunk_size
+
+    def _chunks(self, items):
+        return [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+
+    def _report(self, what, count, timings, threads):
+        phases = ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in timings.items())
+        logger.info(f"Loaded {count} {what} ({phases}, {threads} threads, "
+                    f"{'orjson' if orjson is not None else 'json'})")
+
+    async def load_catalog(self):
+        """[(id, info)] for every catalog row, sorted by id."""
+        loop = asyncio.get_running_loop()
+        timings = {}
+
+        start = time.perf_counter()
+        rows = await loop.run_in_executor(self.executor, CATALOG.raw_items)
+        timings['fetch'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = await loop.run_in_executor(self.executor, decode_info_chunk, rows)
+        timings['decode'] = time.perf_counter() - start
+
+        items = [(lora_id, info) for lora_id, info in decoded if info is not None]
+        self._report("catalog entries", len(items), timings, 1)
+        return items
+
+    def read_info_files(self, folders):
+        """Blocking, [(folder, info, ctime, mtime)] for the folders that have a readable info.json."""
+        start = time.perf_counter()
+        results = []
+        # Own pool, the migration can be triggered from a job already running on self.executor
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="lora_sidebar_migrate") as pool:
+            for chunk in pool.map(read_info_chunk, self._chunks(sorted(folders))):
+                results.extend(chunk)
+        self._report("info.json files", len(results), {'read': time.perf_counter() - start}, self.max_workers)
+        return results
+
+BULK_LOADER = BulkInfoLoader(BULK_LOAD_WORKERS, BULK_LOAD_CHUNK_SIZE)
+
+class LoraCatalog:
+    """
+    SQLite catalog (WAL mode) of every LoRA's info. The fields routes look up, filter or
+    sort on have their own indexed columns, the full info dict is kept as a JSON blob.
+    Existing info.json folders are imported automatically the first time it opens.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS loras (
+            id TEXT PRIMARY KEY,
+            version_id INTEGER,
+            model_id INTEGER,
+            base_model TEXT,
+            created_date TEXT,
+            subdir TEXT,
+            favorite INTEGER NOT NULL DEFAULT 0,
+            name TEXT,
+            path TEXT,
+            info_version INTEGER,
+            ctime REAL NOT NULL,
+            mtime REAL NOT NULL,
+            data BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS loras_version_id ON loras(version_id);
+        CREATE INDEX IF NOT EXISTS loras_model_id ON loras(model_id);
+        CREATE INDEX IF NOT EXISTS loras_base_model ON loras(base_model);
+        CREATE INDEX IF NOT EXISTS loras_created_date ON loras(created_date);
+        CREATE INDEX IF NOT EXISTS loras_subdir ON loras(subdir);
+        CREATE INDEX IF NOT EXISTS loras_favorite ON loras(favorite);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    # Cache-only fields that must not end up in the stored info
+    TRANSIENT_FIELDS = ('id', 'favorite', 'is_new', 'created_time', 'category')
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.RLock()
+        self._conn = None
+        # Bumped on every change to the stored LoRAs, so callers can tell cheaply whether anything moved
+        self.generation = 0
+        # In-memory copy of sort_metadata(), kept in step with our own writes
+        self._sort_metadata = None
+        self._data_version = None
+
+    @property
+    def conn(self):
+        with self.lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(self.SCHEMA)
+                self._conn = conn
+                if conn.execute("SELECT value FROM meta WHERE key = 'migrated'").fetchone() is None:
+                    self.migrate()
+            return self._conn
+
+    @contextlib.contextmanager
+    def transaction(self):
+        with self.lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                # Writes in the transaction already touched the sort metadata, reload it next time
+                self._sort_metadata = None
+                self.generation += 1
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _decode(row):
+        return json.loads(row['data'])
+
+    @staticmethod
+    def _as_int(value):
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _write(self, conn, lora_id, info, ctime=None, mtime=None):
+        info = {key: value for key, value in info.items() if key not in self.TRANSIENT_FIELDS}
+        now = time.time()
+        conn.execute("""
+            INSERT INTO loras (id, version_id, model_id, base_model, created_date, subdir, name, path, info_version, ctime, mtime, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                version_id = excluded.version_id, model_id = excluded.model_id, base_model = excluded.base_model,
+                created_date = excluded.created_date, subdir = excluded.subdir, name = excluded.name,
+                path = excluded.path, info_version = excluded.info_version, mtime = excluded.mtime, data = excluded.data
+        """, (
+            lora_id,
+            self._as_int(info.get('versionId')),
+            self._as_int(info.get('modelId')),
+            info.get('baseModel'),
+            info.get('createdDate'),
+            info.get('subdir'),
+            info.get('name'),
+            info.get('path'),
+            self._as_int(info.get('info_version')),
+            ctime or now,
+            mtime or now,
+            json.dumps(info, ensure_ascii=False).encode('utf-8')
+        ))
+        self._changed(lora_id, {
+            'ctime': ctime or now,
+            'mtime': mtime or now,
+            'name': info.get('name') or lora_id
+        })
+        return info
+
+    def _changed(self, lora_id, sort_entry=None):
+        """Record a write (with its sort metadata) or a delete (without)."""
+        self.generation += 1
+        if self._sort_metadata is None:
+            return
+        if sort_entry is None:
+            self._sort_metadata.pop(lora_id, None)
+            return
+        existing = self._sort_metadata.get(lora_id)
+        if existing is not None:
+            sort_entry['ctime'] = existing['ctime']  # Upserts keep the original ctime
+        self._sort_metadata[lora_id] = sort_entry
+
+    def get(self, lora_id):
+        """The stored info dict for a LoRA, or None."""
+        with self.lock:
+            row = self.conn.execute("SELECT data FROM loras WHERE id = ?", (lora_id,)).fetchone()
+        return self._decode(row) if row else None
+
+    def info_version(self, lora_id):
+        with self.lock:
+            row = self.conn.execute("SELECT info_version FROM loras WHERE id = ?", (lora_id,)).fetchone()
+        return row['info_version'] if row else None
+
+    def put(self, lora_id, info):
+        """Insert or replace a LoRA's info. Keeps the original ctime so date sorting is stable."""
+        with self.lock:
+            stored = self._write(self.conn, lora_id, info)
+        if EXPORT_INFO_JSON:
+            self.export_info_json(lora_id, stored)
+
+    def update(self, lora_id, **fields):
+        """Change some fields of a stored LoRA. Returns the new info, or None if the LoRA isn't stored."""
+        with self.transaction() as conn:
+            row = conn.execute("SELECT data FROM loras WHERE id = ?", (lora_id,)).fetchone()
+            if row is None:
+                return None
+            info = self._decode(row)
+            info.update(fields)
+            stored = self._write(conn, lora_id, info)
+        if EXPORT_INFO_JSON:
+            self.export_info_json(lora_id, stored)
+        return stored
+
+    def delete(self, lora_id):
+        with self.lock:
+            self.conn.execute("DELETE FROM loras WHERE id = ?", (lora_id,))
+            self._changed(lora_id)
+
+    def items(self):
+        """(id, info) for every LoRA."""
+        with self.lock:
+            rows = self.conn.execute("SELECT id, data FROM loras").fetchall()
+        return [(row['id'], self._decode(row)) for row in rows]
+
+    def raw_items(self):
+        """(id, undecoded JSON) for every LoRA sorted by id, for BULK_LOADER to decode off the lock."""
+        with self.lock:
+            rows = self.conn.execute("SELECT id, data FROM loras ORDER BY id").fetchall()
+        return [(row['id'], row['data']) for row in rows]
+
+    def find_by_version(self, version_id):
+        """(id, info) of the LoRA with this CivitAI version ID, or (None, None)."""
+        with self.lock:
+            row = self.conn.execute("SELECT id, data FROM loras WHERE version_id = ? LIMIT 1",
+                                    (self._as_int(version_id),)).fetchone()
+        return (row['id'], self._decode(row)) if row else (None, None)
+
+    def sort_metadata(self):
+        """
+        {id: {ctime, mtime, name}} from memory. It is only re-queried when SQLite's data_version
+        says another connection (another tool, a second ComfyUI) committed since the last load.
+        Treat the returned dict as read-only, it is shared.
+        """
+        with self.lock:
+            data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._sort_metadata is None or data_version != self._data_version:
+                if self._sort_metadata is not None:
+                    self.generation += 1  # Changed outside this process
+                rows = self.conn.execute("SELECT id, ctime, mtime, name FROM loras").fetchall()
+                self._sort_metadata = {row['id']: {
+                    'ctime': row['ctime'],
+                    'mtime': row['mtime'],
+                    'name': row['name'] or row['id']
+                } for row in rows}
+                self._data_version = data_version
+            return self._sort_metadata
+
+    def manifest(self):
+        """{id: mtime} for every LoRA, used to find what changed since the cache snapshot."""
+        with self.lock:
+            rows = self.conn.execute("SELECT id, mtime FROM loras").fetchall()
+        return {row['id']: row['mtime'] for row in rows}
+
+    def set_favorite(self, lora_id, favorite):
+        with self.lock:
+            self.conn.execute("UPDATE loras SET favorite = ? WHERE id = ?", (1 if favorite else 0, lora_id))
+            self.generation += 1
+
+    def sync_favorites(self, favorites):
+        """Mirror the processed_loras.json favorites list into the favorite column."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE loras SET favorite = 0 WHERE favorite = 1")
+            conn.executemany("UPDATE loras SET favorite = 1 WHERE id = ?", [(lora_id,) for lora_id in favorites])
+            self.generation += 1
+
+    def export_info_json(self, lora_id, info=None):
+        """Write loraData/<id>/info.json from the catalog."""
+        info = info if info is not None else self.get(lora_id)
+        lora_folder = os.path.join(LORA_DATA_DIR, lora_id)
+        if info is None or not os.path.isdir(lora_folder):
+            return False
+        write_json_atomic(os.path.join(lora_folder, "info.json"), info)
+        return True
+
+    def migrate(self):
+        """Import every loraData/<id>/info.json, keeping their file times for date sorting."""
+        folders = [folder for folder in os.listdir(LORA_DATA_DIR)
+                   if os.path.isfile(os.path.join(LORA_DATA_DIR, folder, "info.json"))]
+        # Read everything first, so the write transaction only holds the database for the inserts
+        infos = BULK_LOADER.read_info_files(folders)
+        imported = len(infos)
+        with self.transaction() as conn:
+            for folder, info, ctime, mtime in infos:
+                self._write(conn, folder, info, ctime=ctime, mtime=mtime)
+
+            favorites = []
+            if os.path.exists(PROCESSED_LORAS_FILE):
+                try:
+                    with open(PROCESSED_LORAS_FILE, "r", encoding="utf-8") as f:
+                        favorites = json.load(f).get('favorites', [])
+                except (OSError, json.JSONDecodeError, AttributeError):
+                    logger.error("Error reading favorites from processed_loras.json during catalog migration")
+            conn.executemany("UPDATE loras SET favorite = 1 WHERE id = ?", [(lora_id,) for lora_id in favorites])
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated', ?)", (str(time.time()),))
+        logger.info(f"Catalog created, imported {imported} info.json files")
+
+CATALOG = LoraCatalog(CATALOG_FILE)
 
 async def get_lora_sort_metadata():
     """
-    Gets both dates and names for all LoRA info.json files.
+    Gets both dates and names for all LoRAs in the catalog, served from the catalog's memory copy.
     Returns a dictionary mapping lora_id to {
         'ctime': timestamp, 
         'mtime': timestamp,
         'name': display_name
     }
     """
-    sort_metadata = {}
-    for folder in os.listdir(LORA_DATA_DIR):
-        info_path = os.path.join(LORA_DATA_DIR, folder, "info.json")
-        try:
-            if os.path.isfile(info_path):
-                stats = os.stat(info_path)
-                # Get the base info
-                sort_metadata[folder] = {
-                    'ctime': stats.st_ctime,
-                    'mtime': stats.st_mtime,
-                    'name': folder  # Default fallback
-                }
-                
-                # Read the name from info.json
-                try:
-                    with open(info_path, 'r', encoding='utf-8') as f:
-                        json_data = json.load(f)
-                        sort_metadata[folder]['name'] = json_data.get('name', folder)
-                except json.JSONDecodeError:
-                    logger.error(f"Error reading info.json for {folder}")
-                    
-        except (OSError, IOError) as e:
-            logger.error(f"Error getting info for {folder}: {str(e)}")
-            continue
-    return sort_metadata
+    return CATALOG.sort_metadata()
 
 async def hash_file(filepath):
+    # Check our own index first, it is validated against the file so it can't be stale
+    indexed_hash = HASH_INDEX.lookup(filepath)
+    if indexed_hash:
+        return indexed_hash
+
     # Check for local saved hash
     stripped_file_path = os.path.splitext(filepath)[0]
     hash_path = stripped_file_path + ".sha256"
@@ -187,12 +928,10 @@ async def hash_file(filepath):
         except Exception as e:
             logger.warning(f"Error reading hash file {hash_path}: {str(e)}")
 
-    # Nothing local, so let's hash it ourselves
-    sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    # Nothing local, so hash it on the pool instead of the event loop
+    file_hash = await HASH_SERVICE.submit(filepath)
+    HASH_INDEX.store(filepath, file_hash)
+    return file_hash
 
 async def check_local_info(file_path):
     # Try CivitAI first
@@ -312,55 +1051,591 @@ async def check_local_info(file_path):
     logger.info(f"No valid metadata found for: {file_path}")
     return False
 
-async def fetch_model_info(session, model_id, skip_rate_limit=False):
-    url = f"https://civitai.com/api/v1/models/{model_id}"
-    if not skip_rate_limit:
-        await RATE_LIMITER.acquire()
-    async with session.get(url) as response:
-        if response.status == 200:
-            return await response.json()
-    return None
+class CircuitOpenError(Exception):
+    """Raised instead of calling CivitAI while the circuit breaker is open."""
+    pass
+
+class HttpClient:
+    """
+    One pooled aiohttp session shared by all outbound traffic, created lazily on the
+    server loop. Exposes get()/post() like a ClientSession, retrying connection errors
+    and 5xx responses with jittered exponential backoff. Repeated CivitAI failures open
+    a circuit breaker so a CivitAI outage fails fast instead of stalling every worker.
+    """
+    def __init__(self):
+        self._session = None
+        self.failures = 0
+        self.open_until = 0.0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # The session is shared, it is only closed on server shutdown
+        return False
+
+    def get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @staticmethod
+    def _is_civitai(url):
+        host = (urlparse(url).hostname or "").lower()
+        return url.startswith(CIVITAI_API_BASE) or host == "civitai.com" or host.endswith(".civitai.com")
+
+    def _record_failure(self):
+        self.failures += 1
+        if self.failures >= CIRCUIT_BREAKER_THRESHOLD:
+            self.open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+            logger.warning(f"CivitAI failed {self.failures} times in a row, pausing requests for {CIRCUIT_BREAKER_COOLDOWN} seconds")
+
+    @staticmethod
+    def _backoff(attempt):
+        delay = HTTP_RETRY_BASE_DELAY * (2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @contextlib.asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        guarded = self._is_civitai(url)
+        if guarded and time.monotonic() < self.open_until:
+            raise CircuitOpenError(f"CivitAI circuit breaker open, skipping {url}")
+
+        session = self.get_session()
+        response = None
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                response = await session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if guarded:
+                    self._record_failure()
+                if attempt == HTTP_RETRIES or (guarded and time.monotonic() < self.open_until):
+                    raise
+                logger.info(f"Request to {url} failed ({type(e).__name__}), retrying")
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            if response.status >= 500:
+                if guarded:
+                    self._record_failure()
+                if attempt < HTTP_RETRIES and not (guarded and time.monotonic() < self.open_until):
+                    response.release()
+                    logger.info(f"Request to {url} returned {response.status}, retrying")
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+            elif guarded:
+                self.failures = 0
+            break
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+HTTP_CLIENT = HttpClient()
+
+async def close_http_client(app):
+    await HTTP_CLIENT.close()
+
+PromptServer.instance.app.on_shutdown.append(close_http_client)
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache for CivitAI JSON responses.
+    Entries are keyed by the sha256 of the URL, memoized in memory and revalidated
+    with ETag / Last-Modified once they go stale. Callers passing offline=True only get the cache.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.memo = OrderedDict()
+        self.inflight = {}
+        self.stats = Counter()
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _remember(self, key, entry):
+        self.memo[key] = entry
+        self.memo.move_to_end(key)
+        while len(self.memo) > HTTP_CACHE_MEMO_SIZE:
+            self.memo.popitem(last=False)
+
+    def _read(self, key):
+        if key in self.memo:
+            self.memo.move_to_end(key)
+            return self.memo[key]
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {str(e)}")
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def _write(self, key, entry):
+        self._remember(key, entry)
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Error writing cache entry for {entry.get('url')}: {str(e)}")
+
+    @staticmethod
+    def _is_fresh(entry, max_age=None):
+        ttl = HTTP_CACHE_TTL if entry.get("status") == 200 else HTTP_CACHE_NEGATIVE_TTL
+        if max_age is not None:
+            ttl = min(ttl, max_age)
+        return time.time() - entry.get("fetched_at", 0) < ttl
+
+    def peek(self, url, offline=False):
+        """Return the cached entry for url if it can be used without a request, otherwise None."""
+        entry = self._read(self._key(url))
+        if entry and (offline or self._is_fresh(entry)):
+            return entry
+        return None
 
-async def fetch_version_info(session, file_hash):
-    url = f"https://civitai.com/api/v1/model-versions/by-hash/{file_hash}"
-    await RATE_LIMITER.acquire()  # Enforce rate limit
+    def store(self, url, status, body, etag=None, last_modified=None):
+        self._write(self._key(url), {
+            "url": url,
+            "status": status,
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time()
+        })
+
+    async def get_json(self, session, url, endpoint, rate_limit=True, max_age=None, offline=False):
+        """
+        Returns (status, data) for a GET of url, from the cache when possible.
+        status is None when offline and nothing is cached.
+        """
+        key = self._key(url)
+        entry = self._read(key)
+        if entry and (offline or self._is_fresh(entry, max_age)):
+            self.stats["hits"] += 1
+            return entry["status"], entry["body"]
+        if offline:
+            self.stats["offline_misses"] += 1
+            return None, None
+
+        # Share one request between workers asking for the same URL
+        if key not in self.inflight:
+            future = asyncio.ensure_future(self._fetch(session, url, key, entry, endpoint, rate_limit))
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        return await asyncio.shield(self.inflight[key])
+
+    async def _fetch(self, session, url, key, entry, endpoint, rate_limit):
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        limiter = get_rate_limiter(endpoint)
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            if rate_limit or attempt > 0:
+                await limiter.acquire()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 429:
+                    limiter.penalize(get_retry_after(response))
+                    continue
+
+                if response.status == 304 and entry:
+                    self.stats["revalidated"] += 1
+                    entry["fetched_at"] = time.time()
+                    self._write(key, entry)
+                    return entry["status"], entry["body"]
+
+                self.stats["misses"] += 1
+                if response.status in (200, 404):
+                    body = await response.json() if response.status == 200 else None
+                    self.store(
+                        url, response.status, body,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified")
+                    )
+                    return response.status, body
+                return response.status, None
+        return 429, None
+
+RESPONSE_CACHE = ResponseCache(HTTP_CACHE_DIR)
+
+# Returned by version lookups that are offline with nothing cached, unlike None it doesn't mean CivitAI doesn't know the file
+OFFLINE_MISS = object()
+
+def version_hash_url(file_hash):
+    return f"{CIVITAI_API_BASE}/model-versions/by-hash/{file_hash.lower()}"
+
+async def fetch_model_info(session, model_id, skip_rate_limit=False, max_age=None, offline=False):
+    url = f"{CIVITAI_API_BASE}/models/{model_id}"
+    status, data = await RESPONSE_CACHE.get_json(session, url, 'model', rate_limit=not skip_rate_limit,
+                                                 max_age=max_age, offline=offline)
+    return data if status == 200 else None
+
+async def fetch_version_info(session, file_hash, offline=False):
+    url = version_hash_url(file_hash)
     
     try:
-        async with session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 404:
-                # Expected response for custom LoRAs and removed content
-                logger.info(f"Hash lookup failed for {file_hash}, likely a custom LoRA or removed content. Falling back to local data.")
-            else:
-                # Unexpected API response
-                logger.warning(f"Unexpected response from CivitAI API: {response.status}")
+        status, data = await RESPONSE_CACHE.get_json(session, url, 'version', offline=offline)  # Enforces rate limit on cache misses
+        if status == 200:
+            return data
+        elif status == 404:
+            # Expected response for custom LoRAs and removed content
+            logger.info(f"Hash lookup failed for {file_hash}, likely a custom LoRA or removed content. Falling back to local data.")
+        elif status is None:
+            logger.info(f"No cached lookup for {file_hash} while offline")
+            return OFFLINE_MISS
+        else:
+            # Unexpected API response
+            logger.warning(f"Unexpected response from CivitAI API: {status}")
     except Exception as e:
         logger.warning(f"Error during hash lookup: {str(e)}")
     
     return None
 
-async def fetch_version_info_by_id(session, version_id, skip_rate_limit=False):
-    url = f"https://civitai.com/api/v1/model-versions/{version_id}"
-    if not skip_rate_limit:
-        await RATE_LIMITER.acquire()
-    async with session.get(url) as response:
-        if response.status == 200:
-            return await response.json()
-    return None
+async def fetch_version_info_batch(session, file_hashes):
+    """
+    Look up many hashes with one call. Returns {lowercase hash: version info} for the
+    hashes CivitAI knows, or None if the batch call itself failed.
+    """
+    url = f"{CIVITAI_API_BASE}/model-versions/by-hash"
+    wanted = {file_hash.lower() for file_hash in file_hashes}
+    limiter = get_rate_limiter('version')
+    versions = None
 
-async def download_image(session, image_url, save_path):
-    # await RATE_LIMITER.acquire()  # here in case but would rather not rate limit this
-    async with session.get(image_url) as response:
-        if response.status == 200:
-            content_type = response.headers.get('Content-Type', '')
-            ext = mimetypes.guess_extension(content_type) or '.jpg'
-            final_save_path = f"{os.path.splitext(save_path)[0]}{ext}"
-            with open(final_save_path, 'wb') as f:
-                f.write(await response.read())
-            return os.path.basename(final_save_path)
+    try:
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await limiter.acquire()
+            async with session.post(url, json=list(wanted)) as response:
+                if response.status == 429:
+                    limiter.penalize(get_retry_after(response))
+                    continue
+                if response.status != 200:
+                    logger.warning(f"Unexpected response from CivitAI batch lookup: {response.status}")
+                    return None
+                versions = await response.json()
+                break
+        else:
+            logger.warning("CivitAI batch lookup still rate limited after retries")
+            return None
+    except Exception as e:
+        logger.warning(f"Error during batch hash lookup: {str(e)}")
+        return None
+
+    # Fan results back out by the hashes listed on each version's files
+    results = {}
+    for version in versions if isinstance(versions, list) else []:
+        for file_info in version.get('files', []):
+            file_hash = (file_info.get('hashes') or {}).get('SHA256')
+            if file_hash and file_hash.lower() in wanted:
+                results[file_hash.lower()] = version
+    return results
+
+class VersionLookupBatcher:
+    """
+    Collects by-hash lookups from concurrent workers and resolves them with batched
+    CivitAI calls, falling back to single lookups when a batch call fails.
+    """
+    def __init__(self, session, batch_size=VERSION_BATCH_SIZE, window=VERSION_BATCH_WINDOW, offline=False):
+        self.session = session
+        self.offline = offline
+        self.batch_size = batch_size
+        self.window = window
+        self.queued = {}
+        self.flush_handle = None
+        self.tasks = set()
+
+    def lookup(self, file_hash):
+        """
+        Queue a hash and return a future resolving to its version info, None if CivitAI doesn't
+        know it, or OFFLINE_MISS when offline with no cached answer.
+        """
+        key = file_hash.lower()
+        if key in self.queued:
+            return self.queued[key]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        # Answer from the response cache when we can, offline runs never reach the API
+        cached = RESPONSE_CACHE.peek(version_hash_url(key), offline=self.offline)
+        if cached is not None:
+            future.set_result(cached["body"] if cached["status"] == 200 else None)
+            return future
+        if self.offline:
+            future.set_result(OFFLINE_MISS)
+            return future
+
+        self.queued[key] = future
+        if len(self.queued) >= self.batch_size:
+            self._flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.queued:
+            return
+        batch, self.queued = self.queued, {}
+        task = asyncio.ensure_future(self._resolve(batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _resolve(self, batch):
+        try:
+            results = await fetch_version_info_batch(self.session, list(batch))
+            if results is None:
+                logger.info(f"Batch lookup failed, falling back to {len(batch)} single lookups")
+                singles = await asyncio.gather(
+                    *(fetch_version_info(self.session, file_hash) for file_hash in batch)
+                )
+                results = dict(zip(batch, singles))
+            else:
+                logger.info(f"Batch lookup resolved {len(results)} of {len(batch)} hashes")
+                # Cache each hash like a single lookup so later runs skip the API
+                for file_hash in batch:
+                    if file_hash in results:
+                        RESPONSE_CACHE.store(version_hash_url(file_hash), 200, results[file_hash])
+                    else:
+                        RESPONSE_CACHE.store(version_hash_url(file_hash), 404, None)
+        except Exception as e:
+            logger.error(f"Error resolving hash batch: {str(e)}")
+            results = {}
+
+        for file_hash, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(file_hash))
+
+    async def close(self):
+        """Send anything still queued and wait for in-flight batches."""
+        self._flush()
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+async def fetch_version_info_by_id(session, version_id, skip_rate_limit=False, max_age=None):
+    url = f"{CIVITAI_API_BASE}/model-versions/{version_id}"
+    status, data = await RESPONSE_CACHE.get_json(session, url, 'version', rate_limit=not skip_rate_limit, max_age=max_age)
+    return data if status == 200 else None
+
+def cdn_width_url(image_url, width=PREVIEW_DOWNLOAD_WIDTH):
+    """
+    Ask the CivitAI image CDN for a width limited variant, it takes a /width=N/ path segment
+    (replacing /original=true/ or an existing width) right before the file name.
+    Other hosts are returned unchanged.
+    """
+    parsed = urlparse(image_url)
+    if not width or (parsed.hostname or "").lower() != "image.civitai.com":
+        return image_url
+    parts = parsed.path.split('/')
+    if len(parts) < 3:
+        return image_url
+    segment = f"width={width}"
+    transform = re.compile(r'^(width=\d+|original=true)$')
+    if transform.match(parts[-1]):
+        parts[-1] = segment
+    elif transform.match(parts[-2]):
+        parts[-2] = segment
+    else:
+        parts.insert(-1, segment)
+    return parsed._replace(path='/'.join(parts)).geturl()
+
+class PreviewRateLimitedError(Exception):
+    """The image CDN kept answering 429 after the retries, the preview can be fetched again later."""
+
+async def download_image(session, image_url, save_path, width=PREVIEW_DOWNLOAD_WIDTH, offline=False):
+    """
+    Stream an image or video to save_path plus the extension from its content type.
+    Chunks go to a .part file that is renamed into place, so a preview is never half written.
+    A 429 backs off the image limiter by its Retry-After and is retried RATE_LIMIT_MAX_RETRIES
+    times, then PreviewRateLimitedError is raised.
+    """
+    if offline:
+        logger.info(f"Offline, keeping existing preview instead of downloading {image_url}")
+        return None
+    limiter = get_rate_limiter('image')  # CDN budget is separate from the API budget
+
+    # Fall back to the original if the CDN can't produce the resized variant
+    urls = [cdn_width_url(image_url, width)]
+    if urls[0] != image_url:
+        urls.append(image_url)
+
+    for url in urls:
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await limiter.acquire()
+            async with session.get(url, timeout=PREVIEW_DOWNLOAD_TIMEOUT) as response:
+                if response.status == 429:
+                    # Pauses every queued download, the retry waits its turn behind them
+                    limiter.penalize(get_retry_after(response))
+                    continue
+                if response.status != 200:
+                    logger.info(f"Preview download returned {response.status} for {url}")
+                    break
+
+                ext = mimetypes.guess_extension(response.content_type) or '.jpg'
+                final_save_path = f"{os.path.splitext(save_path)[0]}{ext}"
+                temp_path = f"{final_save_path}.part"
+                try:
+                    with open(temp_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(PREVIEW_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                    os.replace(temp_path, final_save_path)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.remove(temp_path)
+                    raise
+                return os.path.basename(final_save_path)
+        else:
+            raise PreviewRateLimitedError(f"Image CDN still rate limiting after {RATE_LIMIT_MAX_RETRIES} retries: {url}")
     return None
 
+class PreviewDownloader:
+    """
+    Download stage for previews. Processing hands a preview off and moves on to the next
+    LoRA while up to PREVIEW_DOWNLOAD_CONCURRENCY downloads stream in the background.
+    """
+    def __init__(self, session, concurrency=PREVIEW_DOWNLOAD_CONCURRENCY, offline=False):
+        self.session = session
+        self.offline = offline
+        self.slots = asyncio.Semaphore(concurrency)
+        self.pending = set()
+
+    def submit(self, image_url, save_path):
+        """
+        Queue a download, the returned task resolves to the saved file name or None. A failed
+        download is logged and re-raised from the task, so the LoRA isn't recorded as done.
+        """
+        task = asyncio.ensure_future(self._download(image_url, save_path))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+        return task
+
+    async def _download(self, image_url, save_path):
+        async with self.slots:
+            try:
+                preview_filename = await download_image(self.session, image_url, save_path, offline=self.offline)
+                if preview_filename:
+                    logger.info(f"Saved preview image as {preview_filename}")
+                return preview_filename
+            except Exception as e:
+                logger.error(f"Error downloading preview {image_url}: {str(e)}")
+                raise
+
+    async def close(self):
+        """Wait for every queued download to finish."""
+        while self.pending:
+            await asyncio.gather(*list(self.pending), return_exceptions=True)
+
+def make_thumbnail_sync(source_path, thumb_path, size):
+    """
+    Blocking resize on the thumbnail pool. The short side is scaled down to size so the
+    tile can crop it, then written atomically and stamped with the source mtime.
+    """
+    source_mtime = os.stat(source_path).st_mtime
+    with Image.open(source_path) as image:
+        image.draft('RGB', (size, size))  # Lets JPEG decode straight at a reduced scale
+        image = ImageOps.exif_transpose(image)
+        width, height = image.size
+        scale = size / min(width, height)
+        if scale < 1:
+            image = image.resize((max(1, round(width * scale)), max(1, round(height * scale))), Image.LANCZOS)
+        if THUMB_FORMAT == 'JPEG' or image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGB' if THUMB_FORMAT == 'JPEG' else 'RGBA')
+
+        temp_path = f"{thumb_path}.tmp"
+        image.save(temp_path, THUMB_FORMAT, quality=THUMB_QUALITY)
+    os.replace(temp_path, thumb_path)
+    os.utime(thumb_path, (source_mtime, source_mtime))
+    return thumb_path
+
+class ThumbnailService:
+    """
+    Builds size-bucketed thumbnails of previews lazily on first request, on a small thread
+    pool. A thumbnail is valid while its mtime matches the preview it was made from.
+    """
+    def __init__(self, max_workers):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lora_sidebar_thumb")
+        self.pending = {}
+
+    @staticmethod
+    def bucket(size):
+        for bucket in THUMB_SIZES:
+            if size <= bucket:
+                return bucket
+        return THUMB_SIZES[-1]
+
+    @staticmethod
+    def thumb_path(lora_name, bucket):
+        # The preview_ prefix keeps thumbnails out of find_custom_images
+        ext = '.webp' if THUMB_FORMAT == 'WEBP' else '.jpg'
+        return os.path.join(LORA_DATA_DIR, lora_name, f"preview_thumb_{bucket}{ext}")
+
+    @staticmethod
+    def is_current(thumb_path, source_path):
+        try:
+            return os.stat(thumb_path).st_mtime == os.stat(source_path).st_mtime
+        except OSError:
+            return False
+
+    def submit(self, source_path, thumb_path, bucket):
+        """Start building a thumbnail, duplicate requests share the same future."""
+        if thumb_path in self.pending:
+            return self.pending[thumb_path]
+        loop = asyncio.get_running_loop()
+        future = asyncio.ensure_future(loop.run_in_executor(self.executor, make_thumbnail_sync, source_path, thumb_path, bucket))
+        self.pending[thumb_path] = future
+        future.add_done_callback(lambda _: self.pending.pop(thumb_path, None))
+        return future
+
+    async def get(self, lora_name, source_path, size):
+        """Path of a current thumbnail for source_path, or None if it can't be made (videos, no Pillow)."""
+        if Image is None or os.path.splitext(source_path)[1].lower() in ('.mp4', '.webm'):
+            return None
+        bucket = self.bucket(size)
+        thumb_path = self.thumb_path(lora_name, bucket)
+        if self.is_current(thumb_path, source_path):
+            return thumb_path
+        if not os.path.isdir(os.path.dirname(thumb_path)):
+            return None
+        try:
+            return await self.submit(source_path, thumb_path, bucket)
+        except Exception as e:
+            logger.error(f"Error building thumbnail for {lora_name}: {str(e)}")
+            return None
+
+THUMBNAILS = ThumbnailService(THUMB_WORKERS)
+
 def get_tag_categories(settings):
     """Get appropriate tag categories based on settings."""
     PREDEFINED_TAGS = [
@@ -372,6 +1647,19 @@ def get_tag_categories(settings):
         return PREDEFINED_TAGS
     return [tag.strip().lower() for tag in settings.get('customTags', [])]
 
+_tag_ranks = {}
+
+def get_tag_ranks(settings):
+    """{tag: priority} for the tag categories, memoized per category list."""
+    tags = tuple(get_tag_categories(settings))
+    if tags not in _tag_ranks:
+        _tag_ranks.clear()
+        ranks = {}
+        for rank, tag in enumerate(tags):
+            ranks.setdefault(tag, rank)
+        _tag_ranks[tags] = ranks
+    return _tag_ranks[tags]
+
 def format_date(date_input):
     """
     Convert any reasonable date format to YYYY-MM-DD.
@@ -591,83 +1879,58 @@ def find_custom_images(base_path, base_filename):
     logger.info(f"Found total of {len(custom_images)} custom images")
     return custom_images
 
-def manage_category_counts(action="calculate", **kwargs):
+def category_count_bucket(lora):
+    """The group a LoRA is counted under, favorites and new items only count in their own groups."""
+    if lora.get('favorite'):
+        return 'Favorites'
+    if lora.get('is_new'):
+        return 'New'
+    return lora.get('category')
+
+def count_categories(loras):
+    """Full recount into the same buckets adjust_category_counts maintains."""
+    category_counts = {'Favorites': {'total': 0}, 'New': {'total': 0}}
+    for lora in loras:
+        bucket = category_count_bucket(lora)
+        if bucket not in category_counts:
+            category_counts[bucket] = {'total': 0}
+        category_counts[bucket]['total'] += 1
+    return category_counts
+
+def recount_category_counts():
+    """Replace the live counters with a full recount, only needed after a full sort."""
+    LORA_CACHE['category_info'] = count_categories(LORA_CACHE.get('ordered_loras') or [])
+    return LORA_CACHE['category_info']
+
+def get_category_counts():
     """
-    Unified category count management.
-    
-    Args:
-        action: Type of operation ("calculate" or "update")
-        kwargs: Arguments based on action type:
-            For "calculate":
-                loras: Full list of loras
-                paginated_loras: Current page of loras (optional)
-                settings: User settings
-            For "update":
-                old_category: Previous category
-                new_category: New category
-                current_counts: Existing counts dict (optional)
+    The live category counters, kept up to date by adjust_category_counts on every change.
+    With CHECK_CATEGORY_COUNTS they are compared to a full recount first.
     """
     if not LORA_CACHE.get('ordered_loras'):
         return None
-
-    if action == "calculate":
-        loras = kwargs.get('loras', [])
-        paginated_loras = kwargs.get('paginated_loras', [])
-        settings = kwargs.get('settings', {})
-        
-        category_counts = {}
-        
-        # Count real categories
-        for lora in loras:
-            if not lora['favorite'] and not lora['is_new']: # don't count favs or new items
-                category = lora['category']
-                if category not in category_counts:
-                    category_counts[category] = {'total': 0, 'loaded': 0}
-                category_counts[category]['total'] += 1
-
-        # Add status counts
-        status_counts = {
-            'Favorites': {'total': len([l for l in loras if l['favorite']])},
-            'New': {'total': len([l for l in loras if l['is_new'] and not l['favorite']])}
-        }
-        category_counts.update(status_counts)
-
-        # Count loaded if provided
-        if paginated_loras:
-            for lora in paginated_loras:
-                if lora['favorite']:
-                    category_counts['Favorites']['loaded'] = category_counts['Favorites'].get('loaded', 0) + 1
-                elif lora['is_new'] and settings.get('catNew'):
-                    category_counts['New']['loaded'] = category_counts['New'].get('loaded', 0) + 1
-                else:
-                    category = lora['category']
-                    category_counts[category]['loaded'] = category_counts[category].get('loaded', 0) + 1
-
-    elif action == "update":
-        old_category = kwargs.get('old_category')
-        new_category = kwargs.get('new_category')
-        category_counts = dict(kwargs.get('current_counts', LORA_CACHE.get('category_info', {})))
-
-        # Ensure categories exist
-        for cat in [old_category, new_category]:
-            if cat and cat not in category_counts:
-                category_counts[cat] = {'total': 0, 'loaded': 0}
-            
-        # Update counts
-        if old_category:
-            category_counts[old_category]['total'] -= 1
-            if 'loaded' in category_counts[old_category]:
-                category_counts[old_category]['loaded'] -= 1
-            
-        if new_category:
-            category_counts[new_category]['total'] += 1
-            if 'loaded' in category_counts[new_category]:
-                category_counts[new_category]['loaded'] += 1
-
-    # Update cache and return
-    LORA_CACHE['category_info'] = category_counts
-    logger.debug(f"cat counts from category counter: {category_counts}")
-    return category_counts
+    if LORA_CACHE.get('category_info') is None:
+        return recount_category_counts()
+    if CHECK_CATEGORY_COUNTS:
+        check_category_counts()
+    return LORA_CACHE['category_info']
+
+def check_category_counts():
+    """Debug consistency check, logs and repairs counters that drifted from a full recount."""
+    live = {bucket: counts['total'] for bucket, counts in LORA_CACHE['category_info'].items() if counts['total']}
+    recount = {bucket: counts['total'] for bucket, counts in count_categories(LORA_CACHE['ordered_loras']).items() if counts['total']}
+    if live != recount:
+        drift = {bucket: (live.get(bucket, 0), recount.get(bucket, 0))
+                 for bucket in live.keys() | recount.keys() if live.get(bucket, 0) != recount.get(bucket, 0)}
+        logger.error(f"Category counters drifted (live, recount): {drift}")
+        recount_category_counts()
+        return False
+    return True
+
+def has_current_info(base_filename):
+    """True if the LoRA is already in the catalog at the current PROCESSED_LORAS_VERSION."""
+    info_version = CATALOG.info_version(base_filename)
+    return bool(info_version) and info_version >= PROCESSED_LORAS_VERSION
 
 def validate_processed_loras(processed_loras):
     """Validate and clean processed_loras data, keeping newest paths"""
@@ -703,6 +1966,292 @@ def validate_processed_loras(processed_loras):
     processed_loras["loras"] = list(entries_by_filename.values())
     return processed_loras
 
+def write_json_atomic(path, data, indent=4):
+    """Write JSON to a temp file and rename it over path so readers never see a partial file."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+class ProcessedLorasJournal:
+    """
+    Append-only journal of per-LoRA results written while processing, so each LoRA
+    costs one small append instead of rewriting processed_loras.json. The journal is
+    compacted into the main file periodically and at the end of a run, and a journal
+    left behind by a killed run is compacted before anything reads the main file.
+    """
+    def __init__(self, data_file, journal_file):
+        self.data_file = data_file
+        self.journal_file = journal_file
+        self.pending = 0
+
+    def append(self, op, filename, path=None):
+        """Record op ('path' to add/update a LoRA, 'remove' to drop it) for filename."""
+        entry = {"op": op, "filename": filename}
+        if path is not None:
+            entry["path"] = path
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+        self.pending += 1
+
+    def maybe_compact(self):
+        if self.pending >= JOURNAL_COMPACT_EVERY:
+            self.compact()
+
+    @staticmethod
+    def apply(processed_loras, entry):
+        filename = entry.get("filename")
+        if entry.get("op") == "path":
+            existing = next((item for item in processed_loras["loras"]
+                             if item.get("filename") == filename), None)
+            if existing:
+                existing["path"] = entry.get("path")
+            else:
+                processed_loras["loras"].append({"filename": filename, "path": entry.get("path")})
+        elif entry.get("op") == "remove":
+            processed_loras["loras"] = [item for item in processed_loras["loras"]
+                                        if item.get("filename") != filename]
+            if filename in processed_loras.get("favorites", []):
+                processed_loras["favorites"].remove(filename)
+
+    def read_entries(self):
+        entries = []
+        if not os.path.exists(self.journal_file):
+            return entries
+        with open(self.journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A killed run can leave a torn last line, everything before it is good
+                    logger.warning("Skipping truncated processed_loras journal entry")
+        return entries
+
+    def compact(self):
+        """Fold the journal into processed_loras.json and truncate it. Safe to rerun after a crash."""
+        entries = self.read_entries()
+        if not entries:
+            self.pending = 0
+            return
+
+        processed_loras = None
+        if os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, "r", encoding="utf-8") as f:
+                    processed_loras = json.load(f)
+            except json.JSONDecodeError:
+                logger.error("Error reading processed_loras.json while compacting journal")
+        processed_loras = validate_processed_loras(processed_loras)
+
+        for entry in entries:
+            self.apply(processed_loras, entry)
+        processed_loras = validate_processed_loras(processed_loras)
+
+        write_json_atomic(self.data_file, processed_loras)
+        os.remove(self.journal_file)
+        self.pending = 0
+        logger.info(f"Compacted {len(entries)} journal entries into processed_loras.json")
+
+PROCESSED_JOURNAL = ProcessedLorasJournal(PROCESSED_LORAS_FILE, PROCESSED_LORAS_JOURNAL)
+
+class ProcessingJob:
+    """
+    One background processing run. The work list and LoRA paths are saved when the job
+    starts and every finished LoRA is appended to a log, so a job interrupted by a
+    restart resumes with only the LoRAs it had not reached yet.
+    """
+    FINISHED = ('completed', 'cancelled', 'failed')
+
+    def __init__(self, job_id, new_loras, moved_loras, missing_loras, paths, settings, offline=False, created=None):
+        self.job_id = job_id
+        self.new_loras = new_loras
+        self.moved_loras = moved_loras
+        self.missing_loras = missing_loras
+        self.paths = paths  # base filename -> model path, so a resumed job doesn't need a rescan
+        self.settings = settings
+        self.offline = offline
+        self.created = created or time.time()
+        self.finished = None
+        self.status = 'queued'
+        self.done = set()
+        self.processed_count = 0
+        self.skipped_count = 0
+        self.cancel_requested = False
+        self.result = None
+        self.error = None
+        self.task = None
+
+    @property
+    def total_count(self):
+        return len(self.new_loras) + len(self.moved_loras) + len(self.missing_loras)
+
+    def to_state(self):
+        return {
+            "job_id": self.job_id,
+            "new_loras": self.new_loras,
+            "moved_loras": self.moved_loras,
+            "missing_loras": self.missing_loras,
+            "paths": self.paths,
+            "settings": self.settings,
+            "offline": self.offline,
+            "created": self.created
+        }
+
+    @classmethod
+    def load(cls):
+        """Rebuild the interrupted job from PROCESS_JOB_FILE and its log, or None if there isn't one."""
+        if not os.path.exists(PROCESS_JOB_FILE):
+            return None
+        try:
+            with open(PROCESS_JOB_FILE, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            job = cls(**state)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.error(f"Discarding unreadable processing job state: {str(e)}")
+            cls.clear_state()
+            return None
+
+        if os.path.exists(PROCESS_JOB_LOG):
+            with open(PROCESS_JOB_LOG, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line from a killed run, that LoRA is simply redone
+                        continue
+                    job.done.add(entry["item"])
+                    job.processed_count = entry.get("processed_count", job.processed_count)
+                    job.skipped_count = entry.get("skipped_count", job.skipped_count)
+        return job
+
+    def save(self):
+        write_json_atomic(PROCESS_JOB_FILE, self.to_state())
+        if os.path.exists(PROCESS_JOB_LOG):
+            os.remove(PROCESS_JOB_LOG)
+
+    def record(self, item):
+        """Mark one LoRA finished for this job, durable across a restart."""
+        self.done.add(item)
+        with open(PROCESS_JOB_LOG, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "item": item,
+                "processed_count": self.processed_count,
+                "skipped_count": self.skipped_count
+            }, ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def clear_state():
+        for path in (PROCESS_JOB_FILE, PROCESS_JOB_LOG):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def progress(self):
+        completed = self.processed_count + self.skipped_count
+        total = self.total_count
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "progress": int((completed / total) * 100) if total else 100,
+            "completed": completed,
+            "total": total
+        }
+
+    def status_dict(self):
+        return {
+            **self.progress(),
+            "processed_count": self.processed_count,
+            "skipped_count": self.skipped_count,
+            "offline": self.offline,
+            "created": self.created,
+            "finished": self.finished,
+            "error": self.error,
+            "result": self.result
+        }
+
+    async def send_progress(self):
+        await PromptServer.instance.send_json("lora_process_progress", self.progress())
+
+class ProcessingJobs:
+    """Runs at most one processing job at a time and remembers recent ones for status lookups."""
+    def __init__(self):
+        self.jobs = OrderedDict()
+        self.active = None
+        self.starting = False  # a start request is building its job and hasn't set active yet
+
+    @property
+    def busy(self):
+        return self.active is not None or self.starting
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def reserve(self):
+        """
+        Claim the job slot before the start request awaits anything, so two requests arriving
+        together can't both pass the busy check. start() or release() gives it back.
+        """
+        if self.busy:
+            return False
+        self.starting = True
+        return True
+
+    def release(self):
+        self.starting = False
+
+    def start(self, job):
+        self.starting = False
+        self.active = job
+        self.jobs[job.job_id] = job
+        job.status = 'running'
+        job.task = asyncio.ensure_future(self._run(job))
+        return job
+
+    async def _run(self, job):
+        try:
+            await run_processing_job(job)
+            job.status = 'cancelled' if job.cancel_requested else 'completed'
+            ProcessingJob.clear_state()
+        except asyncio.CancelledError:
+            # Server shutdown, leave the saved state so the job resumes on the next start
+            job.status = 'interrupted'
+            raise
+        except Exception as e:
+            logger.error(f"Processing job {job.job_id} failed: {str(e)}")
+            job.status = 'failed'
+            job.error = str(e)
+            ProcessingJob.clear_state()
+        finally:
+            job.finished = time.time()
+            self.active = None
+            while len(self.jobs) > PROCESS_JOB_HISTORY:
+                self.jobs.popitem(last=False)
+            if job.status != 'interrupted':
+                await job.send_progress()
+            logger.info(f"Processing job {job.job_id} {job.status}: {job.processed_count} processed, {job.skipped_count} skipped")
+
+    def cancel(self, job):
+        """Stop handing out LoRAs, the ones already in flight finish so no half-written data is left."""
+        if job.status in ProcessingJob.FINISHED:
+            return False
+        job.cancel_requested = True
+        job.status = 'cancelling'
+        return True
+
+    async def resume(self):
+        """Continue a job the previous server run didn't finish, called once the cache is warm."""
+        job = ProcessingJob.load()
+        if job is None:
+            return
+        for base_filename, path in job.paths.items():
+            LORA_FILE_INFO.setdefault(base_filename, {"filename": os.path.basename(path), "path": path})
+        logger.info(f"Resuming processing job {job.job_id}: {len(job.done)}/{job.total_count} already done")
+        self.start(job)
+
+PROCESSING_JOBS = ProcessingJobs()
+
 def get_completion_message(lora_count):
     # after all this i need to have some fun
     messages = {
@@ -811,47 +2360,50 @@ async def get_file_details(request):
             "error": "Failed to get file details"
         }, status=500)
 
-@PromptServer.instance.routes.get("/lora_sidebar/preview/{lora_name}")
-async def get_lora_preview(request):
-    # Load preview media with proper MIME type handling.
-    lora_name = request.match_info['lora_name']
-    
-    def get_content_type(filepath):
-        ext = os.path.splitext(filepath)[1].lower()
-        content_types = {
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.mp4': 'video/mp4',
-            '.webm': 'video/webm'
-        }
-        return content_types.get(ext, 'application/octet-stream')
-    
+def get_preview_content_type(filepath):
+    ext = os.path.splitext(filepath)[1].lower()
+    content_types = {
+        '.png': 'image/png',
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.webp': 'image/webp',
+        '.mp4': 'video/mp4',
+        '.webm': 'video/webm'
+    }
+    return content_types.get(ext, 'application/octet-stream')
+
+def find_preview_path(lora_name):
+    """The full preview for a LoRA, from our data folder or next to a local metadata model. None if there isn't one."""
     # Look in managed folder
     lora_folder = os.path.join(LORA_DATA_DIR, lora_name)
-    for ext in ['.jpg', '.png', '.jpeg', '.mp4', '.webm']:
+    for ext in ['.jpg', '.png', '.jpeg', '.webp', '.mp4', '.webm']:
         preview_path = os.path.join(lora_folder, f"preview{ext}")
         if os.path.exists(preview_path):
-            return web.FileResponse(
-                preview_path,
-                headers={"Content-Type": get_content_type(preview_path)}
-            )
+            return preview_path
     
     # Check if this LoRA uses local image data
-    info_path = os.path.join(LORA_DATA_DIR, lora_name, "info.json")
-    if os.path.exists(info_path):
-        with open(info_path, "r", encoding="utf-8") as f:
-            info = json.load(f)
-            logger.info(f"Loading info for {lora_name}: local_metadata={info.get('local_metadata')}, path={info.get('path')}")
-            if info.get("local_metadata") and info.get("path"):
-                base_path = os.path.splitext(info["path"])[0]
-                for ext in ['.preview.png', '.preview.jpg', '.preview.jpeg', '.preview.mp4', '.preview.webm']:
-                    preview_path = f"{base_path}{ext}"
-                    if os.path.exists(preview_path):
-                        return web.FileResponse(
-                            preview_path,
-                            headers={"Content-Type": get_content_type(preview_path)}
-                        )
+    info = CATALOG.get(lora_name)
+    if info:
+        logger.info(f"Loading info for {lora_name}: local_metadata={info.get('local_metadata')}, path={info.get('path')}")
+        if info.get("local_metadata") and info.get("path"):
+            base_path = os.path.splitext(info["path"])[0]
+            for ext in ['.preview.png', '.preview.jpg', '.preview.jpeg', '.preview.mp4', '.preview.webm']:
+                preview_path = f"{base_path}{ext}"
+                if os.path.exists(preview_path):
+                    return preview_path
+    return None
+
+@PromptServer.instance.routes.get("/lora_sidebar/preview/{lora_name}")
+async def get_lora_preview(request):
+    # Load preview media with proper MIME type handling.
+    lora_name = request.match_info['lora_name']
+    
+    preview_path = find_preview_path(lora_name)
+    if preview_path:
+        return web.FileResponse(
+            preview_path,
+            headers={"Content-Type": get_preview_content_type(preview_path)}
+        )
         
     # Fallback to placeholder
     placeholder_path = os.path.join(LORA_DATA_DIR, "placeholder.jpeg")
@@ -863,20 +2415,42 @@ async def get_lora_preview(request):
     
     return web.Response(status=404)
 
+@PromptServer.instance.routes.get("/lora_sidebar/thumb/{lora_name}")
+async def get_lora_thumb(request):
+    """Small tile-sized preview, ?size= is the tile width in device pixels. Videos are served as-is."""
+    lora_name = request.match_info['lora_name']
+    try:
+        size = int(request.query.get('size', THUMB_SIZES[1]))
+    except ValueError:
+        size = THUMB_SIZES[1]
+
+    preview_path = find_preview_path(lora_name)
+    if not preview_path:
+        return await get_lora_preview(request)
+
+    thumb_path = await THUMBNAILS.get(lora_name, preview_path, size)
+    served_path = thumb_path or preview_path
+    # The thumb URL doesn't change with the preview, so the browser revalidates every time. A
+    # thumbnail carries its preview's mtime, FileResponse's ETag/Last-Modified turn that into a 304.
+    return web.FileResponse(
+        served_path,
+        headers={
+            "Content-Type": get_preview_content_type(served_path),
+            "Cache-Control": "private, no-cache"
+        }
+    )
+
 @PromptServer.instance.routes.get("/lora_sidebar/info/{lora_name}")
 async def get_lora_info(request):
     try:
         lora_name = request.match_info['lora_name']
-        info_path = os.path.join(LORA_DATA_DIR, lora_name, "info.json")
+        info_data = CATALOG.get(lora_name)
         
-        if not os.path.exists(info_path):
+        if info_data is None:
             return web.json_response({
                 "status": "error",
-                "message": "LoRA info file not found"
+                "message": "LoRA info not found"
             }, status=404)
-        
-        with open(info_path, "r", encoding="utf-8") as f:
-            info_data = json.load(f)
             
         return web.json_response({
             "status": "success",
@@ -958,7 +2532,10 @@ async def get_placeholder(request):
 async def get_unprocessed_count(request):
     logger.info("Starting fresh: Scanning for unprocessed LoRAs")
 
-    processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
+    # Pick up LoRAs finished by a run that was killed before compacting its journal
+    PROCESSED_JOURNAL.compact()
+
+    processed_loras_file = PROCESSED_LORAS_FILE
     # Initialize processed_loras with default structure
     processed_loras = {
         "version": PROCESSED_LORAS_VERSION,
@@ -1137,15 +2714,58 @@ async def estimate_processing_time(request):
 @PromptServer.instance.routes.get("/lora_sidebar/is_processing")
 async def is_processing_handler(request):
     """Endpoint to check if LoRA processing is currently running."""
-    return web.json_response({"is_processing": is_processing})
+    active = PROCESSING_JOBS.active
+    return web.json_response({
+        "is_processing": PROCESSING_JOBS.busy,
+        "job_id": active.job_id if active else None
+    })
 
-@PromptServer.instance.routes.get("/lora_sidebar/process")
-async def process_loras(request):
-    global is_processing, LORA_FILE_INFO, CACHE_SETTINGS
+@PromptServer.instance.routes.get("/lora_sidebar/rate_limits")
+async def get_rate_limit_stats(request):
+    """Current tokens and wait stats for each rate limiter, plus response cache hits."""
+    return web.json_response({
+        "limiters": {name: limiter.stats() for name, limiter in RATE_LIMITERS.items()},
+        "response_cache": dict(RESPONSE_CACHE.stats)
+    })
+
+@PromptServer.instance.routes.post("/lora_sidebar/catalog/export")
+async def export_catalog(request):
+    """Write loraData/<id>/info.json for every LoRA in the catalog, for tools that read those files."""
+    try:
+        exported = sum(1 for lora_id, info in CATALOG.items() if CATALOG.export_info_json(lora_id, info))
+        logger.info(f"Exported {exported} info.json files from the catalog")
+        return web.json_response({"status": "success", "exported": exported})
+    except Exception as e:
+        logger.error(f"Error exporting catalog: {str(e)}")
+        return web.json_response({
+            "status": "error",
+            "message": str(e)
+        }, status=500)
+
+@PromptServer.instance.routes.post("/lora_sidebar/hash_index/verify")
+async def verify_hash_index(request):
+    """Re-hash every file in the hash index and repair stale or missing entries."""
+    if PROCESSING_JOBS.busy:
+        return web.json_response({
+            "status": "error",
+            "message": "Processing in progress, try again when it finishes"
+        }, status=400)
+
+    try:
+        result = await HASH_INDEX.verify()
+        logger.info(f"Hash index verified: {result['checked']} checked, {len(result['mismatched'])} mismatched, {len(result['missing'])} missing")
+        return web.json_response({"status": "success", **result})
+    except Exception as e:
+        logger.error(f"Error verifying hash index: {str(e)}")
+        return web.json_response({
+            "status": "error",
+            "message": str(e)
+        }, status=500)
 
-    # Get actual user settings as soon as we can
+def get_process_settings(request):
+    """Snapshot of the user settings processing sorts and categorizes with."""
     settings = PromptServer.instance.user_manager.settings.get_settings(request)
-    CACHE_SETTINGS.update({
+    return {
         'sortMethod': settings.get("LoRA Sidebar.General.sortMethod", 'AlphaAsc'),
         'sortModels': settings.get("LoRA Sidebar.General.sortModels", 'None'),
         'tagSource': settings.get("LoRA Sidebar.General.tagSource", 'CivitAI'),
@@ -1153,10 +2773,115 @@ async def process_loras(request):
         'catNew': settings.get("LoRA Sidebar.General.catNew", True),
         'nsfwFolder': settings.get("LoRA Sidebar.NSFW.nsfwFolder", True),
         'nsfwString': settings.get("LoRA Sidebar.NSFW.folderString", 'NSFW')
-    })
+    }
+
+async def start_processing_job(request):
+    """Create, persist and start a processing job from the current unprocessed scan."""
+    # Check if we have the unprocessed data
+    unprocessed_info = LoraDataStore.get_data()
     
-    # Check if processing is already in progress
-    if is_processing:
+    if unprocessed_info is None:
+        # If not, we need to call get_unprocessed_count
+        logger.info("Unprocessed data not found, calling get_unprocessed_count")
+        await get_unprocessed_count(request)
+        unprocessed_info = LoraDataStore.get_data()
+
+    if unprocessed_info is None:
+        raise ValueError("Failed to retrieve unprocessed LoRAs data")
+
+    logger.info(f"Unprocessed info for new job: {unprocessed_info}")
+
+    new_loras = unprocessed_info.get('new_loras', [])
+    moved_loras = unprocessed_info.get('moved_loras', [])
+    paths = {
+        base_filename: LORA_FILE_INFO[base_filename]['path']
+        for base_filename in new_loras + moved_loras
+        if base_filename in LORA_FILE_INFO
+    }
+
+    job = ProcessingJob(
+        uuid.uuid4().hex,
+        new_loras,
+        moved_loras,
+        unprocessed_info.get('missing_loras', []),
+        paths,
+        get_process_settings(request),
+        # Offline mode rebuilds LoRA data purely from cached CivitAI responses
+        offline=request.rel_url.query.get('offline', 'false').lower() in ('1', 'true')
+    )
+    job.save()
+    LoraDataStore.clear_data()
+
+    # The job is saved and will resume until it finishes, so the refresh all request is consumed
+    setting_id = "LoRA Sidebar.General.refreshAll"
+    settings = PromptServer.instance.user_manager.settings.get_settings(request)
+    settings[setting_id] = False
+    PromptServer.instance.user_manager.settings.save_settings(request, settings)
+    logger.info(f"Current refresh setting value: {settings.get(setting_id)}")
+
+    return PROCESSING_JOBS.start(job)
+
+@PromptServer.instance.routes.post("/lora_sidebar/process/start")
+async def start_process_job(request):
+    """Start processing in the background and return the job ID right away."""
+    # A job would upsert into LORA_CACHE while the warmup is still replacing it
+    if cache_warming_up():
+        return web.json_response({
+            "status": "error",
+            "message": "LoRA cache is still loading, try again shortly",
+            "loading": True
+        }, status=503, headers={"Retry-After": "1"})
+
+    if not PROCESSING_JOBS.reserve():
+        active = PROCESSING_JOBS.active
+        return web.json_response({
+            "status": "Processing already in progress",
+            **(active.status_dict() if active else {})
+        }, status=409)
+
+    try:
+        job = await start_processing_job(request)
+        return web.json_response(job.status_dict())
+    except Exception as e:
+        logger.error(f"Error starting processing job: {str(e)}")
+        return web.json_response({
+            "status": "error",
+            "message": str(e)
+        }, status=500)
+    finally:
+        PROCESSING_JOBS.release()
+
+@PromptServer.instance.routes.get("/lora_sidebar/process/status/{job_id}")
+async def get_process_job_status(request):
+    job = PROCESSING_JOBS.get(request.match_info['job_id'])
+    if job is None:
+        return web.json_response({"status": "error", "message": "Unknown job"}, status=404)
+    return web.json_response(job.status_dict())
+
+@PromptServer.instance.routes.post("/lora_sidebar/process/cancel/{job_id}")
+async def cancel_process_job(request):
+    job = PROCESSING_JOBS.get(request.match_info['job_id'])
+    if job is None:
+        return web.json_response({"status": "error", "message": "Unknown job"}, status=404)
+    if not PROCESSING_JOBS.cancel(job):
+        return web.json_response({
+            "status": "error",
+            "message": f"Job already {job.status}"
+        }, status=400)
+    return web.json_response(job.status_dict())
+
+@PromptServer.instance.routes.get("/lora_sidebar/process")
+async def process_loras(request):
+    """Older blocking endpoint, starts a job and waits for it. Closing the request no longer stops the job."""
+    if cache_warming_up():
+        return web.json_response({
+            "status": "LoRA cache is still loading",
+            "processed_count": 0,
+            "total_count": 0,
+            "skipped_count": 0
+        }, status=503, headers={"Retry-After": "1"})
+
+    if not PROCESSING_JOBS.reserve():
         return web.json_response({
             "status": "Processing already in progress",
             "processed_count": 0,
@@ -1164,33 +2889,40 @@ async def process_loras(request):
             "skipped_count": 0
         }, status=400)
 
-    is_processing = True
-
     try:
-        # Check if we have the unprocessed data
-        unprocessed_info = LoraDataStore.get_data()
-        
-        if unprocessed_info is None:
-            # If not, we need to call get_unprocessed_count
-            logger.info("Unprocessed data not found, calling get_unprocessed_count")
-            unprocessed_response = await get_unprocessed_count(request) # can remove later?
-            unprocessed_info = LoraDataStore.get_data()
+        job = await start_processing_job(request)
+    except Exception as e:
+        logger.error(f"Error starting processing job: {str(e)}")
+        return web.json_response({
+            "status": "error",
+            "message": str(e)
+        }, status=500)
+    finally:
+        PROCESSING_JOBS.release()
 
-        if unprocessed_info is None:
-            raise ValueError("Failed to retrieve unprocessed LoRAs data")
+    await asyncio.shield(job.task)
+    return web.json_response(job.result or job.status_dict())
 
-        logger.info(f"Unprocessed info in process_loras: {unprocessed_info}")
+async def run_processing_job(job):
+    """
+    Process a job's new and moved LoRAs with a pool of workers, then drop the missing ones.
+    LoRAs the job already finished before a restart are left out.
+    """
+    CACHE_SETTINGS.update(job.settings)
 
-        new_loras = unprocessed_info.get('new_loras', [])
-        moved_loras = unprocessed_info.get('moved_loras', [])
-        missing_loras = unprocessed_info.get('missing_loras', [])
+    # Offline is passed down to this job's lookups only, refreshes running alongside still go online
+    if job.offline:
+        logger.info("Processing offline from the response cache")
 
-        processed_count = 0
-        skipped_count = 0
-        total_count = len(new_loras) + len(moved_loras) + len(missing_loras)
+    try:
+        new_loras = [lora for lora in job.new_loras if lora not in job.done]
+        moved_loras = [lora for lora in job.moved_loras if lora not in job.done]
+        missing_loras = [lora for lora in job.missing_loras if lora not in job.done]
+        total_count = job.total_count
 
-        # Path to the processed LoRAs JSON file
-        processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
+        # Path to the processed LoRAs JSON file, results are journaled during the run and compacted into it
+        processed_loras_file = PROCESSED_LORAS_FILE
+        PROCESSED_JOURNAL.compact()
 
         # Load existing processed LoRAs
         if os.path.exists(processed_loras_file):
@@ -1221,33 +2953,64 @@ async def process_loras(request):
 
         logger.info(f"Found {len(new_loras)} new LoRAs, {len(moved_loras)} moved LoRAs, and {len(missing_loras)} missing LoRAs to process.")
 
-        async with aiohttp.ClientSession() as session:
+        async with HTTP_CLIENT as session:
 
             # Process both new and moved LoRAs
             loras_to_process = new_loras + moved_loras  # Combine both lists
-            # Process new LoRAs
-            for lora_file in loras_to_process:
+            # Guards processed_loras and the cache while workers finish LoRAs out of order
+            results_lock = asyncio.Lock()
+
+            # By-hash lookups are batched, so hash and look up ahead of the workers to fill whole batches
+            version_batcher = VersionLookupBatcher(session, offline=job.offline)
+            preview_downloader = PreviewDownloader(session, offline=job.offline)
+            preview_downloads = {}
+            version_prefetch = {}
+            claimed_loras = set()
+            unfinished_loras = set()  # skipped without being done, not recorded so a resumed job retries them
+            prefetch_slots = asyncio.Semaphore(VERSION_PREFETCH_AHEAD)
+
+            async def lookup_version(file_path):
+                file_hash = await hash_file(file_path)
+                return await asyncio.shield(version_batcher.lookup(file_hash))
+
+            async def prefetch_versions():
+                for base_filename in loras_to_process:
+                    if base_filename in claimed_loras or has_current_info(base_filename):
+                        continue
+                    lora_info = LORA_FILE_INFO.get(base_filename)
+                    if not lora_info or await check_local_info(lora_info['path']):
+                        continue
+                    await prefetch_slots.acquire()
+                    if base_filename in claimed_loras:
+                        prefetch_slots.release()
+                        continue
+                    version_prefetch[base_filename] = asyncio.ensure_future(lookup_version(lora_info['path']))
+
+            def drop_prefetch(base_filename):
+                # Release a prefetched lookup the worker never used
+                leftover = version_prefetch.pop(base_filename, None)
+                if leftover is not None:
+                    leftover.cancel()
+                    prefetch_slots.release()
+
+            # Process a single new or moved LoRA
+            async def process_one(lora_file):
+                nonlocal processed_loras
+                claimed_loras.add(lora_file)
+
                 filename = lora_file #should remove i think?
                 base_filename = lora_file
                 lora_folder = os.path.join(LORA_DATA_DIR, base_filename)
                 
                 # Check if LoRA is already processed and up to date
-                info_json_path = os.path.join(lora_folder, "info.json")
-                if os.path.exists(info_json_path):
+                info_data = CATALOG.get(base_filename)
+                if info_data is not None:
                     needs_reprocess = False
-                    try:
-                        with open(info_json_path, "r", encoding="utf-8") as f:
-                            info_data = json.load(f)
-                        
-                        # Check if info.json version is current
-                        if not info_data.get('info_version') or info_data.get('info_version') < PROCESSED_LORAS_VERSION:
-                            needs_reprocess = True
-                            logger.info(f"Found outdated info.json (version: {info_data.get('info_version', 'none')} -> {PROCESSED_LORAS_VERSION}) for {filename}, reprocessing")
-                        
-                    except Exception as e:
-                        logger.error(f"Error checking info.json version for {filename}: {str(e)}")
-                        logger.info(f"Will reprocess {filename} due to error checking version")
+
+                    # Check if the catalog entry version is current
+                    if not info_data.get('info_version') or info_data.get('info_version') < PROCESSED_LORAS_VERSION:
                         needs_reprocess = True
+                        logger.info(f"Found outdated catalog entry (version: {info_data.get('info_version', 'none')} -> {PROCESSED_LORAS_VERSION}) for {filename}, reprocessing")
 
                     # Handle moved files
                     lora_info = LORA_FILE_INFO.get(base_filename)
@@ -1274,12 +3037,8 @@ async def process_loras(request):
                                 path_updated = True
                                 logger.info(f"Updated path for moved LoRA {base_filename}: {new_path}")
 
-                            # If the path was updated, also update info.json
+                            # If the path was updated, also update the catalog entry
                             if path_updated:
-                                # Read current info.json
-                                with open(info_json_path, "r", encoding="utf-8") as f:
-                                    info_data = json.load(f)
-                                
                                 needs_update = False
                                 
                                 # Check if we need to update metadata source
@@ -1296,45 +3055,21 @@ async def process_loras(request):
                                     info_data["path"] = new_path
                                     info_data["subdir"] = new_subdir
                                     needs_update = True
-                                    logger.info(f"Updated path/subdir in info.json for {base_filename}")
+                                    logger.info(f"Updated path/subdir for {base_filename}")
                                 
                                 # Write updates if needed
                                 if needs_update:
-                                    with open(info_json_path, "w", encoding="utf-8") as f:
-                                        json.dump(info_data, f, indent=4)
-                                        logger.info(f"Saved updated info.json for moved LoRA: {base_filename}")
-
-                                # Save processed_loras.json immediately after updating
-                                if os.path.exists(processed_loras_file):
-                                    with open(processed_loras_file, "r", encoding="utf-8") as f:
-                                        existing_data = json.load(f)
-                                    
-                                    # Update the specific entry in existing_data
-                                    existing_lora = next((item for item in existing_data["loras"] 
-                                                    if item.get("filename") == base_filename), None)
-                                    if existing_lora:
-                                        existing_lora["path"] = new_path
-                                    else:
-                                        existing_data["loras"].append({
-                                            "filename": base_filename,
-                                            "path": new_path
-                                        })
-                                    
-                                    existing_data = validate_processed_loras(existing_data)
-                                    with open(processed_loras_file, 'w', encoding="utf-8") as f:
-                                        json.dump(existing_data, f, indent=4, ensure_ascii=False)
-                                    logger.info(f"Updated processed_loras.json for {base_filename}")
+                                    CATALOG.put(base_filename, info_data)
+                                    logger.info(f"Saved updated catalog entry for moved LoRA: {base_filename}")
+
+                                # Journal the new path, it is compacted into processed_loras.json later
+                                PROCESSED_JOURNAL.append("path", base_filename, new_path)
                                 
                                 # Handle move completion
                                 if base_filename in moved_loras:
                                     moved_loras.remove(base_filename)
-                                    processed_count += 1
-                                    progress = int(((processed_count + skipped_count) / total_count) * 100)
-                                    await PromptServer.instance.send_json("lora_process_progress", {
-                                        "progress": progress,
-                                        "completed": processed_count + skipped_count,
-                                        "total": total_count
-                                    })
+                                    job.processed_count += 1
+                                    await job.send_progress()
                                     logger.info(f"Completed move processing for {base_filename}")
                             
                         except Exception as e:
@@ -1343,15 +3078,10 @@ async def process_loras(request):
                     
                     # Only skip if we don't need to reprocess and haven't moved
                     if not needs_reprocess:
-                        skipped_count += 1
-                        progress = int(((processed_count + skipped_count) / total_count) * 100)
-                        await PromptServer.instance.send_json("lora_process_progress", {
-                            "progress": progress,
-                            "completed": processed_count + skipped_count,
-                            "total": total_count
-                        })
+                        job.skipped_count += 1
+                        await job.send_progress()
                         logger.info(f"Skipping already processed LoRA (current version): {filename}")
-                        continue
+                        return
                 
                 try:
                     # Process LoRA without creating the folder first
@@ -1378,9 +3108,22 @@ async def process_loras(request):
                         has_local_metadata = True  # Set flag if we found local metadata
                         logger.info("Got version info from local metadata")
                     else:
-                        # If no local metadata, proceed with CivitAI API calls
-                        file_hash = await hash_file(file_path)
-                        version_info = await fetch_version_info(session, file_hash)
+                        # If no local metadata, proceed with CivitAI API calls, using the prefetched lookup if there is one
+                        prefetched = version_prefetch.pop(base_filename, None)
+                        if prefetched is not None:
+                            try:
+                                version_info = await prefetched
+                            finally:
+                                prefetch_slots.release()
+                        else:
+                            version_info = await lookup_version(file_path)
+                        if version_info is OFFLINE_MISS:
+                            # Nothing cached to rebuild from, keep what we have and leave it for an online run
+                            logger.info(f"No cached CivitAI data for {filename} while offline, skipping")
+                            unfinished_loras.add(base_filename)
+                            job.skipped_count += 1
+                            await job.send_progress()
+                            return
                         logger.info("Got version info from CivitAI")
 
                     # Calculate subdir, handling symlink issues and cross-drive paths
@@ -1415,11 +3158,16 @@ async def process_loras(request):
                         # Fetch model info if available and we're not using local metadata
                         model_id = info_to_save["modelId"]
                         if model_id and not has_local_metadata:
-                            model_info = await fetch_model_info(session, model_id)
+                            model_info = await fetch_model_info(session, model_id, offline=job.offline)
                             if model_info:
                                 info_to_save["tags"] = model_info.get('tags', [])
                                 info_to_save["nsfwLevel"] = model_info.get('nsfwLevel', 0)
                                 info_to_save["model_desc"] = model_info.get('description')
+                            elif job.offline and info_data is not None:
+                                # Model lookup not cached, keep the tags we had rather than blanking them
+                                for field in ('tags', 'nsfwLevel', 'model_desc'):
+                                    if field in info_data:
+                                        info_to_save[field] = info_data[field]
 
                         # Get custom images only for local metadata
                         custom_images = []
@@ -1466,9 +3214,8 @@ async def process_loras(request):
                             if not has_local_images:  # Download if not using local images or not local metadata
                                 preview_path = os.path.join(LORA_DATA_DIR, filename, "preview")
                                 os.makedirs(os.path.dirname(preview_path), exist_ok=True)  
-                                preview_filename = await download_image(session, info_to_save['images'][0]['url'], preview_path)
-                                if preview_filename:
-                                    logger.info(f"Saved preview image as {preview_filename}")
+                                # Hand off to the download stage and keep processing, the worker waits on it before recording the LoRA
+                                preview_downloads[base_filename] = preview_downloader.submit(info_to_save['images'][0]['url'], preview_path)
                             else:
                                 logger.info("Using existing local preview image")
                         else:
@@ -1482,10 +3229,8 @@ async def process_loras(request):
                         # Create the LoRA folder after successful processing
                         os.makedirs(lora_folder, exist_ok=True)
                         
-                        # Save information to a JSON file
-                        info_file_path = os.path.join(lora_folder, "info.json")
-                        with open(info_file_path, "w", encoding="utf-8") as f:
-                            json.dump(info_to_save, f, indent=4)
+                        # Save information to the catalog
+                        CATALOG.put(base_filename, info_to_save)
                     
                     else:
                         logger.info(f"Failed to fetch info for {filename}, treating it as a custom LoRA.")
@@ -1546,171 +3291,158 @@ async def process_loras(request):
                         # Create the LoRA folder
                         os.makedirs(lora_folder, exist_ok=True)
 
-                        # Save the minimal info.json
-                        info_file_path = os.path.join(lora_folder, "info.json")
-                        with open(info_file_path, "w", encoding="utf-8") as f:
-                            json.dump(info_to_save, f, indent=4)
+                        # Save the minimal info
+                        CATALOG.put(base_filename, info_to_save)
 
                     logger.info(f"Processed {filename}")
 
-                    # Add to cache
-                    if LORA_CACHE.get('ordered_loras') is not None:
-                        info_to_save['id'] = base_filename  # Make sure ID is set
-                        info_to_save['favorite'] = base_filename in processed_loras.get('favorites', [])
+                    async with results_lock:
+                        # Add to cache
+                        if LORA_CACHE.get('ordered_loras') is not None:
+                            info_to_save['id'] = base_filename  # Make sure ID is set
+                            info_to_save['favorite'] = base_filename in processed_loras.get('favorites', [])
                         
-                        # Remove any existing entry first (in case of reprocessing)
-                        LORA_CACHE['ordered_loras'] = [
-                            item for item in LORA_CACHE['ordered_loras'] 
-                            if item['id'] != base_filename
-                        ]
-                        
-                        # Add new entry
-                        LORA_CACHE['ordered_loras'].append(info_to_save)
-                        
-                        # Resort if needed
-                        if len(LORA_CACHE['ordered_loras']) > 1:
-                            sort_metadata = await get_lora_sort_metadata()
-                            LORA_CACHE['ordered_loras'] = await sort_loras_with_categories(
-                                LORA_CACHE['ordered_loras'],
-                                CACHE_SETTINGS,
-                                processed_loras.get('favorites', []),
-                                sort_metadata
-                            )
-                            
-                        # Update category counts
-                        manage_category_counts("calculate", 
-                            loras=LORA_CACHE['ordered_loras'],
-                            settings=CACHE_SETTINGS
-                        )
-
-                    processed_count += 1
-                    processed_loras["loras"].append({
-                        "filename": base_filename,
-                        "path": file_path  # Include the path here
-                    })
-                    processed_loras = validate_processed_loras(processed_loras)
-                    with open(processed_loras_file, 'w', encoding="utf-8") as f:
-                        json.dump(processed_loras, f, indent=4, ensure_ascii=False)
+                            # Replace any existing entry at its sorted position and update counts by delta
+                            cache_upsert_lora(info_to_save, CACHE_SETTINGS, processed_loras.get('favorites', []))
+
+                        job.processed_count += 1
+                        processed_loras["loras"].append({
+                            "filename": base_filename,
+                            "path": file_path  # Include the path here
+                        })
+                        processed_loras = validate_processed_loras(processed_loras)
+                        PROCESSED_JOURNAL.append("path", base_filename, file_path)
+                        PROCESSED_JOURNAL.maybe_compact()
                 
                 except Exception as e:
                     logger.error(f"Error processing {filename}: {str(e)}")
-                    # Remove the folder if it was partially created
+                    # Remove the folder and catalog entry if they were partially created
                     if os.path.exists(lora_folder):
                         shutil.rmtree(lora_folder)
+                    CATALOG.delete(base_filename)
                 
                 # Send progress update
-                progress = int(((processed_count + skipped_count) / total_count) * 100)
-                await PromptServer.instance.send_json("lora_process_progress", {
-                    "progress": progress,
-                    "completed": processed_count + skipped_count,
-                    "total": total_count
-                })
+                await job.send_progress()
+
+            async def process_worker():
+                # Each worker pulls LoRAs until the queue is drained, CivitAI calls are still capped by the rate limiters
+                while not job.cancel_requested:
+                    try:
+                        lora_file = lora_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        await process_one(lora_file)
+                    except Exception as e:
+                        logger.error(f"Worker error processing {lora_file}: {str(e)}")
+                    finally:
+                        drop_prefetch(lora_file)
+                        lora_queue.task_done()
+                    record_when_done(lora_file)
+
+            def record_when_done(base_filename):
+                # For resuming, a LoRA is only done once its preview is on disk too
+                download = preview_downloads.pop(base_filename, None)
+                if base_filename in unfinished_loras:
+                    return
+                if download is None:
+                    job.record(base_filename)
+                    return
+
+                def on_download(task):
+                    # A failed preview leaves the LoRA unrecorded, so a resumed job retries it
+                    if not task.cancelled() and task.exception() is None:
+                        job.record(base_filename)
+                download.add_done_callback(on_download)
+
+            lora_queue = asyncio.Queue()
+            for lora_file in loras_to_process:
+                lora_queue.put_nowait(lora_file)
+
+            worker_count = max(1, min(PROCESS_CONCURRENCY, len(loras_to_process)))
+            logger.info(f"Processing {len(loras_to_process)} LoRAs with {worker_count} workers")
+            prefetch_task = asyncio.ensure_future(prefetch_versions())
+            try:
+                await asyncio.gather(*(process_worker() for _ in range(worker_count)))
+            finally:
+                prefetch_task.cancel()
+                for base_filename in list(version_prefetch):
+                    drop_prefetch(base_filename)
+                await version_batcher.close()
+                await preview_downloader.close()
 
             # Handle missing LoRAs
             for missing_lora_name in missing_loras:
+                if job.cancel_requested:
+                    break
                 try:
                     lora_folder = os.path.join(LORA_DATA_DIR, missing_lora_name)
                     # Remove the folder if it exists
                     if os.path.exists(lora_folder):
                         shutil.rmtree(lora_folder)
                         logger.info(f"Removed folder for missing LoRA: {missing_lora_name}")
+                    CATALOG.delete(missing_lora_name)
 
-                    # Read current data to preserve version and favorites
-                    existing_data = {
-                        "version": PROCESSED_LORAS_VERSION,
-                        "loras": [],
-                        "favorites": []
-                    }
-                    if os.path.exists(processed_loras_file):
-                        with open(processed_loras_file, "r", encoding="utf-8") as f:
-                            existing_data = json.load(f)
-                    
-                    # Update loras list - remove the missing one
-                    existing_data["loras"] = [
-                        lora for lora in existing_data["loras"] 
-                        if lora.get("filename") != missing_lora_name
-                    ]
-                    
-                    # Also remove from favorites if present
-                    if missing_lora_name in existing_data.get("favorites", []):
-                        existing_data["favorites"].remove(missing_lora_name)
+                    # Journal the removal, it also drops the LoRA from favorites when compacted
+                    PROCESSED_JOURNAL.append("remove", missing_lora_name)
+                    PROCESSED_JOURNAL.apply(processed_loras, {"op": "remove", "filename": missing_lora_name})
                     
                     # Update cache if it exists
                     if LORA_CACHE.get('ordered_loras'):
-                        LORA_CACHE['ordered_loras'] = [
-                            lora for lora in LORA_CACHE['ordered_loras']
-                            if lora.get('id') != missing_lora_name
-                        ]
-                    
-                    # Save updated data
-                    with open(processed_loras_file, "w", encoding="utf-8") as f:
-                        json.dump(existing_data, f, indent=4, ensure_ascii=False)
+                        cache_delete_lora(missing_lora_name)
                     
                     logger.info(f"Removed {missing_lora_name} from processed_loras.json")
-                    processed_count += 1
+                    job.processed_count += 1
                     
                 except Exception as e:
                     logger.error(f"Error handling missing LoRA {missing_lora_name}: {str(e)}")
-                    skipped_count += 1
+                    job.skipped_count += 1
 
+                job.record(missing_lora_name)
                 # Send progress update
-                progress = int(((processed_count + skipped_count) / total_count) * 100)
-                await PromptServer.instance.send_json("lora_process_progress", {
-                    "progress": progress,
-                    "completed": processed_count + skipped_count,
-                    "total": total_count
-                })
+                await job.send_progress()
 
         if LORA_CACHE.get('ordered_loras'):
-            # Get proper user settings
-            settings = PromptServer.instance.user_manager.settings.get_settings(request)
-            sort_metadata = await get_lora_sort_metadata()
-            
-            # Resort entire cache with proper settings
-            LORA_CACHE['ordered_loras'] = await sort_loras_with_categories(
-                LORA_CACHE['ordered_loras'],
-                settings,
-                processed_loras.get('favorites', []),
-                sort_metadata
-            )
+            # The cache and its counters were kept up to date as LoRAs finished
+            category_info = get_category_counts()
             
-            # Final category calculation with proper settings
-            category_info = manage_category_counts("calculate",
-                loras=LORA_CACHE['ordered_loras'],
-                settings=settings
-            )
-            
-            response_data = {
-                "status": "Processing complete",
-                "processed_count": processed_count,
+            job.result = {
+                "status": "Processing cancelled" if job.cancel_requested else "Processing complete",
+                "processed_count": job.processed_count,
                 "total_count": total_count,
-                "skipped_count": skipped_count,
+                "skipped_count": job.skipped_count,
                 "categoryInfo": category_info
             }
         else:
-            response_data = {
-                "status": "Processing complete",
-                "processed_count": processed_count,
+            job.result = {
+                "status": "Processing cancelled" if job.cancel_requested else "Processing complete",
+                "processed_count": job.processed_count,
                 "total_count": total_count,
-                "skipped_count": skipped_count
+                "skipped_count": job.skipped_count
             }
 
     finally:
-        is_processing = False  # Ensure flag is reset when processing finishes
-        LoraDataStore.clear_data()
-        # disable the refresh all setting after processing
-        setting_id = "LoRA Sidebar.General.refreshAll"
-        settings = PromptServer.instance.user_manager.settings.get_settings(request)
-        settings[setting_id] = False
-        PromptServer.instance.user_manager.settings.save_settings(request, settings)
-        refresh_setting = settings.get("LoRA Sidebar.General.refreshAll")
-        logger.info(f"Current refresh setting value: {refresh_setting}")
-
-    return web.json_response(response_data)
+        try:
+            PROCESSED_JOURNAL.compact()
+        except Exception as e:
+            logger.error(f"Error compacting processed_loras journal, it will be replayed next run: {str(e)}")
+        HASH_INDEX.save()
+        CACHE_SNAPSHOT.schedule()
+        logger.info(f"Response cache stats: {dict(RESPONSE_CACHE.stats)}")
 
 
 @PromptServer.instance.routes.get("/lora_sidebar/data")
 async def get_lora_data(request):
+    # Still warming up, tell the client to retry instead of starting a second build
+    if cache_warming_up():
+        return web.json_response({
+            "loading": True,
+            "loras": [],
+            "hasMore": False,
+            "completed": CACHE_WARMUP['completed'],
+            "total": CACHE_WARMUP['total']
+        }, status=503, headers={"Retry-After": "1"})
+
     # Get request parameters
     offset = int(request.query.get('offset', 0))
     limit = int(request.query.get('limit', 500))
@@ -1724,7 +3456,6 @@ async def get_lora_data(request):
     
     # Get settings and metadata
     settings = get_user_settings(request)
-    sort_metadata = await get_lora_sort_metadata()
 
     # Cache check if we need to rebuild/resort cache
     needs_resort = False
@@ -1756,6 +3487,25 @@ async def get_lora_data(request):
                 logger.info("Custom tags changed")
                 needs_resort = True
    
+    session_id, session = CLIENT_SESSIONS.get(request)
+    session_headers = {ClientSessions.HEADER: session_id}
+
+    # Continuation pages of a cursor are served from their snapshot, whatever happened to the cache since
+    cursor = request.query.get('cursor')
+    if cursor:
+        try:
+            snapshot_id, snapshot, position = VIEW_SNAPSHOTS.resolve(cursor)
+        except ValueError as e:
+            return web.json_response({"error": str(e), "expired": True}, status=409, headers=session_headers)
+        return snapshot_page_response(session, snapshot_id, snapshot, position, limit, session_headers)
+
+    # Nothing to rebuild or resort, a page we already encoded can go out as is
+    if not needs_rebuild and not needs_resort and cursor is None:
+        body = PAGE_CACHE.get(PAGE_CACHE.key(settings, offset, limit))
+        if body is not None:
+            mark_page_sent(session, offset, LORA_CACHE['ordered_loras'][offset:offset + limit])
+            return web.Response(body=body, content_type="application/json", headers=session_headers)
+
     # Load favorites
     favorites = []
     processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
@@ -1770,42 +3520,32 @@ async def get_lora_data(request):
     if needs_rebuild:
         lora_data = []
 
-        # Load LoRA data
-        all_folders = [folder for folder in os.listdir(LORA_DATA_DIR)
-                    if os.path.isdir(os.path.join(LORA_DATA_DIR, folder))]
-                    
-        for folder in all_folders:
-            info_file = os.path.join(LORA_DATA_DIR, folder, "info.json")
-            if os.path.exists(info_file):
-                with open(info_file, "r", encoding="utf-8") as f:
-                    try:
-                        data = json.load(f)
-                        data['id'] = folder
-                        data['favorite'] = folder in favorites
-                    
-                        # Add NSFW folder check
-                        nsfw_folder = settings.get('nsfwFolder', True)
-                        if nsfw_folder and 'path' in data:
-                            path_lower = data['path'].lower()
-                            nsfw_string = settings.get('nsfwString', 'NSFW').lower()
-                            if nsfw_string in path_lower:
-                                logger.info(f"Setting NSFW flag for {folder} due to path: {data['path']}")
-                                data['nsfw'] = True
-
-                        # Get filename and path
-                        if folder in LORA_FILE_INFO:
-                            data['filename'] = LORA_FILE_INFO[folder]['filename']
-                            data['path'] = LORA_FILE_INFO[folder]['path']
-                        else:
-                            data['filename'] = f"{folder}.safetensors"
-                            data['path'] = ""
-                        lora_data.append(data)
-                    except json.JSONDecodeError:
-                        logger.error(f"Error reading {info_file}. Skipping.")
+        # Load LoRA data, decoded on the bulk loader's threads
+        for folder, data in await BULK_LOADER.load_catalog():
+            data['id'] = folder
+            data['favorite'] = folder in favorites
+        
+            # Add NSFW folder check
+            nsfw_folder = settings.get('nsfwFolder', True)
+            if nsfw_folder and 'path' in data:
+                path_lower = data['path'].lower()
+                nsfw_string = settings.get('nsfwString', 'NSFW').lower()
+                if nsfw_string in path_lower:
+                    logger.info(f"Setting NSFW flag for {folder} due to path: {data['path']}")
+                    data['nsfw'] = True
+
+            # Get filename and path
+            if folder in LORA_FILE_INFO:
+                data['filename'] = LORA_FILE_INFO[folder]['filename']
+                data['path'] = LORA_FILE_INFO[folder]['path']
+            else:
+                data['filename'] = f"{folder}.safetensors"
+                data['path'] = ""
+            lora_data.append(data)
     
         # Pre-sort all data
-        ordered_loras = await sort_loras_with_categories(lora_data, settings, favorites, sort_metadata)
-        LORA_CACHE['ordered_loras'] = ordered_loras
+        sort_metadata = await get_lora_sort_metadata()
+        await resort_cache(lora_data, settings, favorites, sort_metadata)
 
         # After rebuild, update cache settings
         CACHE_SETTINGS.update({
@@ -1817,11 +3557,13 @@ async def get_lora_data(request):
             'nsfwFolder': settings.get('nsfwFolder', True),
             'nsfwString': settings.get("nsfwString", 'NSFW')
         })
+        CACHE_SNAPSHOT.schedule()
 
     elif needs_resort:
         logger.info("Resorting existing cache")
         # Just resort existing data
-        LORA_CACHE['ordered_loras'] = await sort_loras_with_categories(
+        sort_metadata = await get_lora_sort_metadata()
+        await resort_cache(
             LORA_CACHE['ordered_loras'], 
             settings, 
             favorites, 
@@ -1838,10 +3580,78 @@ async def get_lora_data(request):
             'nsfwFolder': settings.get('nsfwFolder', True),
             'nsfwString': settings.get("nsfwString", 'NSFW')
         })
+        CACHE_SNAPSHOT.schedule()
+
+    # Get all loras from cache
+    all_loras = LORA_CACHE.get('ordered_loras', [])
+    if DEBUG:
+        log_category_order(all_loras, settings)
+
+    if needs_rebuild:
+        CLIENT_SESSIONS.reset_all()
+
+    # ?cursor= (empty) starts cursor paging, pinned to a snapshot of the order as it is now
+    if cursor is not None:
+        snapshot_id, snapshot = VIEW_SNAPSHOTS.pin()
+        CLIENT_SESSIONS.reset(session)
+        return snapshot_page_response(session, snapshot_id, snapshot, 0, limit, session_headers, {
+            "favorites": favorites,
+            "categoryInfo": get_category_counts()
+        })
 
-    # Get all loras from cache
-    all_loras = LORA_CACHE.get('ordered_loras', [])
+    # Apply pagination
+    start_idx = offset
+    end_idx = offset + limit
+    paginated_loras = LORA_CACHE['ordered_loras'][start_idx:end_idx]
+    # Also debug print what's actually being sent in this chunk
+    logger.info(f"\nSending chunk from {start_idx} to {end_idx} ({len(paginated_loras)} items)")
+    logger.info("First 10 items in this chunk:")
+    for idx, lora in enumerate(paginated_loras[:10]):
+        logger.info(f"{idx + 1}. Category: {lora.get('category', 'Unknown')} | " 
+                   f"Name: {lora.get('name', lora.get('filename', 'Unknown'))} | "
+                   f"{'(Favorite)' if lora.get('favorite') else '(New)' if lora.get('is_new') else ''}")
+
+    mark_page_sent(session, offset, paginated_loras)
+
+    category_counts = get_category_counts()
+
+    # Encode once, repeats of this page are served from PAGE_CACHE until something changes
+    body = json.dumps({
+        "loras": paginated_loras,
+        "favorites": favorites if offset == 0 else [],
+        "hasMore": end_idx < len(LORA_CACHE['ordered_loras']),
+        "totalCount": len(LORA_CACHE['ordered_loras']),
+        "categoryInfo": category_counts
+    }).encode("utf-8")
+    PAGE_CACHE.put(PAGE_CACHE.key(settings, offset, limit), body)
+    return web.Response(body=body, content_type="application/json", headers=session_headers)
+
+def snapshot_page_response(session, snapshot_id, snapshot, position, limit, headers, extra=None):
+    """One page of a pinned snapshot with the cursor for the next one."""
+    loras = snapshot['loras']
+    end = position + limit
+    page = loras[position:end]
+    CLIENT_SESSIONS.mark_sent(session, page)
+    response_data = {
+        "loras": page,
+        "favorites": [],
+        "hasMore": end < len(loras),
+        "totalCount": len(loras),
+        "nextCursor": ViewSnapshots.encode_cursor(snapshot_id, end) if end < len(loras) else None,
+        # The cache changed since this snapshot, the client may want to reload once it is done
+        "stale": not VIEW_SNAPSHOTS.is_current(snapshot)
+    }
+    response_data.update(extra or {})
+    return web.json_response(response_data, headers=headers)
+
+def mark_page_sent(session, offset, paginated_loras):
+    """Track which LoRAs this client's sidebar has, starting over on an initial load."""
+    if offset == 0:
+        CLIENT_SESSIONS.reset(session)
+    CLIENT_SESSIONS.mark_sent(session, paginated_loras)
 
+def log_category_order(all_loras, settings):
+    """Debug output of the order categories are sent in."""
     # Separate loras into priority groups
     favorites_list = [lora for lora in all_loras if lora['favorite']]
     new_items = []
@@ -1909,40 +3719,6 @@ async def get_lora_data(request):
     logger.info("\nFirst 10 category loras being sent:")
     for idx, lora in enumerate(prioritized_loras[start_idx:start_idx+10]):
         logger.info(f"{idx + 1}. Category: {lora.get('category', 'Unknown')} | Name: {lora.get('name', lora.get('filename', 'Unknown'))}")
-    
-    # Apply pagination
-    start_idx = offset
-    end_idx = offset + limit
-    paginated_loras = LORA_CACHE['ordered_loras'][start_idx:end_idx]
-    # Also debug print what's actually being sent in this chunk
-    logger.info(f"\nSending chunk from {start_idx} to {end_idx} ({len(paginated_loras)} items)")
-    logger.info("First 10 items in this chunk:")
-    for idx, lora in enumerate(paginated_loras[:10]):
-        logger.info(f"{idx + 1}. Category: {lora.get('category', 'Unknown')} | " 
-                   f"Name: {lora.get('name', lora.get('filename', 'Unknown'))} | "
-                   f"{'(Favorite)' if lora.get('favorite') else '(New)' if lora.get('is_new') else ''}")
-
-    # Clear sent tracking on initial load
-    if offset == 0:
-        LORA_CACHE['sent_loras'] = set()
-    
-    # Track what we're sending
-    LORA_CACHE['sent_loras'].update(lora['id'] for lora in paginated_loras)
-
-    # Calculate category counts for all data
-    category_counts = manage_category_counts("calculate",
-        loras=all_loras,
-        paginated_loras=paginated_loras,
-        settings=settings
-    )
-   
-    return web.json_response({
-        "loras": paginated_loras,
-        "favorites": favorites if offset == 0 else [],
-        "hasMore": end_idx < len(LORA_CACHE['ordered_loras']),
-        "totalCount": len(LORA_CACHE['ordered_loras']),
-        "categoryInfo": category_counts
-    })
 
 
 @PromptServer.instance.routes.post("/lora_sidebar/toggle_favorite")
@@ -1951,8 +3727,9 @@ async def toggle_favorite(request):
     lora_id = data.get('id')
     logger.info(f"Toggle favorite request for LoRA ID: {lora_id}")
    
-    # Update processed_loras.json
+    # Update processed_loras.json, folding in the journal first so our rewrite can't be replayed over
     processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
+    PROCESSED_JOURNAL.compact()
     if os.path.exists(processed_loras_file):
         with open(processed_loras_file, "r", encoding="utf-8") as f:
             try:
@@ -1975,27 +3752,22 @@ async def toggle_favorite(request):
     else:
         processed_loras['favorites'].append(lora_id)
         logger.info(f"Added {lora_id} to favorites")
+    CATALOG.set_favorite(lora_id, not is_favorite)
 
-    # Get the lora's current category before updating
-    old_category = None
-    new_category = None
+    # Move the lora between count groups
     if LORA_CACHE['ordered_loras']:
-        for lora in LORA_CACHE['ordered_loras']:
-            if lora['id'] == lora_id:
-                old_category = 'Favorites' if is_favorite else lora['category']
-                new_category = lora['category'] if is_favorite else 'Favorites'
-                lora['favorite'] = not is_favorite
-                break
-
-    # Update category counts
-    category_info = manage_category_counts("update",
-        old_category=old_category,
-        new_category=new_category
-    )
+        lora = cache_get_lora(lora_id)
+        if lora is not None:
+            adjust_category_counts(lora, -1)
+            lora['favorite'] = not is_favorite
+            adjust_category_counts(lora, 1)
+            FACET_INDEX.add(lora)
+            CATEGORY_INDEX.add(lora)
+    category_info = get_category_counts()
+    CACHE_SNAPSHOT.schedule()
    
     # Save persistent data
-    with open(processed_loras_file, 'w', encoding="utf-8") as f:
-        json.dump(processed_loras, f, indent=4)
+    write_json_atomic(processed_loras_file, processed_loras)
    
     return web.json_response({
         "status": "success",
@@ -2050,30 +3822,24 @@ async def set_preview_image(request):
                 return web.json_response({"error": str(e)}, status=500)
         
         # Handle external URLs (original code for external images)
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url) as response:
-                if response.status == 200:
-                    content_type = response.headers.get('Content-Type', '')
-                    ext = mimetypes.guess_extension(content_type) or '.jpg'
-                    
-                    # Remove any existing preview files
-                    preview_dir = os.path.join(LORA_DATA_DIR, lora_id)
-                    for filepath in glob.glob(os.path.join(preview_dir, 'preview.*')):
+        async with HTTP_CLIENT as session:
+            # Stream the new preview in first, then remove the old one if its extension differs
+            preview_dir = os.path.join(LORA_DATA_DIR, lora_id)
+            # Picked by hand, keep it at full resolution, thumbnails are derived from it
+            preview_filename = await download_image(session, image_url, os.path.join(preview_dir, "preview"), width=None)
+            if preview_filename:
+                for filepath in glob.glob(os.path.join(preview_dir, 'preview.*')):
+                    if os.path.basename(filepath) != preview_filename:
                         os.remove(filepath)
-                    
-                    # Save the new preview image
-                    preview_path = os.path.join(preview_dir, f"preview{ext}")
-                    with open(preview_path, 'wb') as f:
-                        f.write(await response.read())
-                    
-                    # Generate a unique version for just this preview
-                    preview_version = str(int(time.time()))
-                    return web.json_response({
-                        "status": "success",
-                        "preview_version": preview_version
-                    })
-                else:
-                    return web.json_response({"error": "Failed to fetch image"}, status=400)
+                
+                # Generate a unique version for just this preview
+                preview_version = str(int(time.time()))
+                return web.json_response({
+                    "status": "success",
+                    "preview_version": preview_version
+                })
+            else:
+                return web.json_response({"error": "Failed to fetch image"}, status=400)
                     
     except Exception as e:
         logger.error(f"Error setting preview image: {str(e)}")
@@ -2082,7 +3848,6 @@ async def set_preview_image(request):
 @PromptServer.instance.routes.post("/lora_sidebar/refresh/{version_id}")
 async def refresh_lora(request):
     version_id = request.match_info['version_id']
-    processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
 
     # Define the standard field order
     STANDARD_FIELD_ORDER = [
@@ -2109,22 +3874,11 @@ async def refresh_lora(request):
         "user_edits"
     ]
 
-    async with aiohttp.ClientSession() as session:
+    async with HTTP_CLIENT as session:
         try:
-            # Find the existing LoRA folder based on version ID
-            existing_lora_folder = None
-            existing_info = None
-            base_filename = None
-            for folder in os.listdir(LORA_DATA_DIR):
-                info_file_path = os.path.join(LORA_DATA_DIR, folder, "info.json")
-                if os.path.exists(info_file_path):
-                    with open(info_file_path, "r", encoding="utf-8") as f:
-                        folder_info = json.load(f)
-                        if str(folder_info.get("versionId")) == str(version_id):
-                            existing_lora_folder = os.path.join(LORA_DATA_DIR, folder)
-                            existing_info = folder_info
-                            base_filename = folder
-                            break
+            # Find the existing LoRA by version ID, an indexed catalog lookup
+            base_filename, existing_info = CATALOG.find_by_version(version_id)
+            existing_lora_folder = os.path.join(LORA_DATA_DIR, base_filename) if base_filename else None
 
             if not existing_lora_folder or not existing_info:
                 logger.warning(f"LoRA with version ID {version_id} not found.")
@@ -2149,11 +3903,11 @@ async def refresh_lora(request):
                 
                 # Also get remote info for images if needed
                 if not version_info.get('images'):
-                    remote_info = await fetch_version_info_by_id(session, version_id)
+                    remote_info = await fetch_version_info_by_id(session, version_id, max_age=HTTP_CACHE_REFRESH_AGE)
                     if remote_info and remote_info.get('images'):
                         version_info['images'] = remote_info['images']
             else:
-                version_info = await fetch_version_info_by_id(session, version_id, skip_rate_limit=True)
+                version_info = await fetch_version_info_by_id(session, version_id, skip_rate_limit=True, max_age=HTTP_CACHE_REFRESH_AGE)
 
             # Initialize updates dictionary
             updates = {}
@@ -2164,7 +3918,7 @@ async def refresh_lora(request):
             # Only fetch model info if we need it and aren't using local metadata
             if model_id and not existing_info.get("local_metadata"):
                 logger.info(f"Fetching model info for model ID: {model_id}")
-                model_info = await fetch_model_info(session, model_id, skip_rate_limit=True)
+                model_info = await fetch_model_info(session, model_id, skip_rate_limit=True, max_age=HTTP_CACHE_REFRESH_AGE)
                 if model_info:
                     # Only update non-user-edited fields
                     if 'tags' not in user_edits and model_info.get('tags'):
@@ -2247,20 +4001,9 @@ async def refresh_lora(request):
                     updates['path'] = new_path
                     updates['subdir'] = new_subdir
                     
-                    # Update processed_loras.json with new path
-                    if os.path.exists(processed_loras_file):
-                        with open(processed_loras_file, 'r', encoding="utf-8") as f:
-                            processed_loras = json.load(f)
-                        
-                        # Update the path in processed_loras
-                        for lora in processed_loras.get('loras', []):
-                            if lora.get('filename') == base_filename:
-                                lora['path'] = new_path
-                                break
-                        
-                        processed_loras = validate_processed_loras(processed_loras)
-                        with open(processed_loras_file, 'w', encoding="utf-8") as f:
-                            json.dump(processed_loras, f, indent=4, ensure_ascii=False)
+                    # Update processed_loras.json with new path, through the journal so a running job's entries stay ordered
+                    PROCESSED_JOURNAL.append("path", base_filename, new_path)
+                    PROCESSED_JOURNAL.compact()
 
             #Check for and update date fields
             if version_info:
@@ -2299,20 +4042,19 @@ async def refresh_lora(request):
                         ordered_info[key] = existing_info[key]
                 
                 # Save updated information
-                info_file_path = os.path.join(existing_lora_folder, "info.json")
-                with open(info_file_path, "w", encoding="utf-8") as f:
-                    json.dump(ordered_info, f, indent=4, ensure_ascii=False)
+                CATALOG.put(base_filename, ordered_info)
 
                 # Update the cache using base_filename
                 if LORA_CACHE.get('ordered_loras'):
                     for item in LORA_CACHE['ordered_loras']:
                         if item['id'] == base_filename:
                             item.update(ordered_info)
+                            index_cache_entry(item)
                             break
+                    CACHE_SNAPSHOT.schedule()
                 
-                category_info = manage_category_counts("calculate",
-                    loras=LORA_CACHE['ordered_loras'],
-                )
+                # Refreshed info doesn't change the category, favorite or new status, so neither the counts
+                category_info = get_category_counts()
 
                 return web.json_response({
                     "status": "success", 
@@ -2338,18 +4080,15 @@ async def refresh_lora(request):
 async def refresh_lora(request):
     lora_id = request.match_info['lora_id']
     lora_folder = os.path.join(LORA_DATA_DIR, lora_id)
-    info_json_path = os.path.join(lora_folder, "info.json")
+    info_data = CATALOG.get(lora_id)
 
-    if not os.path.exists(info_json_path):
+    if info_data is None:
         return web.json_response({"status": "error", "message": "LoRA not found"}, status=404)
 
-    with open(info_json_path, "r", encoding="utf-8") as f:
-        info_data = json.load(f)
-
     model_id = info_data.get("modelId")
     version_id = info_data.get("versionId")
 
-    async with aiohttp.ClientSession() as session:
+    async with HTTP_CLIENT as session:
         try:
             # If no model or version ID, perform a hash lookup
             if not model_id or not version_id:
@@ -2362,8 +4101,8 @@ async def refresh_lora(request):
             else:
                 version_info = await fetch_version_info_by_id(session, version_id)
 
-            # Update info.json with refreshed data
-            # (Code to update the info.json with new data)
+            # Update the catalog with refreshed data
+            # (Code to update the catalog with new data)
 
             return web.json_response({"status": "success", "data": info_data})
 
@@ -2385,19 +4124,14 @@ async def update_lora_info(request):
                 "message": "Missing required parameters"
             }, status=400)
 
-        # Construct paths
-        lora_folder = os.path.join(LORA_DATA_DIR, lora_id)
-        info_file_path = os.path.join(lora_folder, "info.json")
+        # Read current info
+        info_data = CATALOG.get(lora_id)
        
-        if not os.path.exists(info_file_path):
+        if info_data is None:
             return web.json_response({
                 "status": "error",
-                "message": "LoRA info file not found"
+                "message": "LoRA info not found"
             }, status=404)
-       
-        # Read current info
-        with open(info_file_path, "r", encoding="utf-8") as f:
-            info_data = json.load(f)
            
         # Initialize user_edits if it doesn't exist
         if 'user_edits' not in info_data:
@@ -2415,25 +4149,29 @@ async def update_lora_info(request):
         if field not in info_data['user_edits']:
             info_data['user_edits'].append(field)
 
-        # Update in-memory cache before file write
+        # Update in-memory cache before the catalog write
         cache_updated = False
         if LORA_CACHE.get('ordered_loras'):
             for lora in LORA_CACHE['ordered_loras']:
                 if lora['id'] == lora_id:
+                    # favorite (or any field the count bucket reads) can move it to another group
+                    adjust_category_counts(lora, -1)
                     lora[field] = value
+                    adjust_category_counts(lora, 1)
                     if 'user_edits' not in lora:
                         lora['user_edits'] = []
                     if field not in lora['user_edits']:
                         lora['user_edits'].append(field)
+                    index_cache_entry(lora)
                     cache_updated = True
                     break
 
         # Save the updated info
         try:
-            with open(info_file_path, "w", encoding="utf-8") as f:
-                json.dump(info_data, f, indent=4, ensure_ascii=False)
+            CATALOG.put(lora_id, info_data)
+            CACHE_SNAPSHOT.schedule()
         except Exception as e:
-            logger.error(f"Error saving info file: {str(e)}")
+            logger.error(f"Error saving LoRA info: {str(e)}")
             if cache_updated:
                 return web.json_response({
                     "status": "warning",
@@ -2445,12 +4183,10 @@ async def update_lora_info(request):
                 })
             raise
 
-        # Recalculate category info if needed
+        # Send the counts along for fields the sidebar groups or filters by
         category_info = None
         if field in ['tags', 'baseModel', 'subdir', 'favorite', 'nsfw']:
-            category_info = manage_category_counts("calculate",
-                loras=LORA_CACHE['ordered_loras']
-            )
+            category_info = get_category_counts()
            
         # Prepare response data
         response_data = {
@@ -2536,22 +4272,20 @@ async def upload_lora_images(request):
                 }, status=400)
             
             # Add duplicate check for temp images
-            info_path = os.path.join(LORA_DATA_DIR, lora_id, "info.json")
-            if os.path.exists(info_path):
-                with open(info_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                    existing_sources = {img.get('source_url') for img in existing_data.get('images', []) 
-                                     if img.get('source_url')}
-                    # Only check the temp image URLs
-                    temp_urls = [url for url in urls if 'type=temp' in url]
-                    if any(url in existing_sources for url in temp_urls):
-                        return web.json_response({
-                            "status": "error",
-                            "message": "Image already added to this LoRA"
-                        }, status=400)
+            existing_data = CATALOG.get(lora_id)
+            if existing_data is not None:
+                existing_sources = {img.get('source_url') for img in existing_data.get('images', []) 
+                                 if img.get('source_url')}
+                # Only check the temp image URLs
+                temp_urls = [url for url in urls if 'type=temp' in url]
+                if any(url in existing_sources for url in temp_urls):
+                    return web.json_response({
+                        "status": "error",
+                        "message": "Image already added to this LoRA"
+                    }, status=400)
             
             images = []
-            async with aiohttp.ClientSession() as session:
+            async with HTTP_CLIENT as session:
                 for url in urls:
                     try:
                         # Validate URL
@@ -2639,12 +4373,9 @@ async def upload_lora_images(request):
                 "message": "No valid images or LoRA ID provided"
             }, status=400)
             
-        # Update info.json with new images
-        info_path = os.path.join(LORA_DATA_DIR, lora_id, "info.json")
-        if os.path.exists(info_path):
-            with open(info_path, 'r', encoding='utf-8') as f:
-                info_data = json.load(f)
-                
+        # Update the catalog with new images
+        info_data = CATALOG.get(lora_id)
+        if info_data is not None:
             # Preserve ALL existing images and add new ones
             existing_images = info_data.get('images', [])
             # Only filter out duplicates if they're custom images with the same name
@@ -2655,8 +4386,7 @@ async def upload_lora_images(request):
             
             info_data['images'] = existing_images + images
             
-            with open(info_path, 'w', encoding='utf-8') as f:
-                json.dump(info_data, f, indent=4, ensure_ascii=False)
+            CATALOG.put(lora_id, info_data)
             
             return web.json_response({
                 "status": "success",
@@ -2719,34 +4449,27 @@ async def delete_lora(request):
         return web.json_response({"status": "error", "message": "No LoRA ID provided"}, status=400)
     
     lora_folder = os.path.join(LORA_DATA_DIR, lora_id)
-    processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
     
     try:
-        # Remove the LoRA folder
+        # Remove the LoRA folder and catalog entry
         if os.path.exists(lora_folder):
             shutil.rmtree(lora_folder)
+        CATALOG.delete(lora_id)
         
-        # Update processed_loras.json
-        if os.path.exists(processed_loras_file):
-            with open(processed_loras_file, 'r', encoding="utf-8") as f:
-                processed_loras = json.load(f)
-            
-            # Remove from processed list using the new format
-            if 'loras' in processed_loras:
-                processed_loras['loras'] = [
-                    lora for lora in processed_loras['loras'] 
-                    if lora.get('filename') != lora_id
-                ]
-            
-            if 'favorites' in processed_loras:
-                processed_loras['favorites'] = [f for f in processed_loras['favorites'] if f != lora_id]
-            
-            # Write updated data back to file
-            with open(processed_loras_file, 'w', encoding="utf-8") as f:
-                json.dump(processed_loras, f, indent=4, ensure_ascii=False)
+        # Remove it from processed_loras.json through the journal, after any entries a running job has pending
+        PROCESSED_JOURNAL.append("remove", lora_id)
+        PROCESSED_JOURNAL.compact()
+
+        # Drop it from the cache and its indexes, category counts are adjusted by delta
+        cache_delete_lora(lora_id)
+        CACHE_SNAPSHOT.schedule()
         
         logger.info(f"Successfully deleted LoRA: {lora_id}")
-        return web.json_response({"status": "success", "message": f"LoRA {lora_id} deleted successfully"})
+        return web.json_response({
+            "status": "success",
+            "message": f"LoRA {lora_id} deleted successfully",
+            "categoryInfo": get_category_counts()
+        })
     
     except Exception as e:
         logger.error(f"Error deleting LoRA {lora_id}: {str(e)}")
@@ -2761,6 +4484,8 @@ async def set_processed_version(request):
         
         processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
         
+        PROCESSED_JOURNAL.compact()
+
         # Initialize with default structure if file doesn't exist
         if not os.path.exists(processed_loras_file):
             processed_loras = {
@@ -2777,8 +4502,7 @@ async def set_processed_version(request):
             processed_loras['version'] = 1 if use_old_version else PROCESSED_LORAS_VERSION
         
         # Write back the modified data
-        with open(processed_loras_file, 'w', encoding='utf-8') as f:
-            json.dump(processed_loras, f, indent=4, ensure_ascii=False)
+        write_json_atomic(processed_loras_file, processed_loras)
         
         return web.json_response({
             "status": "success",
@@ -2824,155 +4548,226 @@ def get_user_settings(request):
             'nsfwString': 'NSFW'
         }
 
-async def sort_loras_with_categories(loras, settings, favorites, sort_metadata):
+# Common date formats for date sorting
+DATE_FORMATS = [
+    '%Y-%m-%dT%H:%M:%S.%f%z',  # 2024-10-16T01:33:25.4734839+00:00
+    '%Y-%m-%dT%H:%M:%S.%f',    # 2024-10-16T01:33:25.473483
+    '%Y-%m-%d',                 # 2023-12-25
+    '%Y/%m/%d',                 # 2023/12/25
+    '%d-%m-%Y',                 # 25-12-2023
+    '%d/%m/%Y',                # 25/12/2023
+    '%m/%d/%Y',                # 12/25/2023 (US format)
+    '%Y-%m-%d %H:%M:%S',       # 2023-12-25 13:45:30
+    '%Y-%m-%dT%H:%M:%S',       # 2023-12-25T13:45:30
+    '%Y-%m-%dT%H:%M:%SZ',      # 2023-12-25T13:45:30Z
+    '%d-%b-%Y',                # 25-Dec-2023
+    '%d %b %Y',                # 25 Dec 2023
+    '%Y%m%d'                   # 20231225
+]
+
+def apply_lora_status(lora, settings, favorites, sort_metadata=None):
     """
-    Process loras with their real categories and status flags.
+    Set favorite/new flags, created_time and the real category for one LoRA.
     """
-    for lora in loras:
-        # Set status flags
-        lora['favorite'] = lora['id'] in favorites
+    # Set status flags
+    lora['favorite'] = lora['id'] in favorites
 
-        # auto data handling so people don't have to run updates on all their previous loras
-        creation_date = None
-        needs_update = False
+    # auto data handling so people don't have to run updates on all their previous loras
+    creation_date = None
+    needs_update = False
 
-        # Try metadata date first
-        if lora.get('createdDate') and lora['createdDate'] != 'unknown':
-            try:
-                creation_date = datetime.strptime(lora['createdDate'], '%Y-%m-%d')
-                # logger.debug(f"LoRA {lora.get('name', lora['id'])} using metadata date: {creation_date}")
-            except ValueError:
-                logger.debug(f"Invalid metadata date for {lora.get('name', lora['id'])}")
-                creation_date = None
-        
-        # If no valid metadata date, try sort_metadata cache first as it's faster
-        if not creation_date and sort_metadata and lora['id'] in sort_metadata:
-            creation_date = datetime.fromtimestamp(sort_metadata[lora['id']]['ctime'])
-            # logger.debug(f"Using sort_metadata date for {lora['id']}: {creation_date}")
-
-        # If still no date, check LoRA folder creation time
-        if not creation_date:
-            lora_folder = os.path.join(LORA_DATA_DIR, lora['id'])
-            try:
-                folder_stat = os.stat(lora_folder)
-                folder_date = datetime.fromtimestamp(folder_stat.st_ctime)
-                creation_date = folder_date
-                needs_update = True
-                # logger.debug(f"Using folder creation date for {lora['id']}: {creation_date}")
-            except Exception as e:
-                logger.error(f"Error getting folder date for {lora['id']}: {str(e)}")
+    # Try metadata date first
+    if lora.get('createdDate') and lora['createdDate'] != 'unknown':
+        try:
+            creation_date = datetime.strptime(lora['createdDate'], '%Y-%m-%d')
+            # logger.debug(f"LoRA {lora.get('name', lora['id'])} using metadata date: {creation_date}")
+        except ValueError:
+            logger.debug(f"Invalid metadata date for {lora.get('name', lora['id'])}")
+            creation_date = None
+    
+    # If no valid metadata date, try sort_metadata cache first as it's faster
+    if not creation_date and sort_metadata and lora['id'] in sort_metadata:
+        creation_date = datetime.fromtimestamp(sort_metadata[lora['id']]['ctime'])
+        # logger.debug(f"Using sort_metadata date for {lora['id']}: {creation_date}")
+
+    # If still no date, check LoRA folder creation time
+    if not creation_date:
+        lora_folder = os.path.join(LORA_DATA_DIR, lora['id'])
+        try:
+            folder_stat = os.stat(lora_folder)
+            folder_date = datetime.fromtimestamp(folder_stat.st_ctime)
+            creation_date = folder_date
+            needs_update = True
+            # logger.debug(f"Using folder creation date for {lora['id']}: {creation_date}")
+        except Exception as e:
+            logger.error(f"Error getting folder date for {lora['id']}: {str(e)}")
 
-        # Update info.json if we found a folder date
-        if needs_update and creation_date:
-            info_path = os.path.join(LORA_DATA_DIR, lora['id'], "info.json")
-            try:
-                with open(info_path, 'r', encoding='utf-8') as f:
-                    info_data = json.load(f)
-                info_data['createdDate'] = creation_date.strftime('%Y-%m-%d')
-                with open(info_path, 'w', encoding='utf-8') as f:
-                    json.dump(info_data, f, indent=4, ensure_ascii=False)
-                logger.info(f"Updated {lora['id']} info.json with folder date: {creation_date}")
-            except Exception as e:
-                logger.error(f"Error updating info.json date for {lora['id']}: {str(e)}")
-
-        # Store final timestamp and calculate new status
-        lora['created_time'] = creation_date.timestamp() if creation_date else FALLBACK_TIMESTAMP
-        hours_ago = datetime.now() - timedelta(hours=NEW_ITEM_HOURS)
-        lora['is_new'] = creation_date >= hours_ago if creation_date else False
-
-        # Assign real category
-        sort_models = settings.get('sortModels', 'All LoRAs')
-        if sort_models == 'Tags':
-            category = 'Unsorted'
-            if lora.get('tags', []):
-                for tag in get_tag_categories(settings):
-                    if tag in lora['tags']:
-                        category = tag
-                        break
-            lora['category'] = category
-        elif sort_models == 'Subdir':
-            lora['category'] = lora.get('subdir', '').split('\\')[-1] or 'Unsorted'
-        else:
-            lora['category'] = 'All LoRAs'
-
-    # Define sort key function
-    def sort_key(lora):
-        if settings['sortMethod'] == 'AlphaAsc':
-            name = lora.get('name') or lora.get('filename') or 'zzz'
-            return name.lower()
-        elif settings['sortMethod'] == 'AlphaDesc':
-            name = lora.get('name') or lora.get('filename') or '___'
-            return -ord(name[0].lower())
-        elif settings['sortMethod'] == 'DateNewest':
-            date_str = lora.get('createdDate', '1970-01-01')
-            if date_str in ('unknown', '1970-01-01'):
-                return FALLBACK_TIMESTAMP
-            
-            # Common date formats
-            formats = [
-                '%Y-%m-%dT%H:%M:%S.%f%z',  # 2024-10-16T01:33:25.4734839+00:00
-                '%Y-%m-%dT%H:%M:%S.%f',    # 2024-10-16T01:33:25.473483
-                '%Y-%m-%d',                 # 2023-12-25
-                '%Y/%m/%d',                 # 2023/12/25
-                '%d-%m-%Y',                 # 25-12-2023
-                '%d/%m/%Y',                # 25/12/2023
-                '%m/%d/%Y',                # 12/25/2023 (US format)
-                '%Y-%m-%d %H:%M:%S',       # 2023-12-25 13:45:30
-                '%Y-%m-%dT%H:%M:%S',       # 2023-12-25T13:45:30
-                '%Y-%m-%dT%H:%M:%SZ',      # 2023-12-25T13:45:30Z
-                '%d-%b-%Y',                # 25-Dec-2023
-                '%d %b %Y',                # 25 Dec 2023
-                '%Y%m%d'                   # 20231225
-            ]
-            
-            for fmt in formats:
-                try:
-                    timestamp = datetime.strptime(date_str, fmt).timestamp()
-                    return -timestamp
-                except (ValueError, OSError):
-                    continue
-                    
-            logger.error(f"Could not parse date for LoRA {lora.get('id', 'Unknown ID')}: {date_str}")
+    # Update the catalog if we found a folder date
+    if needs_update and creation_date:
+        try:
+            CATALOG.update(lora['id'], createdDate=creation_date.strftime('%Y-%m-%d'))
+            logger.info(f"Updated {lora['id']} catalog entry with folder date: {creation_date}")
+        except Exception as e:
+            logger.error(f"Error updating catalog date for {lora['id']}: {str(e)}")
+
+    # Store final timestamp and calculate new status
+    lora['created_time'] = creation_date.timestamp() if creation_date else FALLBACK_TIMESTAMP
+    hours_ago = datetime.now() - timedelta(hours=NEW_ITEM_HOURS)
+    lora['is_new'] = creation_date >= hours_ago if creation_date else False
+
+    # Assign real category
+    sort_models = settings.get('sortModels', 'All LoRAs')
+    if sort_models == 'Tags':
+        # The highest priority category tag the LoRA has, one rank lookup per tag of the LoRA
+        tag_ranks = get_tag_ranks(settings)
+        ranked = [tag_ranks[tag] for tag in lora.get('tags') or () if tag in tag_ranks]
+        lora['category'] = get_tag_categories(settings)[min(ranked)] if ranked else 'Unsorted'
+    elif sort_models == 'Subdir':
+        lora['category'] = lora.get('subdir', '').split('\\')[-1] or 'Unsorted'
+    else:
+        lora['category'] = 'All LoRAs'
+
+def get_lora_sort_key(lora, settings):
+    """Sort key for the sortMethod setting."""
+    if settings['sortMethod'] == 'AlphaAsc':
+        name = lora.get('name') or lora.get('filename') or 'zzz'
+        return name.lower()
+    elif settings['sortMethod'] == 'AlphaDesc':
+        name = lora.get('name') or lora.get('filename') or '___'
+        return -ord(name[0].lower())
+    elif settings['sortMethod'] == 'DateNewest':
+        date_str = lora.get('createdDate', '1970-01-01')
+        if date_str in ('unknown', '1970-01-01'):
             return FALLBACK_TIMESTAMP
-        else:  # DateOldest
-            date_str = lora.get('createdDate', '1970-01-01')
-            if date_str in ('unknown', '1970-01-01'):
-                return -FALLBACK_TIMESTAMP
+        
+        for fmt in DATE_FORMATS:
+            try:
+                timestamp = datetime.strptime(date_str, fmt).timestamp()
+                return -timestamp
+            except (ValueError, OSError):
+                continue
                 
-            for fmt in formats:
-                try: 
-                    timestamp = datetime.strptime(date_str, fmt).timestamp()
-                    return timestamp
-                except (ValueError, OSError):
-                    continue
-                    
-            logger.error(f"Could not parse date for LoRA {lora.get('id', 'Unknown ID')}: {date_str}")
+        logger.error(f"Could not parse date for LoRA {lora.get('id', 'Unknown ID')}: {date_str}")
+        return FALLBACK_TIMESTAMP
+    else:  # DateOldest
+        date_str = lora.get('createdDate', '1970-01-01')
+        if date_str in ('unknown', '1970-01-01'):
             return -FALLBACK_TIMESTAMP
+            
+        for fmt in DATE_FORMATS:
+            try: 
+                timestamp = datetime.strptime(date_str, fmt).timestamp()
+                return timestamp
+            except (ValueError, OSError):
+                continue
+                
+        logger.error(f"Could not parse date for LoRA {lora.get('id', 'Unknown ID')}: {date_str}")
+        return -FALLBACK_TIMESTAMP
 
-    # Sort based on settings
-    loras = sorted(loras, key=sort_key)
+def get_lora_order_key(lora, settings):
+    """
+    Full position key in the ordered cache: favorites first, then new items, then
+    everything else by sort key. The id breaks ties so every key is unique.
+    """
+    if lora['favorite']:
+        group = 0
+    elif lora['is_new'] and settings['catNew']:
+        group = 1
+    else:
+        group = 2
+    return (group, get_lora_sort_key(lora, settings), lora['id'])
 
-    # Order items for initial data packet (favorites/new first)
-    favorites_list = [lora for lora in loras if lora['favorite']]
-    new_items = []
-    if settings['catNew']:
-        new_items = [
-            lora for lora in loras 
-            if not lora['favorite'] and lora['is_new']
-        ]
-    
-    remaining_loras = [
-        lora for lora in loras 
-        if not lora['favorite'] and 
-        (not lora['is_new'] or not settings['catNew'])
-    ]
+async def sort_loras_with_categories(loras, settings, favorites, sort_metadata):
+    """
+    Process loras with their real categories and status flags.
+    """
+    favorites = set(favorites)
+    for index, lora in enumerate(loras, 1):
+        apply_lora_status(lora, settings, favorites, sort_metadata)
+        if index % WARMUP_YIELD_EVERY == 0:
+            await asyncio.sleep(0)
+
+    # Sort based on settings, favorites/new first for the initial data packet
+    return sorted(loras, key=lambda lora: get_lora_order_key(lora, settings))
+
+async def resort_cache(loras, settings, favorites, sort_metadata):
+    """Fully sort loras into the cache and rebuild the keys used for incremental updates."""
+    ordered = await sort_loras_with_categories(loras, settings, favorites, sort_metadata)
+    LORA_CACHE['ordered_loras'] = ordered
+    LORA_CACHE['sort_keys'] = [get_lora_order_key(lora, settings) for lora in ordered]
+    LORA_CACHE['key_by_id'] = dict(zip((lora['id'] for lora in ordered), LORA_CACHE['sort_keys']))
+    PAGE_CACHE.invalidate()
+    recount_category_counts()
+    await sync_cache_indexes(ordered)
+    return ordered
+
+def cache_remove_lora(lora_id):
+    """Remove one LoRA from the ordered cache by bisecting on its key. Returns the removed entry."""
+    key = LORA_CACHE['key_by_id'].pop(lora_id, None)
+    if key is None:
+        return None
+    PAGE_CACHE.invalidate()
+    keys = LORA_CACHE['sort_keys']
+    position = bisect.bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
+        unindex_cache_entry(lora_id)
+        return LORA_CACHE['ordered_loras'].pop(position)
+    logger.error(f"Sort index out of sync, {lora_id} not found at its key")
+    return None
 
-    return favorites_list + new_items + remaining_loras
+def cache_insert_lora(lora, settings, favorites):
+    """Insert one LoRA at its sorted position without resorting the whole cache."""
+    apply_lora_status(lora, settings, favorites)
+    key = get_lora_order_key(lora, settings)
+    position = bisect.bisect_right(LORA_CACHE['sort_keys'], key)
+    LORA_CACHE['sort_keys'].insert(position, key)
+    LORA_CACHE['ordered_loras'].insert(position, lora)
+    LORA_CACHE['key_by_id'][lora['id']] = key
+    PAGE_CACHE.invalidate()
+    index_cache_entry(lora, key)
+    return position
+
+def adjust_category_counts(lora, delta):
+    """Add or remove one LoRA from the live category counters, O(1) per change."""
+    category_counts = LORA_CACHE.get('category_info')
+    if category_counts is None:
+        category_counts = LORA_CACHE['category_info'] = {'Favorites': {'total': 0}, 'New': {'total': 0}}
+    bucket = category_count_bucket(lora)
+    counts = category_counts.setdefault(bucket, {'total': 0})
+    counts['total'] = max(0, counts.get('total', 0) + delta)
+    if not counts['total'] and bucket not in ('Favorites', 'New'):
+        del category_counts[bucket]
+
+def cache_upsert_lora(lora, settings, favorites):
+    """Replace or add a LoRA in the cache and update category counts by delta."""
+    removed = cache_remove_lora(lora['id'])
+    if removed is not None:
+        adjust_category_counts(removed, -1)
+    cache_insert_lora(lora, settings, favorites)
+    adjust_category_counts(lora, 1)
+
+def cache_delete_lora(lora_id):
+    """Drop a LoRA from the cache and update category counts by delta."""
+    removed = cache_remove_lora(lora_id)
+    if removed is not None:
+        adjust_category_counts(removed, -1)
+    return removed
+
+_last_build_progress = 0.0
 
 def show_build_progress(current, total, prefix='\033[1;34m[LoRA Sidebar]:\033[0m Building LoRA cache', width=50):
     """
-    Show a colorized progress bar with item count and percentage.
+    Show a colorized progress bar with item count and percentage, at most every BUILD_PROGRESS_INTERVAL seconds.
     """
+    global _last_build_progress
+    CACHE_WARMUP['completed'] = current
+    CACHE_WARMUP['total'] = total
+    now = time.monotonic()
+    if current != total and now - _last_build_progress < BUILD_PROGRESS_INTERVAL:
+        return
+    _last_build_progress = now
+
     try:
         percent = float(current) * 100 / total
         filled = int(width * current / total)
@@ -2993,6 +4788,742 @@ def show_build_progress(current, total, prefix='\033[1;34m[LoRA Sidebar]:\033[0m
         # Fallback to basic progress in case of any issues with colors
         print(f"\rBuilding cache: {current}/{total}", end='')
 
+def apply_nsfw_folder_flag(lora, settings):
+    """Flag a LoRA NSFW when one of its folders contains the NSFW folder string."""
+    if not settings.get('nsfwFolder', True) or not lora.get('path'):
+        return
+    nsfw_string = settings.get('nsfwString', 'NSFW').lower()
+    path_lower = lora['path'].lower()
+    if nsfw_string and nsfw_string in path_lower:
+        logger.info(f"Checking NSFW path for {lora.get('name')}: {path_lower}")
+        # Check only the path components, excluding the filename
+        path_parts = os.path.dirname(path_lower).split(os.sep)
+        if any(nsfw_string in part for part in path_parts):
+            logger.info(f"Setting NSFW flag for {lora.get('name', 'Unknown')} due to path: {path_parts}")
+            lora['nsfw'] = True
+            lora['nsfwLevel'] = 100
+
+class CacheSnapshot:
+    """
+    Pickled copy (protocol 5) of the sorted cache, its sort keys and category counts,
+    plus the catalog mtimes it was built from. Written on shutdown and a few seconds
+    after the cache changes, so startup is one file read instead of a full rebuild.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.handle = None
+
+    def save(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        if LORA_CACHE.get('ordered_loras') is None:
+            return
+        snapshot = {
+            "version": CACHE_SNAPSHOT_VERSION,
+            "info_version": PROCESSED_LORAS_VERSION,
+            "saved": time.time(),
+            "settings": dict(CACHE_SETTINGS),
+            "ordered_loras": LORA_CACHE['ordered_loras'],
+            "sort_keys": LORA_CACHE['sort_keys'],
+            "category_info": LORA_CACHE.get('category_info'),
+            "manifest": CATALOG.manifest()
+        }
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=5)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            logger.info(f"Saved cache snapshot with {len(snapshot['ordered_loras'])} LoRAs")
+        except Exception as e:
+            logger.error(f"Error saving cache snapshot: {str(e)}")
+
+    def schedule(self):
+        """Save once the cache has been quiet for CACHE_SNAPSHOT_DELAY seconds."""
+        if self.handle is not None:
+            self.handle.cancel()
+        self.handle = asyncio.get_running_loop().call_later(CACHE_SNAPSHOT_DELAY, self.save)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                snapshot = pickle.loads(f.read())
+        except Exception as e:
+            logger.error(f"Ignoring unreadable cache snapshot: {str(e)}")
+            return None
+        if snapshot.get("version") != CACHE_SNAPSHOT_VERSION or snapshot.get("info_version") != PROCESSED_LORAS_VERSION:
+            logger.info("Cache snapshot is from another version, rebuilding")
+            return None
+        return snapshot
+
+    async def on_shutdown(self, app):
+        self.save()
+
+CACHE_SNAPSHOT = CacheSnapshot(CACHE_SNAPSHOT_FILE)
+
+class LoraPageCache:
+    """
+    Encoded /lora_sidebar/data responses, LRU evicted. Keys carry our own generation (bumped on every
+    change to LORA_CACHE), the catalog generation and the settings profile, so a stale page is never hit.
+    """
+    PROFILE_KEYS = ('sortMethod', 'sortModels', 'tagSource', 'customTags', 'catNew', 'nsfwFolder', 'nsfwString')
+
+    def __init__(self, max_pages):
+        self.max_pages = max_pages
+        self.pages = OrderedDict()
+        self.generation = 0
+
+    def invalidate(self):
+        self.generation += 1
+        self.pages.clear()
+
+    def key(self, settings, offset, limit):
+        profile = json.dumps([settings.get(key) for key in self.PROFILE_KEYS])
+        return (self.generation, CATALOG.generation, profile, offset, limit)
+
+    def get(self, key):
+        body = self.pages.get(key)
+        if body is not None:
+            self.pages.move_to_end(key)
+        return body
+
+    def put(self, key, body):
+        self.pages[key] = body
+        self.pages.move_to_end(key)
+        while len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+
+PAGE_CACHE = LoraPageCache(PAGE_CACHE_SIZE)
+
+SEARCH_TOKEN_RE = re.compile(r"\w+")
+SEARCH_HTML_RE = re.compile(r"<[^>]+>")
+
+def search_tokens(text):
+    """Lowercase word tokens of a field value, descriptions have their HTML tags stripped first."""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple)):
+        return [token for item in text for token in search_tokens(item)]
+    return SEARCH_TOKEN_RE.findall(SEARCH_HTML_RE.sub(" ", str(text)).lower())
+
+def trigrams(token):
+    """Character trigrams of a word, padded so short words and word starts get their own."""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class SearchIndex:
+    """
+    In-memory inverted index over the cached LoRAs for /lora_sidebar/search. Postings map a token
+    to {lora_id: weight}, a sorted term list makes prefix lookups a bisect. Words of the fuzzy
+    fields are also indexed by trigram, so a misspelled query term finds them through a few set
+    lookups instead of a scan. Entries are replaced whole whenever their LoRA changes in the cache.
+    """
+    def __init__(self, field_weights, fuzzy_fields):
+        self.field_weights = field_weights
+        self.fuzzy_fields = fuzzy_fields
+        self.postings = {}
+        self.terms = []  # Sorted, for prefix matching
+        self.terms_stale = False  # Set during bulk syncs, the term list is re-sorted once on the next search
+        self.docs = {}  # lora_id -> the cached LoRA dict
+        self.doc_terms = {}  # lora_id -> {token: weight}, to remove an entry again
+        self.trigram_words = {}  # trigram -> words of the fuzzy fields containing it
+        self.fuzzy_words = {}  # word -> (number of LoRAs using it, its trigram count)
+        self.doc_fuzzy_words = {}
+
+    def _add_fuzzy(self, lora_id, lora):
+        words = {token for field in self.fuzzy_fields for token in search_tokens(lora.get(field))}
+        for word in words:
+            count, grams = self.fuzzy_words.get(word, (0, 0))
+            if count == 0:
+                word_trigrams = trigrams(word)
+                grams = len(word_trigrams)
+                for gram in word_trigrams:
+                    self.trigram_words.setdefault(gram, set()).add(word)
+            self.fuzzy_words[word] = (count + 1, grams)
+        self.doc_fuzzy_words[lora_id] = words
+
+    def _remove_fuzzy(self, lora_id):
+        for word in self.doc_fuzzy_words.pop(lora_id, ()):
+            count, grams = self.fuzzy_words[word]
+            if count > 1:
+                self.fuzzy_words[word] = (count - 1, grams)
+                continue
+            del self.fuzzy_words[word]
+            for gram in trigrams(word):
+                words = self.trigram_words.get(gram)
+                if words is not None:
+                    words.discard(word)
+                    if not words:
+                        del self.trigram_words[gram]
+
+    def _weights(self, lora):
+        weights = {}
+        for field, weight in self.field_weights.items():
+            for token in search_tokens(lora.get(field)):
+                weights[token] = max(weights.get(token, 0), weight)
+        return weights
+
+    def add(self, lora):
+        """Index a LoRA, replacing what was indexed for its id before."""
+        lora_id = lora['id']
+        self.remove(lora_id)
+        weights = self._weights(lora)
+        for token, weight in weights.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = {}
+                if not self.terms_stale:
+                    bisect.insort(self.terms, token)
+            posting[lora_id] = weight
+        self.docs[lora_id] = lora
+        self.doc_terms[lora_id] = weights
+        self._add_fuzzy(lora_id, lora)
+
+    def remove(self, lora_id):
+        self._remove_fuzzy(lora_id)
+        weights = self.doc_terms.pop(lora_id, None)
+        self.docs.pop(lora_id, None)
+        if not weights:
+            return
+        for token in weights:
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(lora_id, None)
+            if not posting:
+                del self.postings[token]
+                if self.terms_stale:
+                    continue
+                position = bisect.bisect_left(self.terms, token)
+                if position < len(self.terms) and self.terms[position] == token:
+                    del self.terms[position]
+
+    async def sync(self, loras):
+        """Bring the index in line with the cache, only (re)indexing entries that are new or were replaced."""
+        wanted = {lora['id'] for lora in loras}
+        self.terms_stale = True
+        for lora_id in [lora_id for lora_id in self.docs if lora_id not in wanted]:
+            self.remove(lora_id)
+        for index, lora in enumerate(loras, 1):
+            if self.docs.get(lora['id']) is not lora:
+                self.add(lora)
+            if index % WARMUP_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+    def _sorted_terms(self):
+        if self.terms_stale:
+            self.terms = sorted(self.postings)
+            self.terms_stale = False
+        return self.terms
+
+    def _match(self, term):
+        """{lora_id: score} for one query term, exact token matches plus prefix matches."""
+        self._sorted_terms()
+        scores = {}
+        position = bisect.bisect_left(self.terms, term)
+        while position < len(self.terms) and self.terms[position].startswith(term):
+            token = self.terms[position]
+            factor = 1 if token == term else SEARCH_PREFIX_FACTOR
+            for lora_id, weight in self.postings[token].items():
+                score = weight * factor
+                if score > scores.get(lora_id, 0):
+                    scores[lora_id] = score
+            position += 1
+        return scores
+
+    def _fuzzy_match(self, term):
+        """_match plus words whose trigram similarity to the term reaches SEARCH_FUZZY_THRESHOLD."""
+        scores = self._match(term)
+        term_trigrams = trigrams(term)
+        shared = Counter()
+        for gram in term_trigrams:
+            shared.update(self.trigram_words.get(gram, ()))
+        for word, common in shared.most_common(SEARCH_FUZZY_CANDIDATES):
+            similarity = 2 * common / (len(term_trigrams) + self.fuzzy_words[word][1])
+            if similarity < SEARCH_FUZZY_THRESHOLD:
+                continue
+            for lora_id, weight in self.postings[word].items():
+                score = weight * similarity
+                if score > scores.get(lora_id, 0):
+                    scores[lora_id] = score
+        return scores
+
+    def search(self, query, base_model=None, nsfw=None, fuzzy=False):
+        """
+        Ranked [(score, lora)], every query term has to match. An empty query returns everything.
+        In fuzzy mode a term also matches similarly spelled words of the fuzzy fields.
+        """
+        terms = search_tokens(query)
+        if terms:
+            match = self._fuzzy_match if fuzzy else self._match
+            # Rarest term first, so the intersection shrinks quickly
+            matches = sorted((match(term) for term in terms), key=len)
+            scores = dict(matches[0])
+            for term_scores in matches[1:]:
+                scores = {lora_id: score + term_scores[lora_id]
+                          for lora_id, score in scores.items() if lora_id in term_scores}
+        else:
+            scores = dict.fromkeys(self.docs, 0)
+
+        base_model = base_model.lower() if base_model else None
+        results = []
+        for lora_id, score in scores.items():
+            lora = self.docs[lora_id]
+            if base_model and (lora.get('baseModel') or '').lower() != base_model:
+                continue
+            if nsfw is not None and bool(lora.get('nsfw')) != nsfw:
+                continue
+            results.append((score, lora))
+        results.sort(key=lambda result: (-result[0], str(result[1].get('name') or result[1]['id']).lower()))
+        return results
+
+    def base_models(self):
+        """Indexed base models with their LoRA counts, for building the model filter."""
+        return dict(Counter(lora.get('baseModel') or 'Unknown' for lora in self.docs.values()).most_common())
+
+SEARCH_INDEX = SearchIndex(SEARCH_FIELD_WEIGHTS, SEARCH_FUZZY_FIELDS)
+
+def popcount(bitmap):
+    return bitmap.bit_count() if hasattr(bitmap, "bit_count") else bin(bitmap).count("1")
+
+def nsfw_level_bucket(level):
+    """CivitAI nsfwLevel is a bit field of image ratings, bucket it by the highest one set."""
+    try:
+        level = int(level or 0)
+    except (TypeError, ValueError):
+        level = 0
+    return str(1 << (level.bit_length() - 1)) if level > 0 else "0"
+
+class FacetIndex:
+    """
+    Bitmaps (Python ints) of the cached LoRAs for each facet value, so filters combine with AND/OR
+    instead of list scans. LoRAs get a stable slot bit that is reused after removal, positions in
+    ordered_loras shift on every insert so they can't be used directly.
+    """
+    FACETS = ('baseModel', 'nsfwLevel', 'category', 'tag', 'subdir', 'status')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.slots = {}  # lora_id -> slot
+        self.slot_ids = []  # slot -> lora_id, None when free
+        self.free_slots = []
+        self.all_bits = 0
+        self.bitmaps = {facet: {} for facet in self.FACETS}
+        self.doc_values = {}  # lora_id -> {facet: values}, to remove an entry again
+        self.count_cache = OrderedDict()  # (facet, bitmap, limit) -> counts
+
+    @staticmethod
+    def values(lora):
+        status = set()
+        if lora.get('favorite'):
+            status.add('favorite')
+        if lora.get('is_new'):
+            status.add('new')
+        if lora.get('nsfw'):
+            status.add('nsfw')
+        return {
+            'baseModel': {lora.get('baseModel') or 'Unknown'},
+            'nsfwLevel': {nsfw_level_bucket(lora.get('nsfwLevel'))},
+            'category': {str(lora.get('category', 'Unsorted'))},
+            'tag': {str(tag).lower() for tag in lora.get('tags') or []},
+            'subdir': {lora.get('subdir') or ''},
+            'status': status
+        }
+
+    def add(self, lora):
+        """Index a LoRA, replacing what was indexed for its id before."""
+        lora_id = lora['id']
+        self.remove(lora_id)
+        self.count_cache.clear()
+        slot = self.free_slots.pop() if self.free_slots else len(self.slot_ids)
+        if slot == len(self.slot_ids):
+            self.slot_ids.append(lora_id)
+        else:
+            self.slot_ids[slot] = lora_id
+        self.slots[lora_id] = slot
+
+        bit = 1 << slot
+        self.all_bits |= bit
+        values = self.values(lora)
+        for facet, facet_values in values.items():
+            bitmaps = self.bitmaps[facet]
+            for value in facet_values:
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+        self.doc_values[lora_id] = values
+
+    def remove(self, lora_id):
+        slot = self.slots.pop(lora_id, None)
+        if slot is None:
+            return
+        self.count_cache.clear()
+        mask = ~(1 << slot)
+        self.all_bits &= mask
+        for facet, facet_values in self.doc_values.pop(lora_id).items():
+            bitmaps = self.bitmaps[facet]
+            for value in facet_values:
+                bitmap = bitmaps[value] & mask
+                if bitmap:
+                    bitmaps[value] = bitmap
+                else:
+                    del bitmaps[value]
+        self.slot_ids[slot] = None
+        self.free_slots.append(slot)
+
+    async def rebuild(self, loras):
+        """Index the whole cache from scratch, setting bits in bytearrays and converting each bitmap once."""
+        self.clear()
+        size = (len(loras) + 7) // 8
+        bit_arrays = {facet: {} for facet in self.FACETS}
+        for slot, lora in enumerate(loras):
+            lora_id = lora['id']
+            self.slots[lora_id] = slot
+            self.slot_ids.append(lora_id)
+            values = self.values(lora)
+            self.doc_values[lora_id] = values
+            byte, bit = slot >> 3, 1 << (slot & 7)
+            for facet, facet_values in values.items():
+                arrays = bit_arrays[facet]
+                for value in facet_values:
+                    array = arrays.get(value)
+                    if array is None:
+                        array = arrays[value] = bytearray(size)
+                    array[byte] |= bit
+            if (slot + 1) % WARMUP_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+        for facet, arrays in bit_arrays.items():
+            self.bitmaps[facet] = {value: int.from_bytes(array, "little") for value, array in arrays.items()}
+        self.all_bits = (1 << len(loras)) - 1
+
+    def select(self, include=None, exclude=None):
+        """
+        Bitmap of the LoRAs matching every facet in include (any of its values) and none of the
+        values in exclude. Both map a facet to a list of values.
+        """
+        bitmap = self.all_bits
+        for facet, values in (include or {}).items():
+            bitmaps = self.bitmaps.get(facet, {})
+            union = 0
+            for value in values:
+                union |= bitmaps.get(value, 0)
+            bitmap &= union
+        for facet, values in (exclude or {}).items():
+            bitmaps = self.bitmaps.get(facet, {})
+            for value in values:
+                bitmap &= ~bitmaps.get(value, 0)
+        return bitmap
+
+    def ids(self, bitmap):
+        """LoRA ids of the set bits, in slot order."""
+        bits = bin(bitmap)[:1:-1]  # Lowest bit first
+        return [self.slot_ids[slot] for slot, bit in enumerate(bits) if bit == "1"]
+
+    def counts(self, bitmap, facet, limit=None):
+        """{value: count} within bitmap for one facet, largest first, cached until the index changes."""
+        key = (facet, bitmap, limit)
+        cached = self.count_cache.get(key)
+        if cached is not None:
+            self.count_cache.move_to_end(key)
+            return cached
+        counts = Counter()
+        for value, value_bitmap in self.bitmaps.get(facet, {}).items():
+            count = popcount(value_bitmap & bitmap)
+            if count:
+                counts[value] = count
+        result = self.count_cache[key] = dict(counts.most_common(limit))
+        while len(self.count_cache) > FACET_COUNT_CACHE_SIZE:
+            self.count_cache.popitem(last=False)
+        return result
+
+FACET_INDEX = FacetIndex()
+
+class CategoryIndex:
+    """
+    Order keys of each category's LoRAs in display order, so a category can be paged through with a
+    cursor instead of scanning the cache. Favorites and new items are shown in their own groups
+    and aren't members. The LoRA id is the last element of an order key, so keys are all we store.
+    """
+    def __init__(self):
+        self.keys = {}  # category -> sorted order keys
+        self.member_of = {}  # lora_id -> (category, key)
+        self.generation = 0  # Bumped on full rebuilds, cursors into an older order are refused
+
+    @staticmethod
+    def is_member(lora):
+        return not lora.get('favorite') and not lora.get('is_new')
+
+    def add(self, lora, key=None):
+        """Index a LoRA at key (its current order key by default), replacing its old position."""
+        self.remove(lora['id'])
+        if not self.is_member(lora):
+            return
+        key = key if key is not None else get_lora_order_key(lora, CACHE_SETTINGS)
+        category = lora.get('category', 'Unsorted')
+        bisect.insort(self.keys.setdefault(category, []), key)
+        self.member_of[lora['id']] = (category, key)
+
+    def remove(self, lora_id):
+        member = self.member_of.pop(lora_id, None)
+        if member is None:
+            return
+        category, key = member
+        keys = self.keys[category]
+        position = bisect.bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+        if not keys:
+            del self.keys[category]
+
+    async def rebuild(self, loras, keys):
+        """Index a full, already sorted cache, appending keeps every category list sorted."""
+        self.keys = {}
+        self.member_of = {}
+        self.generation += 1
+        for index, (lora, key) in enumerate(zip(loras, keys), 1):
+            if self.is_member(lora):
+                category = lora.get('category', 'Unsorted')
+                self.keys.setdefault(category, []).append(key)
+                self.member_of[lora['id']] = (category, key)
+            if index % WARMUP_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+    def count(self, category):
+        return len(self.keys.get(category, ()))
+
+    def encode_cursor(self, key):
+        return base64.urlsafe_b64encode(json.dumps([self.generation, list(key)]).encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, cursor):
+        """The key a cursor points after, None for the start. Raises ValueError for bad or expired cursors."""
+        if not cursor:
+            return None
+        try:
+            generation, key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            key = tuple(key)
+        except (TypeError, ValueError) as e:  # binascii.Error is a ValueError
+            raise ValueError(f"Invalid cursor: {str(e)}")
+        if generation != self.generation:
+            raise ValueError("Cursor expired, the LoRAs were resorted")
+        return key
+
+    def page(self, category, after=None, limit=500):
+        """(ids, next key or None) of up to limit members that come after the key."""
+        keys = self.keys.get(category, [])
+        start = bisect.bisect_right(keys, after) if after is not None else 0
+        page_keys = keys[start:start + limit]
+        next_key = page_keys[-1] if page_keys and start + limit < len(keys) else None
+        return [key[-1] for key in page_keys], next_key
+
+CATEGORY_INDEX = CategoryIndex()
+
+class ClientSessions:
+    """
+    Which LoRAs each sidebar connection has already received, so several tabs or users can page at
+    once without resetting or skipping each other's items. Delivered LoRAs are a bitset (an int)
+    over integer handles, which are only handed out afresh by reset_all when every bitset is empty.
+    Sessions expire after ttl idle seconds and the least recently used are dropped beyond limit.
+    """
+    HEADER = "X-Lora-Sidebar-Session"
+    ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+    def __init__(self, ttl, limit):
+        self.ttl = ttl
+        self.limit = limit
+        self.sessions = OrderedDict()  # session_id -> {'sent': bitset, 'last_seen': time}
+        self.handles = {}  # lora_id -> bit
+
+    def _handle(self, lora_id):
+        handle = self.handles.get(lora_id)
+        if handle is None:
+            handle = self.handles[lora_id] = len(self.handles)
+        return handle
+
+    def get(self, request):
+        """(session_id, session) for the request's session param or header, started if unknown or expired."""
+        session_id = request.query.get('session') or request.headers.get(self.HEADER) or ''
+        if not self.ID_RE.match(session_id):
+            session_id = uuid.uuid4().hex
+
+        now = time.time()
+        while self.sessions:
+            oldest_id, oldest = next(iter(self.sessions.items()))
+            if now - oldest['last_seen'] < self.ttl:
+                break
+            del self.sessions[oldest_id]
+
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.sessions[session_id] = {'sent': 0, 'last_seen': now}
+        session['last_seen'] = now
+        self.sessions.move_to_end(session_id)
+        while len(self.sessions) > self.limit:
+            self.sessions.popitem(last=False)
+        return session_id, session
+
+    def reset(self, session):
+        session['sent'] = 0
+
+    def reset_all(self):
+        """The cache was rebuilt, every client starts over."""
+        for session in self.sessions.values():
+            session['sent'] = 0
+        # No bitset refers to a handle anymore, drop the ones of deleted LoRAs so bitsets stay narrow
+        self.handles.clear()
+
+    def mark_sent(self, session, loras):
+        sent = session['sent']
+        for lora in loras:
+            sent |= 1 << self._handle(lora['id'])
+        session['sent'] = sent
+
+    def unsent(self, session, loras):
+        sent = session['sent']
+        return [lora for lora in loras if not (sent >> self._handle(lora['id'])) & 1]
+
+CLIENT_SESSIONS = ClientSessions(CLIENT_SESSION_TTL, CLIENT_SESSION_LIMIT)
+
+class ViewSnapshots:
+    """
+    Copies of the ordered cache that /lora_sidebar/data cursors point into, so a client paging
+    through the library never sees entries shift between pages when the cache changes. A copy
+    is only made when a cursor starts after the cache changed (PAGE_CACHE.generation is the view
+    generation), only the newest limit copies are kept.
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self.snapshots = OrderedDict()  # snapshot_id -> {'generation', 'loras'}
+        self.next_id = 0
+
+    def pin(self):
+        """(snapshot_id, snapshot) of the current order."""
+        if self.snapshots:
+            snapshot_id, snapshot = next(reversed(self.snapshots.items()))
+            if snapshot['generation'] == PAGE_CACHE.generation:
+                return snapshot_id, snapshot
+        snapshot_id = self.next_id
+        self.next_id += 1
+        snapshot = self.snapshots[snapshot_id] = {
+            'generation': PAGE_CACHE.generation,
+            'loras': list(LORA_CACHE['ordered_loras'] or [])
+        }
+        while len(self.snapshots) > self.limit:
+            self.snapshots.popitem(last=False)
+        return snapshot_id, snapshot
+
+    def is_current(self, snapshot):
+        return snapshot['generation'] == PAGE_CACHE.generation
+
+    @staticmethod
+    def encode_cursor(snapshot_id, position):
+        return base64.urlsafe_b64encode(json.dumps([snapshot_id, position]).encode("utf-8")).decode("ascii")
+
+    def resolve(self, cursor):
+        """(snapshot_id, snapshot, position) for a continuation cursor, raises ValueError if invalid or dropped."""
+        try:
+            snapshot_id, position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            position = int(position)
+        except (TypeError, ValueError) as e:  # binascii.Error is a ValueError
+            raise ValueError(f"Invalid cursor: {str(e)}")
+        snapshot = self.snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise ValueError("Cursor expired, the LoRA list changed too often since it was issued")
+        return snapshot_id, snapshot, position
+
+VIEW_SNAPSHOTS = ViewSnapshots(VIEW_SNAPSHOT_LIMIT)
+
+def index_cache_entry(lora, key=None):
+    """(Re)index one cached LoRA after it was inserted or changed in place."""
+    SEARCH_INDEX.add(lora)
+    FACET_INDEX.add(lora)
+    CATEGORY_INDEX.add(lora, key)
+
+def unindex_cache_entry(lora_id):
+    SEARCH_INDEX.remove(lora_id)
+    FACET_INDEX.remove(lora_id)
+    CATEGORY_INDEX.remove(lora_id)
+
+async def sync_cache_indexes(loras):
+    """After a full sort, categories and flags may have changed on every entry."""
+    await SEARCH_INDEX.sync(loras)
+    await FACET_INDEX.rebuild(loras)
+    await CATEGORY_INDEX.rebuild(loras, LORA_CACHE['sort_keys'])
+
+def cache_get_lora(lora_id):
+    """The cached entry for an id, found by bisecting on its order key."""
+    key = LORA_CACHE['key_by_id'].get(lora_id)
+    if key is None:
+        return None
+    position = bisect.bisect_left(LORA_CACHE['sort_keys'], key)
+    if position < len(LORA_CACHE['sort_keys']) and LORA_CACHE['sort_keys'][position] == key:
+        return LORA_CACHE['ordered_loras'][position]
+    return None
+
+def cache_ordered_ids(lora_ids):
+    """Ids sorted into the cache's display order."""
+    key_by_id = LORA_CACHE['key_by_id']
+    return sorted((lora_id for lora_id in lora_ids if lora_id in key_by_id), key=key_by_id.__getitem__)
+PromptServer.instance.app.on_shutdown.append(CACHE_SNAPSHOT.on_shutdown)
+
+def restore_cache_snapshot(snapshot, lora_entries, favorites):
+    """
+    Load the cache from a snapshot and re-read only LoRAs whose catalog row, path,
+    favorite or new status changed since. Returns False when a full rebuild is better.
+    """
+    paths = {entry['filename']: entry.get('path', '') for entry in lora_entries if entry.get('filename')}
+    manifest = CATALOG.manifest()
+    old_manifest = snapshot['manifest']
+    favorites = set(favorites)
+    new_cutoff = (datetime.now() - timedelta(hours=NEW_ITEM_HOURS)).timestamp()
+
+    wanted = {lora_id for lora_id in paths if lora_id in manifest}
+    cached = {lora['id']: lora for lora in snapshot['ordered_loras']}
+    removed = set(cached) - wanted
+    stale = {lora_id for lora_id in wanted
+             if lora_id not in cached or manifest[lora_id] != old_manifest.get(lora_id)}
+    for lora_id in wanted - stale:
+        lora = cached[lora_id]
+        if (lora['favorite'] != (lora_id in favorites)
+                or lora.get('path') != paths[lora_id]
+                or (lora['is_new'] and lora['created_time'] < new_cutoff)):
+            stale.add(lora_id)
+
+    if len(stale) > len(wanted) * CACHE_SNAPSHOT_MAX_STALE:
+        logger.info(f"{len(stale)} of {len(wanted)} LoRAs changed since the snapshot, rebuilding")
+        return False
+
+    CACHE_SETTINGS.update(snapshot['settings'])
+    LORA_CACHE['ordered_loras'] = snapshot['ordered_loras']
+    LORA_CACHE['sort_keys'] = snapshot['sort_keys']
+    LORA_CACHE['key_by_id'] = dict(zip(cached, snapshot['sort_keys']))
+    LORA_CACHE['category_info'] = snapshot['category_info']
+    if LORA_CACHE['category_info'] is None:
+        recount_category_counts()
+    PAGE_CACHE.invalidate()
+
+    # Counters came with the snapshot, the deletes and upserts adjust them by delta
+    for lora_id in removed | stale:
+        cache_delete_lora(lora_id)
+    for lora_id in stale:
+        data = CATALOG.get(lora_id)
+        if data is None:
+            continue
+        data['id'] = lora_id
+        data['favorite'] = lora_id in favorites
+        data['filename'] = lora_id
+        data['path'] = paths[lora_id]
+        apply_nsfw_folder_flag(data, CACHE_SETTINGS)
+        cache_upsert_lora(data, CACHE_SETTINGS, favorites)
+
+    logger.info(f"Restored cache snapshot, {len(stale)} LoRAs re-read and {len(removed)} removed")
+    if stale or removed:
+        CACHE_SNAPSHOT.save()
+    return True
+
 async def build_initial_cache():
     """
     Build the initial LoRA cache on startup using processed_loras.json.
@@ -3003,8 +5534,9 @@ async def build_initial_cache():
     PLUGIN_PREFIX = "\033[1;34m[LoRA Sidebar]:\033[0m "
     
     try:
-        # Load processed_loras.json first
-        processed_loras_file = os.path.join(LORA_DATA_DIR, "processed_loras.json")
+        # Load processed_loras.json first, including anything a killed run left in the journal
+        processed_loras_file = PROCESSED_LORAS_FILE
+        PROCESSED_JOURNAL.compact()
         if not os.path.exists(processed_loras_file):
             logger.warning("No processed_loras.json found - cache will be built on first /data request")
             print(f"\n{PLUGIN_PREFIX}{ANSI_COLORS['YELLOW']}{get_completion_message(0)}{ANSI_COLORS['ENDC']}")
@@ -3032,6 +5564,19 @@ async def build_initial_cache():
         total_loras = len(lora_entries)
         processed = 0
         lora_data = []
+        CATALOG.sync_favorites(favorites)
+
+        # Fast path, load the last snapshot and re-read only what changed since
+        snapshot = CACHE_SNAPSHOT.load()
+        if snapshot is not None and restore_cache_snapshot(snapshot, lora_entries, favorites):
+            await sync_cache_indexes(LORA_CACHE['ordered_loras'])
+            duration = (datetime.now() - start_time).total_seconds()
+            print(f"{PLUGIN_PREFIX}LoRA cache loaded from snapshot in{ANSI_COLORS['CYAN']} {duration:.2f} seconds{ANSI_COLORS['ENDC']}")
+            print(f"{PLUGIN_PREFIX}{ANSI_COLORS['BOLD']}{ANSI_COLORS['YELLOW']}{get_completion_message(total_loras)}{ANSI_COLORS['ENDC']}\n")
+            return
+
+        # One catalog query instead of an info.json read per LoRA, decoded on the bulk loader's threads
+        catalog = dict(await BULK_LOADER.load_catalog())
 
         # Process each LoRA from processed_loras.json
         for lora_entry in lora_entries:
@@ -3039,51 +5584,29 @@ async def build_initial_cache():
             if not base_filename:
                 continue
 
-            info_file = os.path.join(LORA_DATA_DIR, base_filename, "info.json")
-            if os.path.exists(info_file):
-                with open(info_file, "r", encoding="utf-8") as f:
-                    try:
-                        data = json.load(f)
-                        data['id'] = base_filename
-                        data['favorite'] = base_filename in favorites
-                        data['filename'] = base_filename
-                        data['path'] = lora_entry.get('path', '')
-                        lora_data.append(data)
-                    except json.JSONDecodeError:
-                        logger.error(f"Error reading {info_file}")
+            data = catalog.get(base_filename)
+            if data is not None:
+                data['id'] = base_filename
+                data['favorite'] = base_filename in favorites
+                data['filename'] = base_filename
+                data['path'] = lora_entry.get('path', '')
+                lora_data.append(data)
 
             processed += 1
             show_build_progress(processed, total_loras)
+            if processed % WARMUP_YIELD_EVERY == 0:
+                await asyncio.sleep(0)  # Let the server handle requests while we build
 
         # Sort and store in cache
         if lora_data:
             # Process NSFW folder flags before sorting
-            if CACHE_SETTINGS.get('nsfwFolder', True):
-                nsfw_string = CACHE_SETTINGS.get('nsfwString', 'NSFW').lower()
-                logger.info(f"Setting NSFW string {nsfw_string}")
-                for lora in lora_data:
-                    if lora.get('path'):
-                        path_lower = lora['path'].lower()
-                        if nsfw_string and nsfw_string in path_lower:
-                            logger.info(f"Checking NSFW path for {lora.get('name')}: {path_lower}")
-                            # Check only the path components, excluding the filename
-                            path_parts = os.path.dirname(path_lower).split(os.sep)
-                            if any(nsfw_string in part for part in path_parts):
-                                logger.info(f"Setting NSFW flag for {lora.get('name', 'Unknown')} due to path: {path_parts}")
-                                lora['nsfw'] = True
-                                lora['nsfwLevel'] = 100
+            for lora in lora_data:
+                apply_nsfw_folder_flag(lora, CACHE_SETTINGS)
 
             sort_metadata = await get_lora_sort_metadata()
-            LORA_CACHE['ordered_loras'] = await sort_loras_with_categories(
-                lora_data, CACHE_SETTINGS, favorites, sort_metadata
-            )
-            LORA_CACHE['sent_loras'] = set()  # Reset sent tracking
-            
-            # Calculate initial category counts
-            manage_category_counts("calculate",
-                loras=LORA_CACHE['ordered_loras'],
-                settings=CACHE_SETTINGS
-            )
+            await resort_cache(lora_data, CACHE_SETTINGS, favorites, sort_metadata)
+            CLIENT_SESSIONS.reset_all()  # Reset sent tracking
+            CACHE_SNAPSHOT.save()
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -3103,18 +5626,35 @@ async def get_category_items(request):
    
     if not LORA_CACHE['ordered_loras']:
         return web.json_response({"error": "No LoRA data loaded"}, status=400)
+
+    session_id, session = CLIENT_SESSIONS.get(request)
+    session_headers = {ClientSessions.HEADER: session_id}
+
+    # Cursor paging, ?cursor= (empty) starts at the beginning of the category
+    if 'cursor' in request.query:
+        try:
+            after = CATEGORY_INDEX.decode_cursor(request.query['cursor'])
+        except ValueError as e:
+            return web.json_response({"error": str(e), "expired": True}, status=409)
+
+        page_ids, next_key = CATEGORY_INDEX.page(category_name, after, limit)
+        page_items = [lora for lora in map(cache_get_lora, page_ids) if lora]
+        unsent_items = CLIENT_SESSIONS.unsent(session, page_items)
+        CLIENT_SESSIONS.mark_sent(session, unsent_items)
+        return web.json_response({
+            "category_ids": page_ids,
+            "items": unsent_items,
+            "total": CATEGORY_INDEX.count(category_name),
+            "nextCursor": CATEGORY_INDEX.encode_cursor(next_key) if next_key is not None else None,
+            "hasMore": next_key is not None
+        }, headers=session_headers)
        
-    # Get all items for this category
-    category_items = [
-        lora for lora in LORA_CACHE['ordered_loras']
-        if lora['category'] == category_name and not lora.get('favorite', False) and not lora.get('is_new', False)
-    ]
+    # Get all items for this category, favorites and new items are listed in their own groups
+    category_ids, _ = CATEGORY_INDEX.page(category_name, limit=CATEGORY_INDEX.count(category_name))
+    category_items = [lora for lora in map(cache_get_lora, category_ids) if lora]
 
     # Check for any unsent items
-    unsent_items = [
-        lora for lora in category_items 
-        if lora['id'] not in LORA_CACHE['sent_loras']
-    ]
+    unsent_items = CLIENT_SESSIONS.unsent(session, category_items)
 
     # Get all category IDs
     category_ids = [lora['id'] for lora in category_items]
@@ -3127,27 +5667,126 @@ async def get_category_items(request):
     # If we found any unsent items, include them too
     if unsent_items:
         items_to_send = unsent_items[:limit]
-        LORA_CACHE['sent_loras'].update(lora['id'] for lora in items_to_send)
+        CLIENT_SESSIONS.mark_sent(session, items_to_send)
         response_data["items"] = items_to_send
         response_data["hasMore"] = len(unsent_items) > len(items_to_send)
         print(f"Category {category_name}: Found {len(items_to_send)} unsent items")
 
+    return web.json_response(response_data, headers=session_headers)
+
+@PromptServer.instance.routes.get("/lora_sidebar/facets")
+async def get_facets(request):
+    """
+    Combined facet filters answered from FACET_INDEX bitmaps. Each facet name (baseModel, nsfwLevel,
+    category, tag, subdir, status) can be given several times, values of one facet are ORed and
+    facets are ANDed. not_<facet> excludes values. Returns the match count, the per value counts
+    within the matches for the facets named in counts (all of them when omitted, none with
+    counts=none) and, with ids=true, a page of matching ids in display order.
+    """
+    if cache_warming_up():
+        return web.json_response({"loading": True, "total": 0}, status=503, headers={"Retry-After": "1"})
+
+    include = {facet: request.query.getall(facet) for facet in FacetIndex.FACETS if facet in request.query}
+    exclude = {facet: request.query.getall(f"not_{facet}") for facet in FacetIndex.FACETS
+               if f"not_{facet}" in request.query}
+    try:
+        facet_limit = int(request.query.get('facet_limit', 50))
+        offset = max(0, int(request.query.get('offset', 0)))
+        limit = max(1, int(request.query.get('limit', 500)))
+    except ValueError:
+        return web.json_response({"error": "facet_limit, offset and limit must be integers"}, status=400)
+
+    count_facets = [facet for value in request.query.getall('counts', []) for facet in value.split(',')]
+    if not count_facets:
+        count_facets = FacetIndex.FACETS
+    unknown = [facet for facet in count_facets if facet not in FacetIndex.FACETS and facet != 'none']
+    if unknown:
+        return web.json_response({"error": f"Unknown facets: {', '.join(unknown)}"}, status=400)
+
+    bitmap = FACET_INDEX.select(include, exclude)
+    response_data = {
+        "total": popcount(bitmap),
+        "counts": {facet: FACET_INDEX.counts(bitmap, facet, facet_limit)
+                   for facet in FacetIndex.FACETS if facet in count_facets}
+    }
+    if request.query.get('ids', '').lower() in ('1', 'true', 'yes'):
+        ordered_ids = cache_ordered_ids(FACET_INDEX.ids(bitmap))
+        response_data["ids"] = ordered_ids[offset:offset + limit]
+        response_data["hasMore"] = offset + limit < len(ordered_ids)
     return web.json_response(response_data)
 
+@PromptServer.instance.routes.get("/lora_sidebar/search")
+async def search_loras(request):
+    """
+    Ranked search over every cached LoRA, so search doesn't have to wait for the sidebar to load them all.
+    Query params: q, mode (exact or fuzzy), offset, limit, base_model, nsfw (true/false, omit for both).
+    """
+    if cache_warming_up():
+        return web.json_response({"loading": True, "results": [], "total": 0},
+                                 status=503, headers={"Retry-After": "1"})
+
+    query = request.query.get('q', '')
+    try:
+        offset = max(0, int(request.query.get('offset', 0)))
+        limit = max(1, min(SEARCH_MAX_LIMIT, int(request.query.get('limit', 100))))
+    except ValueError:
+        return web.json_response({"error": "offset and limit must be integers"}, status=400)
+    nsfw = request.query.get('nsfw')
+    nsfw = None if nsfw is None else nsfw.lower() in ('1', 'true', 'yes')
+
+    fuzzy = request.query.get('mode', 'exact') == 'fuzzy'
+
+    start = time.perf_counter()
+    results = SEARCH_INDEX.search(query, base_model=request.query.get('base_model'), nsfw=nsfw, fuzzy=fuzzy)
+    logger.info(f"Search {query!r} ({'fuzzy' if fuzzy else 'exact'}): {len(results)} results in "
+                f"{(time.perf_counter() - start) * 1000:.1f}ms")
+    page = results[offset:offset + limit]
+    return web.json_response({
+        "results": [dict(lora, score=score) for score, lora in page],
+        "total": len(results),
+        "hasMore": offset + limit < len(results),
+        "baseModels": SEARCH_INDEX.base_models() if offset == 0 else None
+    })
+
 ##### Initial loading stuff
 
-print(f"\n\033[1;34m[LoRA Sidebar]:\033[0m Starting initial cache build...")
+async def warm_up_cache():
+    """Build the cache in the background so ComfyUI starts without waiting on it."""
+    print(f"\n\033[1;34m[LoRA Sidebar]:\033[0m Starting initial cache build...")
+    CACHE_WARMUP['status'] = 'building'
+    CACHE_WARMUP['started'] = time.time()
+    try:
+        await build_initial_cache()
+        CACHE_WARMUP['status'] = 'ready'
+    except Exception as e:
+        CACHE_WARMUP['status'] = 'failed'
+        CACHE_WARMUP['error'] = str(e)
+        print(f"\033[91m[LoRA Sidebar]: Error building cache: {str(e)}\033[0m")
+    finally:
+        CACHE_WARMUP['finished'] = time.time()
+
+    # Only now, so a resumed job adds its LoRAs to the finished cache
+    await PROCESSING_JOBS.resume()
 
-# Create and run a new event loop to execute our async cache builder
-try:
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(build_initial_cache())
-    loop.close()
-except Exception as e:
-    print(f"\033[91m[LoRA Sidebar]: Error building cache: {str(e)}\033[0m")
+_warmup_task = None
 
+async def start_cache_warmup(app):
+    """on_startup hook, the task is kept referenced so it isn't collected mid-build."""
+    global _warmup_task
+    _warmup_task = asyncio.ensure_future(warm_up_cache())
 
+PromptServer.instance.app.on_startup.append(start_cache_warmup)
+
+def cache_warming_up():
+    return CACHE_WARMUP['status'] in ('pending', 'building')
+
+@PromptServer.instance.routes.get("/lora_sidebar/ready")
+async def get_ready_status(request):
+    """Whether the startup cache warmup has finished, with its progress while it runs."""
+    return web.json_response({
+        "ready": CACHE_WARMUP['status'] in ('ready', 'failed'),
+        **CACHE_WARMUP
+    })
 
 NODE_CLASS_MAPPINGS = {}
 NODE_DISPLAY_NAME_MAPPINGS = {}
@@ -37,6 +37,8 @@ class LoraSidebar {
         this.minSize = 100;
         this.maxSize = 400;
         this.loadingDelay = 800; // continuous loading delay
+        this.maxCursorRestarts = 3; // reloads after an expired list cursor before giving up on cursors
+        this.nextCursor = null; // where scroll paging continues the pinned LoRA list
         this.initialIndex = 500;
         this.searchDelay = 150;
         this.searchTimeout = null;
@@ -55,6 +57,7 @@ class LoraSidebar {
         this.sortModels = app.ui.settings.getSettingValue("LoRA Sidebar.General.sortModels", 'None');
         this.modelFilter = this.state.modelFilter || this.savedModelFilter;
         this.modelFilterDropdown = this.createModelFilterDropdown();
+        this.sessionId = null;
         this.currentSearchInput = this.state.searchTerm ? this.state.searchTerm.split(/\s+/) : [];
         this.PREDEFINED_TAGS = [
             "character", "style", "celebrity", "concept", "clothing", "poses", 
@@ -644,13 +647,17 @@ class LoraSidebar {
     async processLoras() {
         this.progressBar.style.display = 'block';
         try {
-            const response = await api.fetchApi('/lora_sidebar/process');
-            if (response.ok) {
-                const result = await response.json();
-                debug.log("LoRAs processed successfully", result);
-            } else {
-                console.error("Error processing LoRAs:", response.status, response.statusText);
+            // The backend refuses to start a job until its cache warmup is done
+            await this.waitForCacheReady();
+            const response = await api.fetchApi('/lora_sidebar/process/start', { method: 'POST' });
+            const job = await response.json();
+            // 409 means a job is already running (maybe resumed after a restart), just follow that one
+            if (!job.job_id) {
+                console.error("Error processing LoRAs:", response.status, job.message || response.statusText);
+                return;
             }
+            const result = await this.waitForProcessingJob(job.job_id);
+            debug.log(`LoRA processing ${result.status}`, result);
         } catch (error) {
             console.error("Error processing LoRAs:", error);
         } finally {
@@ -658,6 +665,21 @@ class LoraSidebar {
         }
     }
 
+    async waitForProcessingJob(jobId, interval = 2000) {
+        // Progress itself arrives over the lora_process_progress event, this only waits for the end
+        while (true) {
+            const response = await api.fetchApi(`/lora_sidebar/process/status/${jobId}`);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const job = await response.json();
+            if (['completed', 'cancelled', 'failed'].includes(job.status)) {
+                return job;
+            }
+            await new Promise(resolve => setTimeout(resolve, interval));
+        }
+    }
+
     createLoadingOverlay() {
         const overlay = $el("div.loading-overlay", {
             style: {
@@ -820,18 +842,64 @@ class LoraSidebar {
         return 'All LoRAs';
     }
 
-    async loadLoraData(offset = 0, limit = this.batchSize) {
+    sessionParams() {
+        // The backend tracks what each sidebar already received under this id
+        return this.sessionId ? { session: this.sessionId } : {};
+    }
+
+    updateSession(response) {
+        const sessionId = response.headers.get('X-Lora-Sidebar-Session');
+        if (sessionId) {
+            this.sessionId = sessionId;
+        }
+    }
+
+    async waitForCacheReady(interval = 1000) {
+        // The backend builds its cache in the background after startup
+        while (true) {
+            const response = await api.fetchApi('/lora_sidebar/ready');
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const status = await response.json();
+            if (status.ready) {
+                return status;
+            }
+            debug.log(`Waiting for LoRA cache: ${status.completed}/${status.total}`);
+            await new Promise(resolve => setTimeout(resolve, interval));
+        }
+    }
+
+    async loadLoraData(offset = 0, limit = this.batchSize, restarts = 0) {
         try {
+            if (offset === 0) {
+                await this.waitForCacheReady();
+            }
+            if (offset > 0 && !this.nextCursor) {
+                // Everything the cursor covered is already loaded
+                return;
+            }
             const sortPreference = this.SorthMethod || 'AlphaAsc';
+            // Loads are paged with a cursor, so the list can't shift under us between pages. If the
+            // cursor kept expiring, fall back to one plain request for the whole list.
+            const plainReload = restarts > this.maxCursorRestarts;
             const url = `/lora_sidebar/data?` + new URLSearchParams({
-                offset: offset,
+                ...(plainReload ? { offset: 0 } : { cursor: offset === 0 ? '' : this.nextCursor }),
                 limit: limit,
                 sort: sortPreference,
                 nsfw_folder: this.nsfwFolder,
-                nsfw_string: this.nsfwString
+                nsfw_string: this.nsfwString,
+                ...this.sessionParams()
             });
     
             const response = await api.fetchApi(url);
+            this.updateSession(response);
+            if (response.status === 409 && offset > 0) {
+                // The snapshot scroll paging continued was dropped, load the list again from the start
+                debug.log("LoRA list cursor expired, reloading");
+                const restartLimit = restarts < this.maxCursorRestarts ? this.batchSize : (this.totalCount || this.batchSize);
+                return this.loadLoraData(0, restartLimit, restarts + 1);
+            }
             if (response.ok) {
                 const data = await response.json();
                 if (data && data.loras) {
@@ -870,60 +938,71 @@ class LoraSidebar {
                         }
     
                         // Only continue loading if there's more data
-                        if (data.hasMore) {
-                            let currentOffset = limit;
+                        this.nextCursor = null;
+                        if (data.hasMore && data.nextCursor) {
+                            let nextCursor = data.nextCursor;
                             let hasMore = data.hasMore;
                             
                             while (hasMore) {
                                 const nextUrl = `/lora_sidebar/data?` + new URLSearchParams({
-                                    offset: currentOffset,
+                                    cursor: nextCursor,
                                     limit: limit,
                                     sort: sortPreference,
-                                    nsfw_folder: this.nsfwFolder
+                                    nsfw_folder: this.nsfwFolder,
+                                    ...this.sessionParams()
                                 });
     
                                 const nextResponse = await api.fetchApi(nextUrl);
-                                if (nextResponse.ok) {
-                                    const nextData = await nextResponse.json();
-                                    if (nextData && nextData.loras) {
-                                        // nsfw check 2
-                                        if (this.nsfwFolder) {
-                                            nextData.loras = nextData.loras.map(lora => {
-                                                if (lora.subdir && lora.subdir.toLowerCase().includes('nsfw')) {
-                                                    return {
-                                                        ...lora,
-                                                        nsfw: true,
-                                                        nsfwLevel: 100
-                                                    };
-                                                }
-                                                return lora;
-                                            });
-                                        }
+                                this.updateSession(nextResponse);
+                                if (nextResponse.status === 409) {
+                                    // Our snapshot of the list was dropped, load it again from the start
+                                    debug.log("LoRA list cursor expired, reloading");
+                                    const restartLimit = restarts < this.maxCursorRestarts ? limit : (data.totalCount || limit);
+                                    return this.loadLoraData(0, restartLimit, restarts + 1);
+                                }
+                                if (!nextResponse.ok) {
+                                    throw new Error(`HTTP error! status: ${nextResponse.status}`);
+                                }
+                                const nextData = await nextResponse.json();
+                                if (nextData && nextData.loras) {
+                                    // nsfw check 2
+                                    if (this.nsfwFolder) {
+                                        nextData.loras = nextData.loras.map(lora => {
+                                            if (lora.subdir && lora.subdir.toLowerCase().includes('nsfw')) {
+                                                return {
+                                                    ...lora,
+                                                    nsfw: true,
+                                                    nsfwLevel: 100
+                                                };
+                                            }
+                                            return lora;
+                                        });
+                                    }
 
-                                        // Carefully append new data
-                                        this.loraData = [...this.loraData, ...nextData.loras];
-                                        
-                                        // Update filtered data only if we're not currently searching
-                                        if (!this.currentSearchInput.length) {
-                                            this.filteredData = this.loraData;
-                                        }
-                                        
-                                        if (nextData.categoryInfo) {
-                                            this.categoryInfo = {
-                                                ...this.categoryInfo,
-                                                ...nextData.categoryInfo
-                                            };
-                                            debug.log("Updated category info:", this.categoryInfo);
-                                        }
-                                        
-                                        currentOffset += limit;
-                                        hasMore = nextData.hasMore;
+                                    // Carefully append new data
+                                    this.loraData = [...this.loraData, ...nextData.loras];
+                                    
+                                    // Update filtered data only if we're not currently searching
+                                    if (!this.currentSearchInput.length) {
+                                        this.filteredData = this.loraData;
+                                    }
+                                    
+                                    if (nextData.categoryInfo) {
+                                        this.categoryInfo = {
+                                            ...this.categoryInfo,
+                                            ...nextData.categoryInfo
+                                        };
+                                        debug.log("Updated category info:", this.categoryInfo);
                                     }
+                                    
+                                    nextCursor = nextData.nextCursor;
+                                    hasMore = nextData.hasMore && Boolean(nextCursor);
                                 }
                             }
                         }
                     } else {
-                        // Handle subsequent batch loads (scrolling)
+                        // Handle subsequent batch loads (scrolling), continuing the initial load's cursor
+                        this.nextCursor = data.hasMore ? data.nextCursor : null;
                         this.loraData = [...this.loraData, ...data.loras];
                         
                         // Only update filtered data if not searching
@@ -1289,97 +1368,90 @@ class LoraSidebar {
         this.isLoading = true;
     
         try {
-            const response = await api.fetchApi(
-                `/lora_sidebar/category/${encodeURIComponent(categoryName)}`
+            const category = this.galleryContainer.querySelector(
+                `.lora-category[data-category="${categoryName}"]`
             );
+            const container = category?.querySelector('.lora-items-container');
+            if (!container || container.dataset.categoryDone === 'true') {
+                return;
+            }
+            // If this is from minimize and we're already at 250, skip loading more
+            if (isFromMinimize && container.children.length >= 250) { //TODO - can't assume this is enough for everyone
+                return;
+            }
+
+            // Page through the category with the cursor from the previous batch
+            let response;
+            for (let restarts = 0; ; restarts++) {
+                const params = new URLSearchParams({
+                    limit: this.batchSize,
+                    cursor: container.dataset.categoryCursor || '',
+                    ...this.sessionParams()
+                });
+                response = await api.fetchApi(
+                    `/lora_sidebar/category/${encodeURIComponent(categoryName)}?${params}`
+                );
+                this.updateSession(response);
+                if (response.status !== 409 || restarts >= this.maxCursorRestarts) {
+                    break;
+                }
+                // The backend resorted since our last page, start the category over
+                debug.log(`Category ${categoryName} cursor expired, starting over`);
+                delete container.dataset.categoryCursor;
+            }
             
             if (response.ok) {
                 const data = await response.json();
+                if (data.nextCursor) {
+                    container.dataset.categoryCursor = data.nextCursor;
+                } else {
+                    container.dataset.categoryDone = 'true';
+                }
+
                 if (data.category_ids?.length) {
 
                     debug.log("Loading category", categoryName, ":", {
-                        totalIds: data.category_ids.length,
+                        pageIds: data.category_ids.length,
+                        total: data.total,
                         firstId: data.category_ids[0],
                         loadedCount
                     });
 
-                    const category = this.galleryContainer.querySelector(
-                        `.lora-category[data-category="${categoryName}"]`
+                    // Skip the ids of this page that are already shown
+                    const existingIds = new Set(
+                        Array.from(container.children).map(child => child.dataset.loraId).filter(Boolean)
                     );
-                    if (category) {
-                        const container = category.querySelector('.lora-items-container');
-                        if (container) {
-                            // If this is from minimize and we're already at 250, skip loading more
-                            if (isFromMinimize && container.children.length >= 250) { //TODO - can't assume this is enough for everyone
-                                return;
-                            }
-
-                            // Get currently loaded ids from container
-                            const existingIds = Array.from(container.children)
-                            .map(child => {
-                                const img = child.querySelector('img');
-                                if (!img) return null;
-                                const src = img.src;
-                                const encodedFilename = src.split('/').pop();
-                                const filename = decodeURIComponent(encodedFilename);
-                        
-                                // Only compare against the IDs in this category
-                                return data.category_ids.find(id => 
-                                    filename === id || 
-                                    encodedFilename === id
-                                );
-                            })
-                            .filter(Boolean);
-
-                            debug.log("Category IDs:", data.category_ids);
-                            debug.log("Found existing IDs:", existingIds);
-
-                            // Filter out already loaded ids from the full set
-                            const validIds = data.category_ids.filter(id => 
-                                !existingIds.includes(id)
-                                // && this.filteredData.some(lora => lora.id === id) - can remove?
-                            );
+                    const validIds = data.category_ids.filter(id => !existingIds.has(id));
+                    debug.log("Page IDs:", data.category_ids);
+
+                    // Items the sidebar hasn't received yet come with the page
+                    if (data.items?.length) {
+                        const knownIds = new Set(this.loraData.map(lora => lora.id));
+                        const newItems = data.items.filter(lora => !knownIds.has(lora.id));
+                        this.loraData.push(...newItems);
+                        if (!this.currentSearchInput.length) {
+                            this.filteredData = this.loraData;
+                        }
+                    }
 
-                            /*
-                             // respect search
-                            const ids = this.currentSearchInput.length > 0
-                            ? data.category_ids.filter(id => 
-                                this.filteredData.some(lora => lora.id === id))
-                            : data.category_ids; */
-
-                            // Special case: If all ids are "valid" but we know we have one loaded,
-                            // we need to slice off the first one to avoid duplication
-                            // If the first ID from category_ids is in our valid list, remove it
-                            if (validIds.includes(data.category_ids[0])) {
-                                const firstIdIndex = validIds.indexOf(data.category_ids[0]);
-                                validIds.splice(firstIdIndex, 1);
-                            }
-                            
-                            // const remainingIds = (validIds.length === data.category_ids.length && loadedCount === 1) 
-                            //? validIds.slice(loadedCount) 
-                            //: validIds;
-                            const remainingIds = validIds
-                            debug.log("Category:", category, "Remaining IDs:", remainingIds);
+                    // If from minimize, limit how many we load
+                    const idsToLoad = isFromMinimize 
+                    ? validIds.slice(0, 250 - container.children.length)
+                    : validIds;
 
-                            // If from minimize, limit how many we load
-                            const idsToLoad = isFromMinimize 
-                            ? remainingIds.slice(0, 250 - container.children.length)
-                            : remainingIds;
+                    const lorasById = new Map(this.filteredData.map(lora => [lora.id, lora]));
+                    const remainingLoras = idsToLoad
+                        .map(id => lorasById.get(id))
+                        .filter(Boolean)
+                        .filter(lora => this.showNSFW || !this.isNSFW(lora));
 
-                            const remainingLoras = idsToLoad
-                                .map(id => this.filteredData.find(lora => lora.id === id))
-                                .filter(Boolean)
-                                .filter(lora => this.showNSFW || !this.isNSFW(lora));
-    
-                            this.createLoraElementsForCategory(container, remainingLoras);
+                    this.createLoraElementsForCategory(container, remainingLoras);
 
-                            // Update count
-                            const countDisplay = category.querySelector('.category-count');
-                            if (countDisplay) {
-                                const total = countDisplay.textContent.split('/')[1]; // Get the current 'total' part
-                                countDisplay.textContent = `${container.children.length}/${total}`;
-                            }
-                        }
+                    // Update count
+                    const countDisplay = category.querySelector('.category-count');
+                    if (countDisplay) {
+                        const total = countDisplay.textContent.split('/')[1]; // Get the current 'total' part
+                        countDisplay.textContent = `${container.children.length}/${total}`;
                     }
                 }
             }
@@ -1488,7 +1560,11 @@ class LoraSidebar {
                     if (nextBatch.length) {
                         this.createLoraElementsForCategory(this.galleryContainer, nextBatch);
                     }
+                } else if (currentItemCount < this.loraData.length) {
+                    // Already fetched, just render the next batch
+                    this.renderLoraGallery(currentItemCount, Math.min(100, this.batchSize));
                 } else {
+                    // Continue the pinned list from its cursor, an offset into the live list could skip or repeat LoRAs
                     this.loadLoraData(currentItemCount, Math.min(100, this.batchSize));
                 }
                 this.isLoading = false;
@@ -1889,9 +1965,12 @@ class LoraSidebar {
     createLoraElement(lora, forceRefresh = false) {
         try {
                 const container = $el("div.lora-item");
+                container.dataset.loraId = lora.id;
+                // Tiles use a thumbnail sized for the display, the full preview is only loaded in the info popup
+                const thumbSize = Math.round(this.savedElementSize * (window.devicePixelRatio || 1));
                 const previewUrl = forceRefresh
-                ? `/lora_sidebar/preview/${encodeURIComponent(lora.id)}?cb=${Date.now()}`
-                : `/lora_sidebar/preview/${encodeURIComponent(lora.id)}`;
+                ? `/lora_sidebar/thumb/${encodeURIComponent(lora.id)}?size=${thumbSize}&cb=${Date.now()}`
+                : `/lora_sidebar/thumb/${encodeURIComponent(lora.id)}?size=${thumbSize}`;
                 
                 let isVideo = false;
                 let previewElement;
@@ -4739,6 +4818,11 @@ class LoraSidebar {
             });
 
             if (response.ok) {
+                const result = await response.json();
+                if (result.categoryInfo) {
+                    this.categoryInfo = result.categoryInfo;
+                }
+
                 // Remove lora from data arrays
                 this.loraData = this.loraData.filter(l => l.id !== lora.id);
                 this.filteredData = this.filteredData.filter(l => l.id !== lora.id);